@@ -0,0 +1,87 @@
+"""
+Memory used by model instances with and without Config.intern_strings and peak memory used by json() compared to
+json_stream(), run with "make benchmark-memory".
+
+Data is decoded from JSON so, as in a real application, every instance starts with its own copy of each string.
+"""
+import json
+import os
+import random
+import tracemalloc
+from typing import List
+
+from pydantic import BaseModel
+
+COUNTRIES = ['United Kingdom', 'France', 'Germany', 'United States', 'Canada', 'Japan', 'Australia', 'Brazil']
+CURRENCIES = ['GBP', 'EUR', 'USD', 'CAD', 'JPY', 'AUD', 'BRL']
+STATUSES = ['pending', 'processing', 'shipped', 'delivered', 'cancelled']
+CATEGORIES = ['books', 'electronics', 'clothing', 'garden & outdoors', 'toys and games']
+COUNT = 100_000
+
+
+def make_model(intern):
+    class Order(BaseModel):
+        id: int
+        country: str
+        currency: str
+        status: str
+        category: str
+
+        class Config:
+            intern_strings = intern
+
+    return Order
+
+
+def bytes_per_instance(intern, data):
+    model = make_model(intern)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [model(**json.loads(d)) for d in data]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert len(instances) == COUNT
+    return (after - before) / COUNT
+
+
+def peak_json_memory(stream, orders):
+    class Export(BaseModel):
+        orders: List[make_model(False)]
+
+    export = Export.construct({'orders': orders}, {'orders'})
+    with open(os.devnull, 'w') as f:
+        tracemalloc.start()
+        if stream:
+            export.json_stream(f)
+        else:
+            f.write(export.json())
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return peak / 2 ** 20
+
+
+def main():
+    random.seed(42)
+    data = [
+        json.dumps(
+            {
+                'id': i,
+                'country': random.choice(COUNTRIES),
+                'currency': random.choice(CURRENCIES),
+                'status': random.choice(STATUSES),
+                'category': random.choice(CATEGORIES),
+            }
+        )
+        for i in range(COUNT)
+    ]
+    for intern in (False, True):
+        print(f'intern_strings={intern!s:<5}: {bytes_per_instance(intern, data):6.0f} bytes per instance')
+
+    orders = [make_model(False)(**json.loads(d)) for d in data]
+    for stream in (False, True):
+        method = 'json_stream()' if stream else 'json()'
+        print(f'{method:>13} of {COUNT} orders: {peak_json_memory(stream, orders):6.1f}MB peak')
+
+
+if __name__ == '__main__':
+    main()
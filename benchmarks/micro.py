@@ -0,0 +1,114 @@
+"""
+Micro benchmarks of individual validators, run with "make benchmark-validators" or
+"python benchmarks/micro.py [name ...]" to run a subset.
+
+Each validator is called with valid input, since that's the hot path which matters.
+"""
+import sys
+import timeit
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum, IntEnum
+from uuid import UUID
+
+from pydantic import BaseConfig, BaseModel
+from pydantic.datetime_parse import parse_date, parse_datetime, parse_duration, parse_time
+from pydantic.fields import Field
+from pydantic.json import pydantic_encoder
+from pydantic.types import IPvAnyAddress, IPvAnyInterface, IPvAnyNetwork, conbytes, condecimal, confloat, conint, constr
+from pydantic.validators import (
+    decimal_validator,
+    dict_validator,
+    enum_validator,
+    float_validator,
+    int_validator,
+    ip_v4_address_validator,
+    ip_v4_network_validator,
+    ip_v6_address_validator,
+    ip_v6_network_validator,
+    path_validator,
+    uuid_validator,
+)
+
+
+class Colour(Enum):
+    red = 'red'
+    blue = 'blue'
+
+
+Large = Enum('Large', [(f'member_{i}', f'value_{i}') for i in range(500)])
+LargeInt = IntEnum('LargeInt', [(f'member_{i}', i) for i in range(500)])
+
+enum_field = Field(name='colour', type_=Colour, class_validators=None, model_config=BaseConfig)
+enum_500_field = Field(name='large', type_=Large, class_validators=None, model_config=BaseConfig)
+int_enum_500_field = Field(name='large_int', type_=LargeInt, class_validators=None, model_config=BaseConfig)
+uuid_field = Field(name='uuid', type_=UUID, class_validators=None, model_config=BaseConfig)
+conint_field = Field(name='conint', type_=conint(gt=0, lt=100), class_validators=None, model_config=BaseConfig)
+confloat_field = Field(
+    name='confloat', type_=confloat(ge=0, multiple_of=0.5), class_validators=None, model_config=BaseConfig
+)
+condecimal_field = Field(name='condecimal', type_=condecimal(gt=0), class_validators=None, model_config=BaseConfig)
+constr_field = Field(
+    name='constr', type_=constr(min_length=1, max_length=10), class_validators=None, model_config=BaseConfig
+)
+conbytes_field = Field(name='conbytes', type_=conbytes(max_length=10), class_validators=None, model_config=BaseConfig)
+
+
+class ConstrainedModel(BaseModel):
+    id: conint(gt=0)
+    quantity: conint(ge=0, le=1000)
+    price: confloat(gt=0)
+    discount: confloat(ge=0, lt=1)
+    code: constr(min_length=3, max_length=3)
+    name: constr(max_length=50)
+
+
+constrained_data = {'id': 1, 'quantity': 10, 'price': 9.99, 'discount': 0.1, 'code': 'ABC', 'name': 'widget'}
+constrained_model = ConstrainedModel(**constrained_data)
+now = datetime(2032, 1, 1, 12)
+
+BENCHMARKS = {
+    'int': lambda: int_validator('123'),
+    'float': lambda: float_validator('1.5'),
+    'decimal': lambda: decimal_validator('1.5'),
+    'dict': lambda: dict_validator([('a', 1)]),
+    'enum': lambda: enum_validator('blue', enum_field, BaseConfig),
+    'enum_500': lambda: enum_validator('value_499', enum_500_field, BaseConfig),
+    'int_enum_500': lambda: int_enum_500_field.validate('499', {}, loc='large_int'),
+    'conint': lambda: conint_field.validate(42, {}, loc='conint'),
+    'confloat': lambda: confloat_field.validate(1.5, {}, loc='confloat'),
+    'condecimal': lambda: condecimal_field.validate(Decimal('1.5'), {}, loc='condecimal'),
+    'constr': lambda: constr_field.validate('hello', {}, loc='constr'),
+    'conbytes': lambda: conbytes_field.validate(b'hello', {}, loc='conbytes'),
+    'constrained_model': lambda: ConstrainedModel(**constrained_data),
+    'model_dict': lambda: constrained_model.dict(),
+    'model_dict_by_alias': lambda: constrained_model.dict(by_alias=True),
+    'encode_datetime': lambda: pydantic_encoder(now),
+    'encode_decimal': lambda: pydantic_encoder(Decimal('1.5')),
+    'uuid': lambda: uuid_validator('ebcdab58-6eb8-46fb-a190-d07a33e9eac8', uuid_field),
+    'ip_v4_address': lambda: ip_v4_address_validator('192.168.0.1'),
+    'ip_v6_address': lambda: ip_v6_address_validator('::1'),
+    'ip_v4_network': lambda: ip_v4_network_validator('192.168.0.0/24'),
+    'ip_v6_network': lambda: ip_v6_network_validator('2001:db00::0/120'),
+    'ip_any_address': lambda: IPvAnyAddress.validate('::1'),
+    'ip_any_interface': lambda: IPvAnyInterface.validate('::1/128'),
+    'ip_any_network': lambda: IPvAnyNetwork.validate('2001:db00::0/120'),
+    'path': lambda: path_validator('/foo/bar'),
+    'parse_date': lambda: parse_date('2012-04-23'),
+    'parse_time': lambda: parse_time('09:15:00'),
+    'parse_datetime': lambda: parse_datetime('2012-04-23T09:15:00Z'),
+    'parse_duration': lambda: parse_duration('15:30'),
+}
+
+
+def run(names):
+    for name in names:
+        func = BENCHMARKS[name]
+        timer = timeit.Timer(func)
+        number, _ = timer.autorange()
+        best = min(timer.repeat(repeat=5, number=number)) / number
+        print(f'{name:>20}: {best * 1e9:8.0f}ns')
+
+
+if __name__ == '__main__':
+    run(sys.argv[1:] or BENCHMARKS)
@@ -15,6 +15,7 @@ from pathlib import Path
 from statistics import StatisticsError, mean
 from statistics import stdev as stdev_
 
+from pydantic import ValidationError
 from test_pydantic import TestPydantic
 
 # trafaret currently (2018-07-02) fails on python 3.7
@@ -127,6 +128,22 @@ def generate_case():
         ) for i in range(random.randrange(1, 5))]
     ))
 
+
+def typed_cases(model, cases):
+    """
+    Convert cases to values which are already the correct type (including instances of model's sub-models) by
+    validating them with model, invalid cases are dropped.
+    """
+    typed = []
+    for case in cases:
+        try:
+            m = model(**case)
+        except ValidationError:
+            continue
+        typed.append({k: getattr(m, k) for k in m.__fields_set__})
+    return typed
+
+
 THIS_DIR = Path(__file__).parent.resolve()
 
 
@@ -137,7 +154,7 @@ def stdev(d):
         return 0
 
 
-def main():
+def load_cases():
     json_path = THIS_DIR / 'cases.json'
     if not json_path.exists():
         print('generating test cases...')
@@ -147,9 +164,16 @@ def main():
     else:
         with json_path.open() as f:
             cases = json.load(f)
+    return cases
+
+
+def main():
+    cases = load_cases()
 
     tests = [TestPydantic]
-    if 'pydantic-only' not in sys.argv:
+    # only pydantic accepts model instances, so other packages are skipped with typed cases
+    typed = 'typed' in sys.argv
+    if not typed and 'pydantic-only' not in sys.argv:
         tests += other_tests
 
     repeats = int(os.getenv('BENCHMARK_REPEATS', '5'))
@@ -160,10 +184,11 @@ def main():
         p = test_class.package
         for i in range(repeats):
             count, pass_count = 0, 0
-            start = datetime.now()
             test = test_class(True)
+            run_cases = typed_cases(test.model, cases) if typed else cases
+            start = datetime.now()
             for i in range(3):
-                for case in cases:
+                for case in run_cases:
                     passed, result = test.validate(case)
                     count += 1
                     pass_count += passed
@@ -172,7 +197,7 @@ def main():
             print(f'{p:>40} time={time:0.3f}s, success={success:0.2f}%')
             times.append(time)
         print(f'{p:>40} best={min(times):0.3f}s, avg={mean(times):0.3f}s, stdev={stdev(times):0.3f}s')
-        model_count = repeats * 3 * len(cases)
+        model_count = repeats * 3 * len(run_cases)
         avg = mean(times) / model_count * 1e6
         sd = stdev(times) / model_count * 1e6
         results.append(f'{p:>40} best={min(times) / model_count * 1e6:0.3f}μs/iter '
@@ -200,9 +225,7 @@ def main():
 
 
 def diff():
-    json_path = THIS_DIR / 'cases.json'
-    with json_path.open() as f:
-        cases = json.load(f)
+    cases = load_cases()
 
     allow_extra = True
     pydantic = TestPydantic(allow_extra)
@@ -219,8 +242,29 @@ def diff():
     print('✓ data passes match for all packages')
 
 
+def batch():
+    """
+    Measure throughput of validating the cases as one batch with parse_many, cases are passed as a generator.
+    """
+    cases = load_cases()
+    repeats = int(os.getenv('BENCHMARK_REPEATS', '5'))
+    rates = []
+    for i in range(repeats):
+        model = TestPydantic(True).model
+        start = datetime.now()
+        models, errors = model.parse_many(case for _ in range(3) for case in cases)
+        time = (datetime.now() - start).total_seconds()
+        count = len(models) + len(errors)
+        success = len(models) / count * 100
+        rates.append(count / time)
+        print(f'{"pydantic batch":>40} time={time:0.3f}s, success={success:0.2f}%, {count / time:0.0f} rows/s')
+    print(f'{"pydantic batch":>40} best={max(rates):0.0f} rows/s, avg={mean(rates):0.0f} rows/s')
+
+
 if __name__ == '__main__':
     if 'diff' in sys.argv:
         diff()
+    elif 'batch' in sys.argv:
+        batch()
     else:
         main()
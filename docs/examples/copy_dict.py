@@ -20,6 +20,9 @@ print(m.dict(include={'foo', 'bar'}))
 print(m.dict(exclude={'foo', 'bar'}))
 # > {'banana': 3.14}
 
+print(m.dict(exclude={'foo': ..., 'bar': {'whatever'}}))
+# > {'banana': 3.14, 'bar': {}}
+
 print(m.copy())
 # > FooBarModel banana=3.14 foo='hello' bar=<BarModel whatever=123>
 
@@ -0,0 +1,45 @@
+from typing import Union
+from pydantic import BaseModel, Schema, ValidationError
+
+class Cat(BaseModel):
+    pet_type: str = Schema('cat', const=True)
+    name: str
+
+class Dog(BaseModel):
+    pet_type: str = Schema('dog', const=True)
+    barks: float
+
+class Owner(BaseModel):
+    pet: Union[Cat, Dog]
+
+    class Config:
+        union_discriminator = 'pet_type'
+
+print(Owner(pet={'pet_type': 'dog', 'barks': 3.14}))
+# > Owner pet=<Dog barks=3.14 pet_type='dog'>
+
+try:
+    Owner(pet={'pet_type': 'dog'})
+except ValidationError as e:
+    print(e)
+"""
+1 validation error
+pet -> barks
+  field required (type=value_error.missing)
+"""
+
+try:
+    Owner(pet={'pet_type': 'fish'})
+except ValidationError as e:
+    print(e)
+"""
+4 validation errors
+pet -> name
+  field required (type=value_error.missing)
+pet -> pet_type
+  expected constant value 'cat' (type=value_error.const; given=fish; const=cat)
+pet -> barks
+  field required (type=value_error.missing)
+pet -> pet_type
+  expected constant value 'dog' (type=value_error.const; given=fish; const=dog)
+"""
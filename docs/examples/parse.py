@@ -26,3 +26,15 @@ pickle_data = pickle.dumps({'id': 123, 'name': 'James', 'signup_ts': datetime(20
 m = User.parse_raw(pickle_data, content_type='application/pickle', allow_pickle=True)
 print(m)
 # > User id=123 name='James' signup_ts=datetime.datetime(2017, 7, 14, 0, 0)
+
+models, errors = User.parse_many([{'id': 1}, {'id': 'x'}, {'id': 3, 'name': 'Anna'}])
+print(models)
+# > [<User id=1 name='John Doe' signup_ts=None>, <User id=3 name='Anna' signup_ts=None>]
+print(errors)
+# > [(1, ValidationError(...))]
+
+columns, error_mask, errors = User.validate_columns({'id': [1, 'x', 3], 'name': ['James', 'Anna', 'Sam']})
+print(columns['id'])
+# > [1, 'x', 3]
+print([index for index, _ in errors])
+# > [1]
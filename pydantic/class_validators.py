@@ -1,10 +1,16 @@
 from collections import ChainMap
 from dataclasses import dataclass
-from functools import wraps
-from inspect import Signature, signature
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from functools import lru_cache, wraps
+from inspect import signature
+from ipaddress import IPv4Address, IPv4Interface, IPv4Network, IPv6Address, IPv6Interface, IPv6Network
 from itertools import chain
+from pathlib import Path, PosixPath, PurePath, PurePosixPath, PureWindowsPath, WindowsPath
 from types import FunctionType
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Type
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Type, cast
+from uuid import UUID
 
 from .errors import ConfigError
 from .utils import AnyCallable, in_ipython
@@ -15,6 +21,7 @@ if TYPE_CHECKING:  # pragma: no cover
     from .types import ModelOrDc
 
     ValidatorCallable = Callable[[Optional[ModelOrDc], Any, Dict[str, Any], Field, Type[BaseConfig]], Any]
+    ValidatorCache = Callable[[Optional[ModelOrDc], Any], Tuple[Any, Optional[Exception]]]
 
 
 @dataclass
@@ -129,6 +136,114 @@ def make_generic_validator(validator: AnyCallable) -> 'ValidatorCallable':
     It's done like this so validators don't all need **kwargs in their signature, eg. any combination of
     the arguments "values", "fields" and/or "config" are permitted.
     """
+    takes_cls, args = _validator_call_args(validator)
+    if takes_cls:
+        return wraps(validator)(_generic_validator_cls(validator, set(args)))
+    else:
+        return wraps(validator)(_generic_validator_basic(validator, set(args)))
+
+
+def make_validator_chain(validators: Sequence[AnyCallable]) -> Optional['ValidatorCallable']:
+    """
+    Fuse validators into one function with the generic signature which calls each validator in turn with only
+    the arguments it declares, this avoids the cost of calling a generic wrapper (and catching errors) for every
+    validator in the chain.
+    """
+    if not validators:
+        return None
+    return _chain_factory(tuple(_validator_call_args(v) for v in validators))(*validators)
+
+
+# types whose instances can't be changed so can be shared between models: validation results cached by
+# make_validator_cache() and field defaults which default_copier() doesn't copy, see is_immutable()
+IMMUTABLE_TYPES = {
+    str,
+    bytes,
+    int,
+    float,
+    bool,
+    complex,
+    type(None),
+    Decimal,
+    date,
+    datetime,
+    time,
+    timedelta,
+    UUID,
+    IPv4Address,
+    IPv4Interface,
+    IPv4Network,
+    IPv6Address,
+    IPv6Interface,
+    IPv6Network,
+    Path,
+    PosixPath,
+    PurePath,
+    PurePosixPath,
+    PureWindowsPath,
+    WindowsPath,
+}
+
+
+def is_immutable(v: Any) -> bool:
+    """
+    Whether a value can't be changed: an instance of IMMUTABLE_TYPES, an enum member, path, class or function (also
+    of subclasses of those types) or a tuple or frozenset of such values.
+    """
+    type_ = type(v)
+    if type_ in IMMUTABLE_TYPES or isinstance(v, (Enum, PurePath, type, FunctionType)):
+        return True
+    elif type_ in (tuple, frozenset):
+        return all(is_immutable(v_) for v_ in v)
+    return False
+
+
+def make_validator_cache(validator_chain: 'ValidatorCallable', field: 'Field', maxsize: int) -> 'ValidatorCache':
+    """
+    Wrap a validator chain in an LRU cache keyed by model class and value, returning ``(value, None)`` or
+    ``(None, exception)`` so failures are cached too. The chain must not use "values" since it's always called
+    with an empty dict, only immutable results (see is_immutable()) are cached since other results might be changed by
+    one model and seen by another.
+
+    The result has the ``cache_info()`` and ``cache_clear()`` methods of ``functools.lru_cache``.
+    """
+    config = field.model_config
+
+    @lru_cache(maxsize=maxsize, typed=True)
+    def validator_cache(cls: Any, v: Any) -> Tuple[Any, Optional[Exception]]:
+        try:
+            result = validator_chain(cls, v, {}, field, config)
+        except (ValueError, TypeError) as exc:
+            # the traceback would keep every frame of the failed call alive for as long as it's cached
+            return None, exc.with_traceback(None)
+        if not is_immutable(result):
+            raise UncachedResult(result)
+        return result, None
+
+    return cast('ValidatorCache', validator_cache)
+
+
+class UncachedResult(Exception):
+    """
+    Raised by validator caches to return a result without caching it.
+    """
+
+    def __init__(self, result: Any) -> None:
+        self.result = result
+
+
+def validator_uses_values(validator: AnyCallable) -> bool:
+    return 'values' in _validator_call_args(validator)[1]
+
+
+all_kwargs = {'values', 'field', 'config'}
+
+
+def _validator_call_args(validator: AnyCallable) -> Tuple[bool, Tuple[str, ...]]:
+    """
+    Check the signature of a validator, return whether its first argument is "cls" and which of the
+    arguments "values", "field" and "config" it should be called with.
+    """
     sig = signature(validator)
     args = list(sig.parameters.keys())
     first_arg = args.pop(0)
@@ -139,31 +254,53 @@ def make_generic_validator(validator: AnyCallable) -> 'ValidatorCallable':
         )
     elif first_arg == 'cls':
         # assume the second argument is value
-        return wraps(validator)(_generic_validator_cls(validator, sig, set(args[1:])))
+        takes_cls, expected = True, '(cls, value, values, config, field)'
+        kwargs = set(args[1:])
     else:
         # assume the first argument was value which has already been removed
-        return wraps(validator)(_generic_validator_basic(validator, sig, set(args)))
-
+        takes_cls, expected = False, '(value, values, config, field)'
+        kwargs = set(args)
 
-all_kwargs = {'values', 'field', 'config'}
-
-
-def _generic_validator_cls(validator: AnyCallable, sig: Signature, args: Set[str]) -> 'ValidatorCallable':
-    # assume the first argument is value
     has_kwargs = False
-    if 'kwargs' in args:
+    if 'kwargs' in kwargs:
         has_kwargs = True
-        args -= {'kwargs'}
+        kwargs -= {'kwargs'}
 
-    if not args.issubset(all_kwargs):
+    if not kwargs.issubset(all_kwargs):
         raise ConfigError(
             f'Invalid signature for validator {validator}: {sig}, should be: '
-            f'(cls, value, values, config, field), "values", "config" and "field" are all optional.'
+            f'{expected}, "values", "config" and "field" are all optional.'
         )
+    return takes_cls, tuple(sorted(all_kwargs if has_kwargs else kwargs))
 
-    if has_kwargs:
-        return lambda cls, v, values, field, config: validator(cls, v, values=values, field=field, config=config)
-    elif args == set():
+
+@lru_cache(maxsize=None)
+def _chain_factory(call_args: Tuple[Tuple[bool, Tuple[str, ...]], ...]) -> Callable[..., 'ValidatorCallable']:
+    """
+    Generate a function which builds validator chains for validators with the given signatures, the source is
+    only compiled once for each combination of signatures.
+    """
+    calls = []
+    for i, (takes_cls, args) in enumerate(call_args):
+        call_params = ['cls', 'v'] if takes_cls else ['v']
+        call_params += [f'{a}={a}' for a in args]
+        calls.append(f'        v = validator_{i}({", ".join(call_params)})\n')
+    validator_names = ', '.join(f'validator_{i}' for i in range(len(call_args)))
+    src = (
+        f'def chain_factory({validator_names}):\n'
+        f'    def validator_chain(cls, v, values, field, config):\n'
+        f'{"".join(calls)}'
+        f'        return v\n'
+        f'    return validator_chain\n'
+    )
+    namespace: Dict[str, Any] = {}
+    exec(src, namespace)
+    return namespace['chain_factory']
+
+
+def _generic_validator_cls(validator: AnyCallable, args: Set[str]) -> 'ValidatorCallable':
+    # assume the first argument is value
+    if args == set():
         return lambda cls, v, values, field, config: validator(cls, v)
     elif args == {'values'}:
         return lambda cls, v, values, field, config: validator(cls, v, values=values)
@@ -182,21 +319,8 @@ def _generic_validator_cls(validator: AnyCallable, sig: Signature, args: Set[str
         return lambda cls, v, values, field, config: validator(cls, v, values=values, field=field, config=config)
 
 
-def _generic_validator_basic(validator: AnyCallable, sig: Signature, args: Set[str]) -> 'ValidatorCallable':
-    has_kwargs = False
-    if 'kwargs' in args:
-        has_kwargs = True
-        args -= {'kwargs'}
-
-    if not args.issubset(all_kwargs):
-        raise ConfigError(
-            f'Invalid signature for validator {validator}: {sig}, should be: '
-            f'(value, values, config, field), "values", "config" and "field" are all optional.'
-        )
-
-    if has_kwargs:
-        return lambda cls, v, values, field, config: validator(v, values=values, field=field, config=config)
-    elif args == set():
+def _generic_validator_basic(validator: AnyCallable, args: Set[str]) -> 'ValidatorCallable':
+    if args == set():
         return lambda cls, v, values, field, config: validator(v)
     elif args == {'values'}:
         return lambda cls, v, values, field, config: validator(v, values=values)
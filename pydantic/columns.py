@@ -0,0 +1,208 @@
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Sequence, Tuple, Type, cast
+
+from .datetime_parse import parse_date, parse_dates, parse_datetime, parse_datetimes, parse_duration, parse_durations
+from .error_wrappers import ErrorWrapper, ValidationError
+from .errors import ExtraError, MissingError
+from .fields import Field, Shape
+from .utils import AnyCallable, is_fail_fast
+from .validators import anystr_length_validator, float_validator, int_validator, not_none_validator, str_validator
+
+try:
+    import numpy
+except ImportError:
+    numpy = None  # type: ignore
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .main import BaseModel  # noqa: F401
+    from .validators import ConstrainedNumber
+
+    DictStrAny = Dict[str, Any]
+    RowErrors = Dict[int, List[Any]]
+    ColumnsResult = Tuple[DictStrAny, Any, List[Tuple[int, ValidationError]]]
+
+__all__ = ['validate_columns']
+
+# numpy dtype kinds which can be checked without conversion by the first (after not_none_validator) validator
+_VECTOR_KINDS = {int_validator: 'iu', float_validator: 'iuf', str_validator: 'U'}
+# validators with an equivalent which parses many values at once
+_BULK_PARSERS = {parse_date: parse_dates, parse_datetime: parse_datetimes, parse_duration: parse_durations}
+
+
+def validate_columns(model: Type['BaseModel'], columns: Mapping[str, Sequence[Any]]) -> 'ColumnsResult':
+    """
+    Validate data held as columns (eg. numpy arrays or lists, keyed by field alias) against ``model``.
+
+    Simple numeric and string fields held in numpy arrays are checked with array operations, datetime, date and
+    timedelta fields are parsed with ``parse_datetimes`` etc., everything else is validated value by value with
+    ``Field.validate``, models with validators which may depend on other fields are validated row by row.
+
+    :return: tuple of validated columns, a per-row error mask (a numpy bool array if numpy is installed, otherwise a
+      list) and a list of ``(index, ValidationError)`` for invalid rows; invalid rows keep their input values
+    """
+    lengths = {len(c) for c in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError(f'columns must all have the same length, got lengths {sorted(lengths)}')
+    row_count = lengths.pop() if lengths else 0
+
+    if any(f.class_validators or f.validate_always for f in model.__fields__.values()):
+        values, row_errors = _validate_rows(model, columns, row_count)
+    else:
+        values, row_errors = _validate_fields(model, columns, row_count)
+
+    fail_fast = is_fail_fast(model.__config__)
+    errors = [(i, ValidationError(row_errors[i][:1] if fail_fast else row_errors[i])) for i in sorted(row_errors)]
+    if numpy is None:
+        error_mask: Any = [False] * row_count
+        for i in row_errors:
+            error_mask[i] = True
+    else:
+        error_mask = numpy.zeros(row_count, dtype=bool)
+        error_mask[list(row_errors)] = True
+    return values, error_mask, errors
+
+
+def _validate_rows(
+    model: Type['BaseModel'], columns: Mapping[str, Sequence[Any]], row_count: int
+) -> Tuple['DictStrAny', 'RowErrors']:
+    model_validator = model.__validate_values__
+    names = list(columns)
+    values: 'DictStrAny' = {name: [] for name in model.__fields__}
+    row_errors: 'RowErrors' = {}
+    for i, row in enumerate(zip(*columns.values())):
+        input_data = dict(zip(names, row))
+        row_values, errors = model_validator(input_data, model, False)
+        if errors:
+            row_errors[i] = errors
+        for name, field in model.__fields__.items():
+            values[name].append(row_values.get(name, input_data.get(field.alias)))
+        for name in row_values.keys() - values.keys():
+            # extra columns with Extra.allow
+            values[name] = columns[name]
+    return values, row_errors
+
+
+def _validate_fields(
+    model: Type['BaseModel'], columns: Mapping[str, Sequence[Any]], row_count: int
+) -> Tuple['DictStrAny', 'RowErrors']:
+    from .main import Extra
+
+    config = model.__config__
+    values: 'DictStrAny' = {}
+    row_errors: 'RowErrors' = {}
+    names_used = set()
+    for name, field in model.__fields__.items():
+        alias = field.alias
+        column = columns.get(alias)
+        if column is None and config.allow_population_by_alias and field.alt_alias:
+            alias = field.name
+            column = columns.get(alias)
+
+        if column is not None:
+            names_used.add(alias)
+            values[name] = _validate_column(model, field, column, row_errors)
+        elif field.required:
+            for i in range(row_count):
+                row_errors.setdefault(i, []).append(ErrorWrapper(MissingError(), loc=field.alias, config=config))
+        else:
+            column = [field.get_default() for _ in range(row_count)]
+            if config.validate_all:
+                column = _validate_column(model, field, column, row_errors)
+            values[name] = column
+
+    extra = columns.keys() - names_used
+    if extra and config.extra is Extra.allow:
+        for name in extra:
+            values[name] = columns[name]
+    elif extra and config.extra is Extra.forbid:
+        for i in range(row_count):
+            row_errors.setdefault(i, []).extend(ErrorWrapper(ExtraError(), loc=f, config=config) for f in sorted(extra))
+    return values, row_errors
+
+
+def _validate_column(model: Type['BaseModel'], field: Field, column: Any, row_errors: 'RowErrors') -> Any:
+    v_funcs = _plain_validators(field)
+    failed: Any = None
+    if v_funcs and len(v_funcs) == 1 and v_funcs[0] in _BULK_PARSERS:
+        column, bulk_errors = _BULK_PARSERS[v_funcs[0]](column)
+        failed = [i for i, _ in bulk_errors]
+    elif v_funcs and _can_vectorise(field, column, v_funcs):
+        column, failed = _validate_vector(field, column, v_funcs)
+
+    if failed is not None:
+        # only values which failed are validated individually, to get the errors
+        for i in failed:
+            v = column[i]
+            if numpy is not None and isinstance(v, numpy.generic):
+                v = v.item()
+            v_, error = field.validate(v, {}, loc=field.alias, cls=model)
+            if error:
+                row_errors.setdefault(int(i), []).append(error)
+            else:
+                # eg. None for fields which allow it
+                column[i] = v_
+        return column
+
+    validate = field.validate
+    validated = []
+    for i, v in enumerate(column):
+        v_, error = validate(v, {}, loc=field.alias, cls=model)
+        if error:
+            row_errors.setdefault(i, []).append(error)
+            validated.append(v)
+        else:
+            validated.append(v_)
+    return validated
+
+
+def _plain_validators(field: Field) -> Optional[List[AnyCallable]]:
+    """
+    Return the functions which validate values of field, if it's a simple field without sub-fields.
+    """
+    if field.shape is not Shape.SINGLETON or field.sub_fields or field.parse_json or not field.validators:
+        return None
+    v_funcs = [getattr(v, '__wrapped__', None) for v in field.validators]
+    return [f for f in v_funcs if f is not not_none_validator]  # type: ignore
+
+
+def _can_vectorise(field: Field, column: Any, v_funcs: List[AnyCallable]) -> bool:
+    """
+    Whether column is a numpy array which all of field's validators can be applied to as a whole.
+    """
+    if numpy is None or not isinstance(column, numpy.ndarray) or column.ndim != 1:
+        return False
+    if v_funcs[0] not in _VECTOR_KINDS or column.dtype.kind not in _VECTOR_KINDS[v_funcs[0]]:
+        return False
+    # anystr_length_validator for plain strings or a constrained type's validator marked as "vectorisable"
+    return all(v is anystr_length_validator or getattr(v, 'vectorisable', False) for v in v_funcs[1:])
+
+
+def _validate_vector(field: Field, column: Any, vector_validators: List[AnyCallable]) -> Tuple[Any, Any]:
+    type_ = cast('ConstrainedNumber', field.type_)
+    if vector_validators[0] is float_validator:
+        column = column.astype(float, copy=False)
+    invalid = numpy.zeros(len(column), dtype=bool)
+    if len(vector_validators) == 1:
+        # just the type check, done by _can_vectorise
+        pass
+    elif vector_validators[0] is not str_validator:
+        if getattr(type_, 'gt', None) is not None:
+            invalid |= ~(column > type_.gt)
+        elif getattr(type_, 'ge', None) is not None:
+            invalid |= ~(column >= type_.ge)
+        if getattr(type_, 'lt', None) is not None:
+            invalid |= ~(column < type_.lt)
+        elif getattr(type_, 'le', None) is not None:
+            invalid |= ~(column <= type_.le)
+        if getattr(type_, 'multiple_of', None) is not None:
+            invalid |= column % type_.multiple_of != 0
+    else:
+        config = field.model_config
+        min_length = getattr(type_, 'min_length', config.min_anystr_length)
+        max_length = getattr(type_, 'max_length', config.max_anystr_length)
+        if min_length is not None or max_length is not None:
+            lengths = numpy.char.str_len(column)
+            if min_length is not None:
+                invalid |= lengths < min_length
+            if max_length is not None:
+                invalid |= lengths > max_length
+    return column, numpy.flatnonzero(invalid)
@@ -13,13 +13,15 @@ Changed to:
 * use standard python datetime types not django.utils.timezone
 * raise ValueError when regex doesn't match rather than returning None
 * support parsing unix timestamps for dates and datetimes
+* parse canonical ISO 8601 datetimes with datetime.fromisoformat where possible and reuse fixed offset timezones
+* parse sequences of values with parse_dates, parse_datetimes and parse_durations
 """
 import re
+import sys
 from datetime import date, datetime, time, timedelta, timezone
-from typing import Dict, Union, cast
+from typing import Any, Callable, Dict, Iterable, List, Optional, Pattern, Sequence, Tuple, Union, cast
 
 from . import errors
-from .utils import change_exception
 
 date_re = re.compile(r'(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})$')
 
@@ -62,11 +64,24 @@ EPOCH = datetime(1970, 1, 1)
 # (in seconds this is 11th October 2603, in ms it's 20th August 1970)
 MS_WATERSHED = int(2e10)
 StrIntFloat = Union[str, int, float]
+BulkResult = Tuple[List[Any], List[Tuple[int, Exception]]]
+
+# datetime.fromisoformat is only available from python 3.7, the C implementation rejects anything but ascii digits
+# in each field so it agrees with the regexes below
+_fromisoformat = getattr(datetime, 'fromisoformat', None) if sys.implementation.name == 'cpython' else None
+# keyed by the offset string as it appears in the input, there are few enough of those for this not to need bounding
+_timezones: Dict[str, timezone] = {'Z': timezone.utc}
 
 
 def get_numeric(value: StrIntFloat) -> Union[None, int, float]:
     if isinstance(value, (int, float)):
         return value
+    if isinstance(value, str):
+        # int() and float() never accept ':' or a '-' other than as a sign, so dates, times and datetimes can be
+        # rejected without raising two exceptions
+        dash = value.find('-', 1)
+        if ':' in value or (dash != -1 and value[dash - 1] not in 'eE' and not value[dash - 1].isspace()):
+            return None
     try:
         return int(value)
     except ValueError:
@@ -83,6 +98,61 @@ def from_unix_seconds(seconds: float) -> datetime:
     return dt.replace(tzinfo=timezone.utc)
 
 
+def get_timezone(tzinfo_str: str) -> timezone:
+    """
+    Return the timezone for an offset matched by ``datetime_re``, eg. ``Z``, ``+02``, ``-0530`` or ``+05:30``.
+
+    Instances are cached so datetimes with the same offset share their tzinfo.
+    """
+    tzinfo = _timezones.get(tzinfo_str)
+    if tzinfo is None:
+        offset_mins = int(tzinfo_str[-2:]) if len(tzinfo_str) > 3 else 0
+        offset = 60 * int(tzinfo_str[1:3]) + offset_mins
+        if tzinfo_str[0] == '-':
+            offset = -offset
+        tzinfo = _timezones.setdefault(tzinfo_str, timezone(timedelta(minutes=offset)))
+    return tzinfo
+
+
+def _parse_iso_datetime(value: str) -> Optional[datetime]:
+    """
+    Parse strings in the canonical ``YYYY-MM-DDTHH:MM:SS[.fff[fff]][Z|±HH:MM]`` format with ``datetime.fromisoformat``,
+    return None for anything else, including invalid dates, so ``parse_datetime`` falls back to the regex.
+    """
+    length = len(value)
+    if (
+        _fromisoformat is None
+        or length < 19
+        or value[4] != '-'
+        or value[7] != '-'
+        or value[10] not in 'T '
+        or value[13] != ':'
+        or value[16] != ':'
+        # newer versions of fromisoformat accept hour 24
+        or value[11:13] > '23'
+    ):
+        return None
+
+    naive_length = length
+    if value[-1] == 'Z':
+        naive_length -= 1
+        # fromisoformat accepts "Z" only from python 3.11
+        value = value[:-1] + '+00:00'
+    elif length >= 25 and value[-6] in '+-' and value[-3] == ':':
+        naive_length -= 6
+
+    # fromisoformat accepts only 3 or 6 fractional digits before python 3.11
+    if naive_length != 19 and (
+        naive_length not in (23, 26) or value[19] != '.' or not value[20:naive_length].isdigit()
+    ):
+        return None
+
+    try:
+        return _fromisoformat(value)
+    except ValueError:
+        return None
+
+
 def parse_date(value: Union[date, StrIntFloat]) -> date:
     """
     Parse a date/int/float/string and return a datetime.date.
@@ -106,8 +176,10 @@ def parse_date(value: Union[date, StrIntFloat]) -> date:
 
     kw = {k: int(v) for k, v in match.groupdict().items()}
 
-    with change_exception(errors.DateError, ValueError):
+    try:
         return date(**kw)
+    except ValueError as e:
+        raise errors.DateError() from e
 
 
 def parse_time(value: Union[time, str]) -> time:
@@ -132,8 +204,10 @@ def parse_time(value: Union[time, str]) -> time:
 
     kw_ = {k: int(v) for k, v in kw.items() if v is not None}
 
-    with change_exception(errors.TimeError, ValueError):
+    try:
         return time(**kw_)  # type: ignore
+    except ValueError as e:
+        raise errors.TimeError() from e
 
 
 def parse_datetime(value: Union[datetime, StrIntFloat]) -> datetime:
@@ -149,6 +223,11 @@ def parse_datetime(value: Union[datetime, StrIntFloat]) -> datetime:
     if isinstance(value, datetime):
         return value
 
+    if isinstance(value, str):
+        dt = _parse_iso_datetime(value)
+        if dt is not None:
+            return dt
+
     number = get_numeric(value)
     if number is not None:
         return from_unix_seconds(number)
@@ -162,22 +241,15 @@ def parse_datetime(value: Union[datetime, StrIntFloat]) -> datetime:
         kw['microsecond'] = kw['microsecond'].ljust(6, '0')
 
     tzinfo_str = kw.pop('tzinfo')
-    if tzinfo_str == 'Z':
-        tzinfo = timezone.utc
-    elif tzinfo_str is not None:
-        offset_mins = int(tzinfo_str[-2:]) if len(tzinfo_str) > 3 else 0
-        offset = 60 * int(tzinfo_str[1:3]) + offset_mins
-        if tzinfo_str[0] == '-':
-            offset = -offset
-        tzinfo = timezone(timedelta(minutes=offset))
-    else:
-        tzinfo = None
+    tzinfo = None if tzinfo_str is None else get_timezone(tzinfo_str)
 
     kw_: Dict[str, Union[int, timezone]] = {k: int(v) for k, v in kw.items() if v is not None}
     kw_['tzinfo'] = tzinfo
 
-    with change_exception(errors.DateTimeError, ValueError):
+    try:
         return datetime(**kw_)  # type: ignore
+    except ValueError as e:
+        raise errors.DateTimeError() from e
 
 
 def parse_duration(value: StrIntFloat) -> timedelta:
@@ -210,3 +282,117 @@ def parse_duration(value: StrIntFloat) -> timedelta:
     kw_ = {k: float(v) for k, v in kw.items() if v is not None}
 
     return sign * timedelta(**kw_)  # type: ignore
+
+
+# layouts which the bulk parsers below can handle without the regexes above, these must only match strings
+# which the single value parsers would parse to the same result
+_iso_date_layout = r'[0-9]{4}-[0-9]{2}-[0-9]{2}'
+_iso_datetime_layout = (
+    _iso_date_layout
+    + r'[T ](?:[01][0-9]|2[0-3]):[0-9]{2}:[0-9]{2}(?:\.[0-9]{3}(?:[0-9]{3})?)?(?:Z|[+-][0-9]{2}:[0-9]{2})?'
+)
+_duration_layout = r'[0-9]{2}:[0-9]{2}:[0-9]{2}(?:\.[0-9]{6})?'
+
+# values are checked in chunks joined by newlines, so one match checks a whole chunk
+BULK_SAMPLE_SIZE = 20
+BULK_CHUNK_SIZE = 1000
+
+
+def _layout_regexes(layout: str) -> Tuple[Pattern[str], Pattern[str]]:
+    return re.compile(layout), re.compile(f'(?:{layout}\n)*{layout}')
+
+
+_iso_date_res = _layout_regexes(_iso_date_layout)
+_iso_datetime_res = _layout_regexes(_iso_datetime_layout)
+_duration_res = _layout_regexes(_duration_layout)
+
+
+def _parse_bulk(
+    values: Iterable[Any],
+    parse: Callable[[Any], Any],
+    layout_res: Tuple[Pattern[str], Pattern[str]],
+    parse_chunk: Optional[Callable[[Sequence[str]], List[Any]]],
+) -> BulkResult:
+    values = values if isinstance(values, list) else list(values)
+    value_re, chunk_re = layout_res
+    if parse_chunk is not None and not all(
+        isinstance(v, str) and value_re.fullmatch(v) for v in values[:BULK_SAMPLE_SIZE]
+    ):
+        parse_chunk = None
+
+    parsed: List[Any] = []
+    errors_: List[Tuple[int, Exception]] = []
+    for start in range(0, len(values), BULK_CHUNK_SIZE):
+        end = start + BULK_CHUNK_SIZE
+        chunk = values[start:end]
+        if parse_chunk is not None:
+            try:
+                joined = '\n'.join(chunk)
+            except TypeError:
+                pass
+            else:
+                # the count rules out values which themselves contain newlines
+                if chunk_re.fullmatch(joined) and joined.count('\n') == len(chunk) - 1:
+                    try:
+                        parsed += parse_chunk(chunk)
+                        continue
+                    except ValueError:
+                        # eg. an invalid date, get the error from the single value parser
+                        pass
+
+        for i, v in enumerate(chunk, start):
+            try:
+                parsed.append(parse(v))
+            except (ValueError, TypeError) as e:
+                parsed.append(v)
+                errors_.append((i, e))
+    return parsed, errors_
+
+
+def _parse_datetime_chunk(chunk: Sequence[str]) -> List[datetime]:
+    fromisoformat = cast(Callable[[str], datetime], _fromisoformat)
+    if sys.version_info >= (3, 11):
+        return [fromisoformat(v) for v in chunk]
+    else:
+        return [fromisoformat(v[:-1] + '+00:00' if v[-1] == 'Z' else v) for v in chunk]
+
+
+def _parse_date_chunk(chunk: Sequence[str]) -> List[date]:
+    fromisoformat = date.fromisoformat
+    return [fromisoformat(v) for v in chunk]
+
+
+def _parse_duration_chunk(chunk: Sequence[str]) -> List[timedelta]:
+    return [
+        timedelta(0, int(v[0:2]) * 3600 + int(v[3:5]) * 60 + int(v[6:8]), int(v[9:]) if len(v) > 8 else 0)
+        for v in chunk
+    ]
+
+
+def parse_datetimes(values: Iterable[Union[datetime, StrIntFloat]]) -> BulkResult:
+    """
+    Parse many values with ``parse_datetime``.
+
+    If a sample of the values are all canonical ISO 8601 strings, eg. ``2032-04-23T10:20:30.400+02:30``, each
+    chunk of values in that format is checked at once and parsed with ``datetime.fromisoformat``, other values
+    are parsed one at a time.
+
+    :return: tuple of parsed values, with the input value for any which failed, and a list of
+      ``(index, exception)`` for values which failed
+    """
+    return _parse_bulk(values, parse_datetime, _iso_datetime_res, _fromisoformat and _parse_datetime_chunk)
+
+
+def parse_dates(values: Iterable[Union[date, StrIntFloat]]) -> BulkResult:
+    """
+    Parse many values with ``parse_date``, ``YYYY-MM-DD`` strings are parsed in chunks as with ``parse_datetimes``.
+    """
+    return _parse_bulk(values, parse_date, _iso_date_res, _fromisoformat and _parse_date_chunk)
+
+
+def parse_durations(values: Iterable[StrIntFloat]) -> BulkResult:
+    """
+    Parse many values with ``parse_duration``, ``HH:MM:SS[.ffffff]`` strings are parsed in chunks as with
+    ``parse_datetimes``.
+    """
+    return _parse_bulk(values, parse_duration, _duration_res, _parse_duration_chunk)
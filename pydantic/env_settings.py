@@ -1,8 +1,9 @@
-import json
 import os
-from typing import Any, Dict, Optional, cast
+from typing import Any, Callable, Dict, Optional, cast
 
+from .json_backend import json_loads
 from .main import BaseModel, Extra
+from .types import StrBytes
 
 
 class SettingsError(ValueError):
@@ -49,7 +50,7 @@ class BaseSettings(BaseModel):
             if env_val:
                 if field.is_complex():
                     try:
-                        env_val = json.loads(env_val)
+                        env_val = (self.__config__.json_loads or json_loads)(env_val)
                     except ValueError as e:
                         raise SettingsError(f'error parsing JSON for "{env_name}"') from e
                 d[field.alias] = env_val
@@ -61,5 +62,6 @@ class BaseSettings(BaseModel):
         extra = Extra.forbid
         arbitrary_types_allowed = True
         case_insensitive = False
+        json_loads: Optional[Callable[[StrBytes], Any]] = None
 
     __config__: Config  # type: ignore
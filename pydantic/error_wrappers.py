@@ -1,7 +1,8 @@
-import json
 from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Sequence, Tuple, Type, Union, cast
 
+from .json_backend import json_dumps
+
 if TYPE_CHECKING:  # pragma: no cover
     from pydantic import BaseConfig  # noqa: F401
 
@@ -62,7 +63,7 @@ class ValidationError(ValueError):
         return list(flatten_errors(self.raw_errors))
 
     def json(self, *, indent: Union[None, int, str] = 2) -> str:
-        return json.dumps(self.errors(), indent=indent)
+        return json_dumps(self.errors(), indent=indent)
 
     def __str__(self) -> str:
         errors = self.errors()
@@ -1,4 +1,5 @@
 import warnings
+from copy import copy, deepcopy
 from enum import IntEnum
 from typing import (
     TYPE_CHECKING,
@@ -20,16 +21,45 @@ from typing import (
 )
 
 from . import errors as errors_
-from .class_validators import Validator, make_generic_validator
+from .class_validators import (
+    UncachedResult,
+    Validator,
+    is_immutable,
+    make_generic_validator,
+    make_validator_cache,
+    make_validator_chain,
+    validator_uses_values,
+)
 from .error_wrappers import ErrorWrapper
 from .types import Json, JsonWrapper
-from .utils import AnyCallable, AnyType, Callable, ForwardRef, display_as_type, lenient_issubclass, sequence_like
-from .validators import NoneType, constant_validator, dict_validator, find_validators
+from .utils import (
+    AnyCallable,
+    AnyType,
+    Callable,
+    ForwardRef,
+    display_as_type,
+    is_fail_fast,
+    lenient_issubclass,
+    sequence_like,
+)
+from .validators import (
+    NoneType,
+    constant_validator,
+    dict_validator,
+    enum_validator,
+    find_exact_type,
+    find_rejected_types,
+    find_validators,
+    is_noop_validator,
+    make_enum_lookup,
+)
 
 Required: Any = Ellipsis
+# types of values whose validation results may be cached, see Config.validator_cache_size
+CACHED_TYPES = {str, bytes, int, float, bool}
 
 if TYPE_CHECKING:  # pragma: no cover
-    from .class_validators import ValidatorCallable  # noqa: F401
+    from .class_validators import ValidatorCache, ValidatorCallable  # noqa: F401
     from .error_wrappers import ErrorList
     from .main import BaseConfig, BaseModel  # noqa: F401
     from .schema import Schema  # noqa: F401
@@ -40,6 +70,21 @@ if TYPE_CHECKING:  # pragma: no cover
     LocType = Union[Tuple[str, ...], str]
 
 
+def default_copier(default: Any) -> Optional[Callable[[Any], Any]]:
+    """
+    Work out how a field's default needs to be copied for each model so changes to one model's value can't affect
+    others: None if it's immutable and can be shared, ``copy`` for lists, sets and dicts of immutable values,
+    otherwise ``deepcopy``.
+    """
+    if is_immutable(default):
+        return None
+    elif type(default) in (list, set):
+        return copy if all(is_immutable(v) for v in default) else deepcopy
+    elif type(default) is dict:
+        return copy if all(is_immutable(k) and is_immutable(v) for k, v in default.items()) else deepcopy
+    return deepcopy
+
+
 class Shape(IntEnum):
     SINGLETON = 1
     LIST = 2
@@ -53,12 +98,25 @@ class Shape(IntEnum):
 class Field:
     __slots__ = (
         'type_',
+        'outer_type_',
         'sub_fields',
         'key_field',
         'validators',
         'whole_pre_validators',
         'whole_post_validators',
+        'validator_chain',
+        'validator_cache',
+        'whole_pre_chain',
+        'whole_post_chain',
+        'exact_type',
+        'enum_lookup',
+        'sub_fields_by_type',
+        'sub_fields_by_tag',
+        'tag_fields',
+        'discriminator',
         'default',
+        'default_factory',
+        'default_copier',
         'required',
         'model_config',
         'name',
@@ -80,6 +138,7 @@ class Field:
         class_validators: Optional[Dict[str, Validator]],
         model_config: Type['BaseConfig'],
         default: Any = None,
+        default_factory: Optional[Callable[[], Any]] = None,
         required: bool = True,
         alias: str = None,
         schema: Optional['Schema'] = None,
@@ -89,8 +148,11 @@ class Field:
         self.has_alias: bool = bool(alias)
         self.alias: str = alias or name
         self.type_: type = type_
+        self.outer_type_: Any = type_
         self.class_validators = class_validators or {}
         self.default: Any = default
+        self.default_factory = default_factory
+        self.default_copier: Optional[Callable[[Any], Any]] = None
         self.required: bool = required
         self.model_config = model_config
         self.schema: Optional['Schema'] = schema
@@ -102,6 +164,16 @@ class Field:
         self.validators: 'ValidatorsList' = []
         self.whole_pre_validators: Optional['ValidatorsList'] = None
         self.whole_post_validators: Optional['ValidatorsList'] = None
+        self.validator_chain: Optional['ValidatorCallable'] = None
+        self.validator_cache: Optional['ValidatorCache'] = None
+        self.whole_pre_chain: Optional['ValidatorCallable'] = None
+        self.whole_post_chain: Optional['ValidatorCallable'] = None
+        self.exact_type: Optional[AnyType] = None
+        self.enum_lookup: Optional[Dict[Any, Any]] = None
+        self.sub_fields_by_type: Optional[Dict[AnyType, List[Field]]] = None
+        self.sub_fields_by_tag: Optional[Dict[Any, List[Field]]] = None
+        self.tag_fields: Optional[List[Field]] = None
+        self.discriminator: Optional[str] = None
         self.parse_json: bool = False
         self.shape: Shape = Shape.SINGLETON
         self.prepare()
@@ -133,6 +205,7 @@ class Field:
             alias=schema.alias,
             class_validators=class_validators,
             default=None if required else value,
+            default_factory=schema.default_factory,
             required=required,
             model_config=config,
             schema=schema,
@@ -150,9 +223,26 @@ class Field:
     def alt_alias(self) -> bool:
         return self.name != self.alias
 
+    def get_default(self) -> Any:
+        """
+        The value to use when the field is missing, from default_factory or a copy of default if it's mutable.
+        """
+        if self.default_factory is not None:
+            return self.default_factory()
+        elif self.default_copier is None:
+            return self.default
+        return self.default_copier(self.default)
+
     def prepare(self) -> None:
+        # fields are prepared again when inherited, start from the declared type since type_ is refined below
+        self.type_ = self.outer_type_
+        self.shape = Shape.SINGLETON
+        self.parse_json = False
+        self.sub_fields = None
+        self.key_field = None
+        self.default_copier = default_copier(self.default)
         if self.default is not None and self.type_ is None:
-            self.type_ = type(self.default)
+            self.type_ = self.outer_type_ = type(self.default)
 
         if self.type_ is None:
             raise errors_.ConfigError(f'unable to infer type for attribute "{self.name}"')
@@ -162,15 +252,17 @@ class Field:
             # user will need to call model.update_forward_refs()
             return
 
-        self.validate_always: bool = (
-            getattr(self.type_, 'validate_always', False) or any(v.always for v in self.class_validators.values())
+        self.validate_always = getattr(self.type_, 'validate_always', False) or any(
+            v.always for v in self.class_validators.values()
         )
 
-        if not self.required and self.default is None:
+        if not self.required and self.default is None and self.default_factory is None:
             self.allow_none = True
 
         self._populate_sub_fields()
         self._populate_validators()
+        cache_size = self.schema.validator_cache_size if self.schema else None
+        self._populate_validator_cache(self.model_config.validator_cache_size if cache_size is None else cache_size)
 
     def _populate_sub_fields(self) -> None:  # noqa: C901 (ignore complexity)
         # typing interface is horrible, we have to do some ugly checks
@@ -195,6 +287,8 @@ class Field:
                     self.required = False
                 types_.append(type_)
             self.sub_fields = [self._create_sub_type(t, f'{self.name}_{display_as_type(t)}') for t in types_]
+            if len(self.sub_fields) > 1:
+                self._index_sub_fields()
             return
 
         if issubclass(origin, Tuple):  # type: ignore
@@ -229,6 +323,100 @@ class Field:
             # type_ has been refined eg. as the type of a List and sub_fields needs to be populated
             self.sub_fields = [self._create_sub_type(self.type_, '_' + self.name)]
 
+    def _index_sub_fields(self) -> None:
+        """
+        Build indexes of which members of a union could match a value based on the value's type and, for dicts, the
+        ``Config.union_discriminator`` key. Members are still tried in order so the first match wins.
+        """
+        sub_fields = cast(List[Field], self.sub_fields)
+        rejected = [f._find_rejected_types() for f in sub_fields]
+        input_types = {dict, list, tuple, set, str, bytes, int, float, bool, NoneType}
+        input_types.update(f.exact_type for f in sub_fields if f.exact_type and f.shape is Shape.SINGLETON)
+
+        self.sub_fields_by_type = {}
+        for type_ in input_types:
+            candidates = []
+            for field, rejected_types in zip(sub_fields, rejected):
+                if type_ not in rejected_types:
+                    candidates.append(field)
+                    if field.exact_type is type_ and field.shape is Shape.SINGLETON and not field.parse_json:
+                        # values of exactly this type always match this member
+                        break
+            # when no member can match, all are tried to build errors
+            self.sub_fields_by_type[type_] = candidates or sub_fields
+
+        discriminator = self.model_config.union_discriminator
+        self.sub_fields_by_tag = None
+        self.tag_fields = None
+        self.discriminator = None
+        if discriminator:
+            dict_fields = self.sub_fields_by_type[dict]
+            tag_fields = [f._find_tag_field(discriminator) for f in dict_fields]
+            by_tag = {}
+            self.tag_fields = []
+            for tag_field in tag_fields:
+                if tag_field is not None and tag_field.default not in by_tag:
+                    tag = tag_field.default
+                    by_tag[tag] = [f for f, t in zip(dict_fields, tag_fields) if t is None or t.default == tag]
+                    self.tag_fields.append(tag_field)
+            self.sub_fields_by_tag = by_tag or None
+
+            members = [f for f in sub_fields if f.type_ is not NoneType]
+            if dict_fields == members and None not in tag_fields and len(by_tag) == len(members):
+                # every member is a model with its own tag, dicts are only validated by the member matching the tag
+                self.discriminator = discriminator
+
+    def _find_rejected_types(self) -> Set[AnyType]:
+        """
+        Types for which values of exactly that type would certainly fail validation by this field.
+        """
+        from .main import BaseModel  # noqa: F811
+
+        rejected: Set[AnyType]
+        if self.parse_json or (self.sub_fields and self.shape is Shape.SINGLETON):
+            rejected = set()
+        elif self.shape is Shape.MAPPING:
+            # dict_validator tries dict(v) so empty strings are valid
+            rejected = {int, float, bool, NoneType}
+        elif self.shape is not Shape.SINGLETON:
+            # sequence_like() is used for all other shapes
+            rejected = {dict, str, bytes, int, float, bool, NoneType}
+        elif lenient_issubclass(self.type_, BaseModel) and self.exact_type is self.type_:
+            rejected = {int, float, bool, NoneType}
+            model = cast(Type[BaseModel], self.type_)
+            if model.__init__ is BaseModel.__init__ and any(f.required for f in model.__fields__.values()):
+                # dict(v) fails for all strings except empty strings, which would be missing required fields
+                rejected |= {str, bytes}
+        else:
+            rejected = find_rejected_types([getattr(v, '__wrapped__', v) for v in self.validators])
+        if self.allow_none:
+            rejected.discard(NoneType)
+        return rejected
+
+    def _find_tag_field(self, key: str) -> Optional['Field']:
+        """
+        Find the ``const`` field with alias ``key`` if this is a field for a model, dicts with any other value for
+        ``key`` would fail validation.
+        """
+        from .main import BaseModel  # noqa: F811
+
+        model = self.type_
+        if (
+            self.shape is Shape.SINGLETON
+            and lenient_issubclass(model, BaseModel)
+            and self.exact_type is model
+            and model.__init__ is BaseModel.__init__
+        ):
+            for field in model.__fields__.values():
+                if (
+                    field.alias == key
+                    and field.schema is not None
+                    and field.schema.const
+                    and not any(v.pre for v in field.class_validators.values())
+                ):
+                    return field
+        return None
+
     def _create_sub_type(self, type_: AnyType, name: str, *, for_keys: bool = False) -> 'Field':
         return self.__class__(
             type_=type_,
@@ -257,15 +445,49 @@ class Field:
                 self.schema is not None and self.schema.const and constant_validator,
                 *[v.func for v in class_validators_ if not v.whole and not v.pre],
             )
-            self.validators = self._prep_vals(v_funcs)
+            used_v_funcs = [f for f in v_funcs if f and not is_noop_validator(f, self, self.model_config)]
+            self.validators, self.validator_chain = self._prep_vals(used_v_funcs)
+            self.exact_type = self._find_exact_type(used_v_funcs)
+            self.enum_lookup = (
+                make_enum_lookup(self.type_, self.model_config) if enum_validator in used_v_funcs else None
+            )
 
         if class_validators_:
-            self.whole_pre_validators = self._prep_vals(v.func for v in class_validators_ if v.whole and v.pre)
-            self.whole_post_validators = self._prep_vals(v.func for v in class_validators_ if v.whole and not v.pre)
+            self.whole_pre_validators, self.whole_pre_chain = self._prep_vals(
+                v.func for v in class_validators_ if v.whole and v.pre
+            )
+            self.whole_post_validators, self.whole_post_chain = self._prep_vals(
+                v.func for v in class_validators_ if v.whole and not v.pre
+            )
+
+    def _populate_validator_cache(self, size: int) -> None:
+        """
+        Cache results of this field's validators, and those of its sub-fields, if none of them use "values".
+        """
+        self.validator_cache = None
+        if size and self.validator_chain:
+            v_funcs = [getattr(v, '__wrapped__', v) for v in self.validators]
+            if not any(validator_uses_values(f) for f in v_funcs):
+                self.validator_cache = make_validator_cache(self.validator_chain, self, size)
+        for field in self.sub_fields or ():
+            field._populate_validator_cache(size)
+        if self.key_field:
+            self.key_field._populate_validator_cache(size)
+
+    def _find_exact_type(self, v_funcs: List[AnyCallable]) -> Optional[AnyType]:
+        from .main import BaseModel  # noqa: F811
+
+        if lenient_issubclass(self.type_, BaseModel):
+            # BaseModel.validate would only return a copy (sharing the same values) of an instance of the model
+            if [getattr(f, '__func__', None) for f in v_funcs] == [BaseModel.validate.__func__]:  # type: ignore
+                return self.type_
+            return None
+        return find_exact_type(self.type_, v_funcs, self.model_config)
 
     @staticmethod
-    def _prep_vals(v_funcs: Iterable[AnyCallable]) -> 'ValidatorsList':
-        return [make_generic_validator(f) for f in v_funcs if f]
+    def _prep_vals(v_funcs: Iterable[AnyCallable]) -> Tuple['ValidatorsList', Optional['ValidatorCallable']]:
+        v_funcs = [f for f in v_funcs if f]
+        return [make_generic_validator(f) for f in v_funcs], make_validator_chain(v_funcs)
 
     def validate(
         self, v: Any, values: Dict[str, Any], *, loc: 'LocType', cls: Optional['ModelOrDc'] = None
@@ -281,8 +503,8 @@ class Field:
                 return v, error
 
         errors: Optional['ErrorList'] = None
-        if self.whole_pre_validators:
-            v, errors = self._apply_validators(v, values, loc, cls, self.whole_pre_validators)
+        if self.whole_pre_chain:
+            v, errors = self._apply_validators(v, values, loc, cls, self.whole_pre_chain)
             if errors:
                 return v, errors
 
@@ -296,13 +518,13 @@ class Field:
             #  sequence, list, tuple, set, generator
             v, errors = self._validate_sequence_like(v, values, loc, cls)
 
-        if not errors and self.whole_post_validators:
-            v, errors = self._apply_validators(v, values, loc, cls, self.whole_post_validators)
+        if not errors and self.whole_post_chain:
+            v, errors = self._apply_validators(v, values, loc, cls, self.whole_post_chain)
         return v, errors
 
     def _validate_json(self, v: str, loc: Tuple[str, ...]) -> Tuple[Optional[Any], Optional[ErrorWrapper]]:
         try:
-            return Json.validate(v), None
+            return Json.validate(v, self.model_config), None
         except (ValueError, TypeError) as exc:
             return v, ErrorWrapper(exc, loc=loc, config=self.model_config)
 
@@ -329,6 +551,8 @@ class Field:
             r, ee = self._validate_singleton(v_, values, v_loc, cls)
             if ee:
                 errors.append(ee)
+                if is_fail_fast(self.model_config):
+                    break
             else:
                 result.append(r)
 
@@ -371,6 +595,8 @@ class Field:
             r, ee = field.validate(v_, values, loc=v_loc, cls=cls)
             if ee:
                 errors.append(ee)
+                if is_fail_fast(self.model_config):
+                    break
             else:
                 result.append(r)
 
@@ -393,12 +619,16 @@ class Field:
             key_result, key_errors = self.key_field.validate(k, values, loc=v_loc, cls=cls)  # type: ignore
             if key_errors:
                 errors.append(key_errors)
+                if is_fail_fast(self.model_config):
+                    break
                 continue
 
             v_loc = *loc, k
             value_result, value_errors = self._validate_singleton(v_, values, v_loc, cls)
             if value_errors:
                 errors.append(value_errors)
+                if is_fail_fast(self.model_config):
+                    break
                 continue
 
             result[key_result] = value_result
@@ -410,27 +640,97 @@ class Field:
     def _validate_singleton(
         self, v: Any, values: Dict[str, Any], loc: 'LocType', cls: Optional['ModelOrDc']
     ) -> 'ValidateReturn':
-        if self.sub_fields:
-            errors = []
-            for field in self.sub_fields:
-                value, error = field.validate(v, values, loc=loc, cls=cls)
-                if error:
-                    errors.append(error)
-                else:
+        if type(v) is self.exact_type:
+            # no need to validate values which are already exactly the right type
+            return v, None
+        elif self.sub_fields:
+            tagged = self._find_tagged(v) if self.sub_fields_by_tag is not None and isinstance(v, dict) else None
+            if tagged is not None and self.discriminator is not None:
+                # errors are only reported for the member matching the tag
+                return tagged[0].validate(v, values, loc=loc, cls=cls)
+            sub_fields = tagged or self._find_sub_fields(v)
+            value, errors = self._validate_sub_fields(sub_fields, v, values, loc, cls)
+            if errors and len(sub_fields) < len(self.sub_fields):
+                # members skipped by the index would have failed too, try them to report every error
+                skipped = [f for f in self.sub_fields if f not in sub_fields]
+                value, skipped_errors = self._validate_sub_fields(skipped, v, values, loc, cls)
+                if not skipped_errors:
                     return value, None
-            return v, errors
+                errors_by_field = {
+                    **dict(zip(sub_fields, cast(List[Any], errors))),
+                    **dict(zip(skipped, cast(List[Any], skipped_errors))),
+                }
+                errors = [errors_by_field[f] for f in self.sub_fields]
+            return value, errors
+        elif self.validator_chain:
+            return self._apply_validators(v, values, loc, cls, self.validator_chain)
         else:
-            return self._apply_validators(v, values, loc, cls, self.validators)
+            return v, None
+
+    @staticmethod
+    def _validate_sub_fields(
+        sub_fields: List['Field'], v: Any, values: Dict[str, Any], loc: 'LocType', cls: Optional['ModelOrDc']
+    ) -> 'ValidateReturn':
+        errors = []
+        for field in sub_fields:
+            value, error = field.validate(v, values, loc=loc, cls=cls)
+            if error:
+                errors.append(error)
+            else:
+                return value, None
+        return v, errors
+
+    def _find_tagged(self, v: Dict[Any, Any]) -> Optional[List['Field']]:
+        """
+        Members of a union to try for a dict based on its ``Config.union_discriminator`` key, see _index_sub_fields.
+        Tags which aren't an exact match are converted by each member's tag field, eg. ``'2'`` for an ``int`` tag or
+        the value of an ``Enum`` tag. None if there's no tag or it matches no member.
+        """
+        discriminator = cast(str, self.model_config.union_discriminator)
+        sub_fields_by_tag = cast(Dict[Any, List[Field]], self.sub_fields_by_tag)
+        try:
+            tag = v[discriminator]
+        except KeyError:
+            return None
+        try:
+            return sub_fields_by_tag[tag]
+        except (KeyError, TypeError):
+            # an unhashable tag or one which needs converting
+            pass
+        for tag_field in cast(List[Field], self.tag_fields):
+            _, error = tag_field.validate(tag, {}, loc=discriminator)
+            if not error:
+                return sub_fields_by_tag[tag_field.default]
+        return None
+
+    def _find_sub_fields(self, v: Any) -> List['Field']:
+        """
+        Members of a union to try when validating v based on its type, see _index_sub_fields.
+        """
+        if self.sub_fields_by_type is None:
+            return cast(List[Field], self.sub_fields)
+        return self.sub_fields_by_type.get(type(v)) or cast(List[Field], self.sub_fields)
 
     def _apply_validators(
-        self, v: Any, values: Dict[str, Any], loc: 'LocType', cls: Optional['ModelOrDc'], validators: 'ValidatorsList'
+        self,
+        v: Any,
+        values: Dict[str, Any],
+        loc: 'LocType',
+        cls: Optional['ModelOrDc'],
+        validator_chain: 'ValidatorCallable',
     ) -> 'ValidateReturn':
-        for validator in validators:
+        if validator_chain is self.validator_chain and self.validator_cache and type(v) in CACHED_TYPES:
             try:
-                v = validator(cls, v, values, self, self.model_config)
-            except (ValueError, TypeError) as exc:
-                return v, ErrorWrapper(exc, loc=loc, config=self.model_config)
-        return v, None
+                result, exc = self.validator_cache(cls, v)
+            except UncachedResult as e:
+                return e.result, None
+            if exc is None:
+                return result, None
+            return v, ErrorWrapper(exc, loc=loc, config=self.model_config)
+        try:
+            return validator_chain(cls, v, values, self, self.model_config), None
+        except (ValueError, TypeError) as exc:
+            return v, ErrorWrapper(exc, loc=loc, config=self.model_config)
 
     def include_in_schema(self) -> bool:
         """
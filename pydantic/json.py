@@ -2,14 +2,14 @@ import datetime
 from decimal import Decimal
 from enum import Enum
 from ipaddress import IPv4Address, IPv4Interface, IPv4Network, IPv6Address, IPv6Interface, IPv6Network
-from pathlib import Path
+from pathlib import PurePath
 from types import GeneratorType
-from typing import Any, Callable, Dict, Type, Union
+from typing import Any, Callable, Dict, Optional, Type, Union
 from uuid import UUID
 
 from pydantic.types import SecretBytes, SecretStr
 
-__all__ = 'pydantic_encoder', 'custom_pydantic_encoder', 'timedelta_isoformat'
+__all__ = 'pydantic_encoder', 'custom_pydantic_encoder', 'make_encoder', 'timedelta_isoformat'
 
 
 def isoformat(o: Union[datetime.date, datetime.time]) -> str:
@@ -35,33 +35,81 @@ ENCODERS_BY_TYPE: Dict[Type[Any], Callable[[Any], Any]] = {
     GeneratorType: list,
     bytes: lambda o: o.decode(),
     Decimal: float,
+    Enum: lambda o: o.value,
+    PurePath: str,
 }
 
 
-def pydantic_encoder(obj: Any) -> Any:
+def make_encoder(type_encoders: Optional[Dict[Any, Callable[[Any], Any]]] = None) -> Callable[[Any], Any]:
+    """
+    Build a function to pass as ``default`` to ``json.dumps()`` which encodes objects with the first of
+    ``type_encoders`` (a model's ``json_encoders``) matching a class in the object's MRO, otherwise the first of
+    ``ENCODERS_BY_TYPE``, so subclasses (eg. of ``datetime`` or ``Decimal``) are encoded like their base class.
+
+    The encoder chosen is cached for each type so encoding is one dict lookup per value, changes to
+    ``ENCODERS_BY_TYPE`` after a type has been encoded aren't seen.
+    """
+    type_encoders = dict(type_encoders or {})
+    cache: Dict[Type[Any], Callable[[Any], Any]] = {}
+
+    def encoder_for(type_: Type[Any]) -> Callable[[Any], Any]:
+        try:
+            return cache[type_]
+        except KeyError:
+            encode = cache[type_] = _find_encoder(type_, type_encoders)
+            return encode
+
+    def encoder(obj: Any) -> Any:
+        try:
+            encode = cache[type(obj)]
+        except KeyError:
+            encode = cache[type(obj)] = _find_encoder(type(obj), type_encoders)
+        return encode(obj)
+
+    # used by JSONWriter to write some types without calling the encoder
+    setattr(encoder, 'encoder_for', encoder_for)
+    return encoder
+
+
+def _find_encoder(type_: Type[Any], type_encoders: Dict[Any, Callable[[Any], Any]]) -> Callable[[Any], Any]:
     from .main import BaseModel
 
-    if isinstance(obj, BaseModel):
-        return obj.dict()
-    elif isinstance(obj, Enum):
-        return obj.value
-    elif isinstance(obj, Path):
-        return str(obj)
+    # object is left out so encoders of other types aren't shadowed, eg. json_encoders = {object: str}
+    mro = type_.__mro__[:-1]
+    for base in mro:
+        encode = type_encoders.get(base)
+        if encode:
+            return encode
+    for base in mro:
+        if base is BaseModel:
+            return _model_dict
+        encode = ENCODERS_BY_TYPE.get(base)
+        if encode:
+            return encode
+    return _not_serializable
 
-    try:
-        encoder = ENCODERS_BY_TYPE[type(obj)]
-    except KeyError:
-        raise TypeError(f"Object of type '{obj.__class__.__name__}' is not JSON serializable")
-    else:
-        return encoder(obj)
+
+def _model_dict(obj: Any) -> Any:
+    return obj.dict()
+
+
+def _not_serializable(obj: Any) -> Any:
+    raise TypeError(f"Object of type '{obj.__class__.__name__}' is not JSON serializable")
+
+
+pydantic_encoder = make_encoder()
 
 
 def custom_pydantic_encoder(type_encoders: Dict[Any, Callable[[Type[Any]], Any]], obj: Any) -> Any:
-    encoder = type_encoders.get(type(obj))
-    if encoder:
-        return encoder(obj)
-    else:
-        return pydantic_encoder(obj)
+    """
+    Encode an object with ``type_encoders`` falling back to ``pydantic_encoder``, ``make_encoder(type_encoders)``
+    caches the encoder chosen for each type so is faster when encoding many objects.
+    """
+    for base in type(obj).__mro__[:-1]:
+        encode = type_encoders.get(base)
+        if encode:
+            return encode(obj)
+    return pydantic_encoder(obj)
 
 
 def timedelta_isoformat(td: datetime.timedelta) -> str:
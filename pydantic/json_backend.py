@@ -0,0 +1,275 @@
+"""
+Libraries used to parse and serialise JSON.
+
+By default JSON is parsed with the fastest library installed (orjson, rapidjson or ujson, otherwise the standard
+library's ``json``) and serialised with the standard library, ``set_json_backend()`` chooses a library for both
+(including one added with ``register_json_backend()``). Parsing gives the same results whichever library is used,
+see ``stdlib_fallback()``, but serialising with another library only when it's installed would make output depend
+on what's installed since the other libraries don't put spaces after separators.
+"""
+import datetime
+import json
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Type, Union
+from uuid import UUID
+
+__all__ = (
+    'JSONBackend',
+    'register_json_backend',
+    'get_json_backend',
+    'set_json_backend',
+    'json_loads',
+    'json_dumps',
+    'json_dumps_bytes',
+    'get_dumps_backend',
+    'dumps_separators',
+    'make_encode',
+    'stdlib_fallback',
+)
+
+
+class JSONBackend:
+    """
+    Functions to parse and serialise JSON with one library.
+
+    :param name: name to choose the backend with ``set_json_backend()``
+    :param loads: parse a ``str`` or UTF-8 ``bytes``, raising a ``ValueError`` for invalid JSON
+    :param dumps: serialise an object to a ``str``, called with a ``default`` function for other types and any
+      keyword arguments passed to ``json()``
+    :param dumps_bytes: as ``dumps`` but returning UTF-8 ``bytes``, defaults to encoding the output of ``dumps``
+    :param separators: item and key separators ``dumps`` puts in its output
+    :param native_types: types ``dumps`` serialises itself without calling ``default``
+    """
+
+    __slots__ = 'name', 'loads', 'dumps', 'dumps_bytes', 'separators', 'native_types'
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        loads: Callable[[Union[str, bytes]], Any],
+        dumps: Callable[..., str],
+        dumps_bytes: Optional[Callable[..., bytes]] = None,
+        separators: Tuple[str, str] = (',', ':'),
+        native_types: Tuple[Type[Any], ...] = (),
+    ) -> None:
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+        self.dumps_bytes = dumps_bytes or (lambda obj, **kwargs: dumps(obj, **kwargs).encode())
+        self.separators = separators
+        self.native_types = native_types
+
+    def __repr__(self) -> str:
+        return f'<JSONBackend {self.name!r}>'
+
+
+def stdlib_fallback(loads: Callable[[Union[str, bytes]], Any]) -> Callable[[Union[str, bytes]], Any]:
+    """
+    Wrap the ``loads`` of another library to parse documents it rejects with the standard library, so it accepts
+    the same documents: ``NaN``, ``Infinity`` and numbers the library can't represent (eg. ints over 64 bits).
+    Invalid JSON is parsed twice to raise the standard library's error.
+    """
+
+    def loads_(s: Union[str, bytes]) -> Any:
+        try:
+            return loads(s)
+        except ValueError:
+            return json.loads(s)
+
+    return loads_
+
+
+# digits are all mapped to 0 to look for a run of 20, which may be an int which doesn't fit in 64 bits,
+# translate() is much quicker than a regex
+_digits_str = str.maketrans('123456789', '000000000')
+_digits_bytes = bytes.maketrans(b'123456789', b'000000000')
+_long_number_str = '0' * 20
+_long_number_bytes = b'0' * 20
+
+
+def _json_backend() -> JSONBackend:
+    return JSONBackend('json', loads=json.loads, dumps=json.dumps, separators=(', ', ': '))
+
+
+def _orjson_backend() -> JSONBackend:
+    import orjson
+
+    def dumps_bytes(
+        obj: Any, *, default: Callable[[Any], Any] = None, indent: Optional[int] = None, sort_keys: bool = False
+    ) -> bytes:
+        # the standard library converts int, float, bool and None keys to strings, so do the same
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            if indent != 2:
+                raise ValueError('orjson only supports indent=2')
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=default, option=option)
+
+    orjson_loads = stdlib_fallback(orjson.loads)
+
+    def loads(s: Union[str, bytes]) -> Any:
+        # orjson parses ints over 64 bits as floats rather than failing
+        if isinstance(s, bytes):
+            long_number = _long_number_bytes in s.translate(_digits_bytes)
+        else:
+            long_number = _long_number_str in s.translate(_digits_str)
+        if long_number:
+            return json.loads(s)
+        return orjson_loads(s)
+
+    return JSONBackend(
+        'orjson',
+        loads=loads,
+        dumps=lambda obj, **kwargs: dumps_bytes(obj, **kwargs).decode(),
+        dumps_bytes=dumps_bytes,
+        native_types=(datetime.datetime, datetime.date, datetime.time, UUID),
+    )
+
+
+def _rapidjson_backend() -> JSONBackend:
+    import rapidjson
+
+    def dumps(obj: Any, **kwargs: Any) -> str:
+        return rapidjson.dumps(obj, datetime_mode=rapidjson.DM_ISO8601, uuid_mode=rapidjson.UM_CANONICAL, **kwargs)
+
+    return JSONBackend(
+        'rapidjson',
+        loads=stdlib_fallback(rapidjson.loads),
+        dumps=dumps,
+        native_types=(datetime.datetime, datetime.date, datetime.time, UUID),
+    )
+
+
+def _ujson_backend() -> JSONBackend:
+    import ujson
+
+    try:
+        ujson.dumps(None, default=str)
+    except TypeError:
+        # ujson<5.2 has no default argument so can't serialise pydantic's types, use it for parsing only
+        return JSONBackend('ujson', loads=stdlib_fallback(ujson.loads), dumps=json.dumps, separators=(', ', ': '))
+
+    def dumps(obj: Any, **kwargs: Any) -> str:
+        return ujson.dumps(obj, escape_forward_slashes=False, **kwargs)
+
+    return JSONBackend('ujson', loads=stdlib_fallback(ujson.loads), dumps=dumps)
+
+
+_factories: Dict[str, Callable[[], JSONBackend]] = {
+    'orjson': _orjson_backend,
+    'rapidjson': _rapidjson_backend,
+    'ujson': _ujson_backend,
+    'json': _json_backend,
+}
+_backends: Dict[str, JSONBackend] = {}
+
+
+def register_json_backend(backend: JSONBackend) -> None:
+    """
+    Add a backend for another library (or the same library with different options) which can then be chosen by name.
+    """
+    _backends[backend.name] = backend
+
+
+def get_json_backend(name: str) -> JSONBackend:
+    """
+    Get a backend by name, the library is imported the first time, raising ``ImportError`` if it isn't installed.
+    """
+    try:
+        return _backends[name]
+    except KeyError:
+        pass
+    try:
+        factory = _factories[name]
+    except KeyError:
+        raise ValueError(f'unknown JSON backend {name!r}, choose from {", ".join(_factories)} or register one')
+    return _backends.setdefault(name, factory())
+
+
+def _fastest_parser() -> JSONBackend:
+    for name in ('orjson', 'rapidjson', 'ujson'):
+        try:
+            return get_json_backend(name)
+        except ImportError:
+            pass
+    return _stdlib_backend
+
+
+_stdlib_backend = get_json_backend('json')
+_default_parser = _fastest_parser()
+_parser, _serialiser = _default_parser, _stdlib_backend
+
+
+def set_json_backend(backend: Union[None, str, JSONBackend]) -> None:
+    """
+    Parse and serialise JSON with a backend or the backend of this name, ``None`` restores the default of parsing
+    with the fastest library installed and serialising with the standard library.
+    """
+    global _parser, _serialiser
+    if backend is None:
+        _parser, _serialiser = _default_parser, _stdlib_backend
+    else:
+        if isinstance(backend, str):
+            backend = get_json_backend(backend)
+        _parser = _serialiser = backend
+
+
+def json_loads(s: Union[str, bytes]) -> Any:
+    """
+    Parse JSON with the current backend.
+    """
+    return _parser.loads(s)
+
+
+def json_dumps(obj: Any, **kwargs: Any) -> str:
+    """
+    Serialise to JSON with the current backend, ``default`` and other keyword arguments are passed to its ``dumps``.
+    """
+    return _serialiser.dumps(obj, **kwargs)
+
+
+def json_dumps_bytes(obj: Any, **kwargs: Any) -> bytes:
+    """
+    As ``json_dumps()`` but returning ``bytes``.
+    """
+    return _serialiser.dumps_bytes(obj, **kwargs)
+
+
+def get_dumps_backend(type_encoders: Iterable[Type[Any]] = (), custom_encoder: bool = False) -> JSONBackend:
+    """
+    The backend to serialise a model with: the current backend unless it serialises a type in ``type_encoders``
+    (a model's ``json_encoders``) itself or a custom ``encoder`` is given, either of which would be ignored for
+    those types, in which case the standard library's ``json``.
+    """
+    backend = _serialiser
+    native_types = backend.native_types
+    if native_types and (
+        custom_encoder or any(isinstance(t, type) and issubclass(t, native_types) for t in type_encoders)
+    ):
+        return _stdlib_backend
+    return backend
+
+
+def dumps_separators(dumps: Callable[..., str]) -> Tuple[str, str]:
+    """
+    The item and key separators a ``dumps`` function puts in its output, eg. ``(', ', ': ')`` for the standard library.
+    """
+    for backend in _backends.values():
+        if dumps is backend.dumps:
+            return backend.separators
+    s = dumps([0, {'a': 0}])
+    item_end, key_start = s.index('{'), s.index('"a"') + len('"a"')
+    return s[2:item_end], s[key_start:-3]
+
+
+def make_encode(dumps: Callable[..., str], default: Callable[[Any], Any]) -> Callable[[Any], str]:
+    """
+    A function to serialise many objects with ``dumps`` and ``default``.
+    """
+    if dumps is json.dumps:
+        # json.dumps() creates a new JSONEncoder on every call when given default
+        return json.JSONEncoder(default=default).encode
+    return partial(dumps, default=default)
@@ -0,0 +1,246 @@
+"""
+Write models to JSON directly from their values rather than serialising the dict built by ``dict()``.
+"""
+import datetime
+from json.encoder import encode_basestring_ascii
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple, Type
+from uuid import UUID
+
+from .json import isoformat
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .main import BaseModel  # noqa: F401
+
+    Parts = List[str]
+    Write = Callable[[Any, Parts], None]
+    JSONKeys = Dict[bool, Tuple[Dict[str, str], Dict[str, str]]]
+
+__all__ = 'JSONWriter', 'json_keys'
+
+INFINITY = float('inf')
+# types with a writer which doesn't call the encoder
+SPECIALISED_TYPES = {datetime.datetime, datetime.date, datetime.time, UUID}
+
+
+def json_keys(model: Type['BaseModel']) -> 'JSONKeys':
+    """
+    Escaped keys of a model's fields for JSONWriter, by field name (False) and by alias (True): one dict for the first
+    field written and one with a separator first for the fields after it.
+    """
+    keys = {}
+    for by_alias in (False, True):
+        first = {
+            name: encode_basestring_ascii(field.alias if by_alias else name) + ': '
+            for name, field in model.__fields__.items()
+        }
+        keys[by_alias] = first, {name: ', ' + key for name, key in first.items()}
+    return keys
+
+
+class JSONWriter:
+    """
+    Writes the same JSON as ``json.dumps(model.dict(by_alias=..., skip_defaults=...), default=default)`` (with no other
+    arguments) but from the model's values, so the dict of the whole model is never built. Sub-models which override
+    ``dict()`` are written from its output.
+
+    Values are written in one of two modes, like json() which first builds a dict: values of models and containers
+    in them, which dict() would convert (eg. sub-models to dicts), and values json.dumps() sees as they are
+    (eg. returned by ``default``). A function to write values of each type is found once for each mode and cached.
+    """
+
+    __slots__ = 'default', 'by_alias', 'skip_defaults', '_writers', '_native_writers', '_lazy_value', '_meta_model'
+
+    def __init__(self, default: Callable[[Any], Any], *, by_alias: bool = False, skip_defaults: bool = False) -> None:
+        from .main import LazyValue, MetaModel
+
+        self.default = default
+        self.by_alias = by_alias
+        self.skip_defaults = skip_defaults
+        self._writers: Dict[Type[Any], 'Write'] = {}
+        self._native_writers: Dict[Type[Any], 'Write'] = {}
+        self._lazy_value = LazyValue
+        self._meta_model = MetaModel
+
+    def dumps(self, obj: Any) -> str:
+        parts: 'Parts' = []
+        self.write(obj, parts)
+        return ''.join(parts)
+
+    def write(self, v: Any, parts: 'Parts') -> None:
+        try:
+            write = self._writers[type(v)]
+        except KeyError:
+            write = self._writers[type(v)] = self._find_writer(type(v), native=False)
+        write(v, parts)
+
+    def write_native(self, v: Any, parts: 'Parts') -> None:
+        try:
+            write = self._native_writers[type(v)]
+        except KeyError:
+            write = self._native_writers[type(v)] = self._find_writer(type(v), native=True)
+        write(v, parts)
+
+    def _find_writer(self, type_: Type[Any], native: bool) -> 'Write':  # noqa: C901 (ignore complexity)
+        # same order of checks as json's encoder
+        if type_ is type(None):
+            return _write_none
+        elif type_ is bool:
+            return _write_bool
+        elif issubclass(type_, str):
+            return _write_str
+        elif issubclass(type_, int):
+            return _write_int
+        elif issubclass(type_, float):
+            return _write_float
+
+        write = self.write_native if native else self.write
+        if issubclass(type_, (list, tuple)):
+            return lambda v, parts: _write_list(v, parts, write)
+        elif issubclass(type_, dict):
+            return lambda v, parts: _write_dict(v, parts, write)
+        elif not native and isinstance(type_, self._meta_model):
+            if type_._writes_json():
+                return self._write_model
+            by_alias, skip_defaults = self.by_alias, self.skip_defaults
+            return lambda v, parts: self.write_native(v.dict(by_alias=by_alias, skip_defaults=skip_defaults), parts)
+        elif not native and issubclass(type_, set):
+            # dict() copies sets
+            return lambda v, parts: self.write_native({v_ for v_ in v}, parts)
+
+        encoder_for: Optional[Callable[[Type[Any]], Callable[[Any], Any]]] = getattr(self.default, 'encoder_for', None)
+        # subclasses might override isoformat() or __str__() to return characters which need escaping
+        if encoder_for and type_ in SPECIALISED_TYPES:
+            encoder = encoder_for(type_)
+            if encoder is isoformat:
+                return _write_isoformat
+            elif encoder is str:
+                return _write_uuid
+        default = self.default
+        return lambda v, parts: self.write_native(default(v), parts)
+
+    def _write_model(self, m: 'BaseModel', parts: 'Parts') -> None:
+        first_keys, next_keys = m.__json_keys__[self.by_alias]
+        items: Iterable[Tuple[str, Any]] = m.__values__.items()
+        if self.skip_defaults:
+            fields_set = m.__fields_set__
+            items = [(k, v) for k, v in items if k in fields_set]
+        lazy_value = self._lazy_value
+        writers = self._writers
+        # the model is written to its own list which is joined at the end, so a large model holds one string for
+        # each sub-model rather than many small ones
+        model_parts = ['{']
+        append = model_parts.append
+        json_keys = first_keys
+        for k, v in items:
+            if type(v) is lazy_value:
+                v = m._validate_lazy(k, v)
+            try:
+                append(json_keys[k])
+            except KeyError:
+                # extra field
+                append(('' if json_keys is first_keys else ', ') + encode_basestring_ascii(k) + ': ')
+            json_keys = next_keys
+            # the commonest types are written here to save a call
+            t = type(v)
+            if t is str:
+                append(encode_basestring_ascii(v))
+            elif t is int:
+                append(int.__repr__(v))
+            elif t is float:
+                append(_float_repr(v))
+            elif v is None:
+                append('null')
+            else:
+                write = writers.get(t)
+                if write is None:
+                    self.write(v, model_parts)
+                else:
+                    write(v, model_parts)
+        append('}')
+        parts.append(''.join(model_parts))
+
+
+def _write_none(v: None, parts: 'Parts') -> None:
+    parts.append('null')
+
+
+def _write_bool(v: bool, parts: 'Parts') -> None:
+    parts.append('true' if v else 'false')
+
+
+def _write_str(v: str, parts: 'Parts') -> None:
+    parts.append(encode_basestring_ascii(v))
+
+
+def _write_int(v: int, parts: 'Parts') -> None:
+    parts.append(int.__repr__(v))
+
+
+def _write_float(v: float, parts: 'Parts') -> None:
+    parts.append(_float_repr(v))
+
+
+def _float_repr(v: float) -> str:
+    if v != v:
+        return 'NaN'
+    elif v == INFINITY:
+        return 'Infinity'
+    elif v == -INFINITY:
+        return '-Infinity'
+    return float.__repr__(v)
+
+
+def _write_isoformat(v: Any, parts: 'Parts') -> None:
+    # isoformat() is always ASCII without characters which need escaping
+    parts.append('"' + v.isoformat() + '"')
+
+
+def _write_uuid(v: UUID, parts: 'Parts') -> None:
+    parts.append('"' + str(v) + '"')
+
+
+def _write_list(v: Any, parts: 'Parts', write: 'Write') -> None:
+    if not v:
+        parts.append('[]')
+        return
+    parts.append('[')
+    first = True
+    for v_ in v:
+        if first:
+            first = False
+        else:
+            parts.append(', ')
+        write(v_, parts)
+    parts.append(']')
+
+
+def _write_dict(v: Dict[Any, Any], parts: 'Parts', write: 'Write') -> None:
+    if not v:
+        parts.append('{}')
+        return
+    parts.append('{')
+    first = True
+    for k, v_ in v.items():
+        if first:
+            first = False
+        else:
+            parts.append(', ')
+        parts.append(_json_key(k) + ': ')
+        write(v_, parts)
+    parts.append('}')
+
+
+def _json_key(k: Any) -> str:
+    if isinstance(k, str):
+        return encode_basestring_ascii(k)
+    elif isinstance(k, float):
+        return '"' + _float_repr(k) + '"'
+    elif k is True:
+        return '"true"'
+    elif k is False:
+        return '"false"'
+    elif k is None:
+        return '"null"'
+    elif isinstance(k, int):
+        return '"' + int.__repr__(k) + '"'
+    raise TypeError(f'keys must be str, int, float, bool or None, not {k.__class__.__name__}')
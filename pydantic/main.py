@@ -3,19 +3,26 @@ import sys
 import warnings
 from abc import ABCMeta
 from copy import deepcopy
+from datetime import date, time, timedelta
+from decimal import Decimal
 from enum import Enum
 from functools import partial
 from pathlib import Path
 from types import FunctionType
 from typing import (
+    IO,
     TYPE_CHECKING,
+    AbstractSet,
     Any,
     Callable,
     Dict,
     Generator,
+    Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
+    Sequence,
     Set,
     Tuple,
     Type,
@@ -24,12 +31,15 @@ from typing import (
     cast,
     no_type_check,
 )
+from uuid import UUID
 
-from .class_validators import ValidatorGroup, extract_validators, inherit_validators
+from .class_validators import ValidatorGroup, extract_validators, inherit_validators, validator_uses_values
 from .error_wrappers import ErrorWrapper, ValidationError
 from .errors import ConfigError, DictError, ExtraError, MissingError
-from .fields import Field
-from .json import custom_pydantic_encoder, pydantic_encoder
+from .fields import Field, Shape
+from .json import make_encoder, pydantic_encoder
+from .json_backend import JSONBackend, dumps_separators, get_dumps_backend, json_loads, make_encode
+from .json_writer import JSONWriter, json_keys
 from .parse import Protocol, load_file, load_str_bytes
 from .schema import model_schema
 from .types import PyObject, StrBytes
@@ -37,8 +47,13 @@ from .utils import (
     AnyCallable,
     AnyType,
     ForwardRef,
+    ItemsSpec,
     change_exception,
     is_classvar,
+    is_fail_fast,
+    lenient_issubclass,
+    normalize_items,
+    override_fail_fast,
     resolve_annotations,
     truncate,
     update_field_forward_refs,
@@ -49,6 +64,7 @@ if TYPE_CHECKING:  # pragma: no cover
     from .dataclasses import DataclassType  # noqa: F401
     from .types import CallableGenerator, ModelOrDc
     from .class_validators import ValidatorListDict
+    from .json_writer import JSONKeys
 
     AnyGenerator = Generator[Any, None, None]
     TupleGenerator = Generator[Tuple[str, Any], None, None]
@@ -58,6 +74,13 @@ if TYPE_CHECKING:  # pragma: no cover
     SetStr = Set[str]
     ListStr = List[str]
     Model = TypeVar('Model', bound='BaseModel')
+    ModelValidator = Callable[['DictStrAny', Optional['ModelOrDc'], bool], Tuple['DictStrAny', List[Any]]]
+    ModelConstructor = Callable[[Mapping[str, Any]], Tuple['DictStrAny', 'SetStr']]
+    ModelSerializer = Callable[
+        ['BaseModel', Optional['SetStr'], bool, bool, Optional[ItemsSpec], Optional[ItemsSpec]], 'DictStrAny'
+    ]
+    # a set of keys or a dict of keys to ..., True or another IncEx, see normalize_items()
+    IncEx = Union[AbstractSet[Union[int, str]], Mapping[Union[int, str], Any]]
 
 
 class Extra(str, Enum):
@@ -81,6 +104,13 @@ class BaseConfig:
     error_msg_templates: Dict[str, str] = {}
     arbitrary_types_allowed = False
     json_encoders: Dict[AnyType, AnyCallable] = {}
+    fail_fast = False
+    union_discriminator: Optional[str] = None
+    lazy_submodels = False
+    validator_cache_size = 0
+    intern_strings = False
+    json_loads: Optional[Callable[[StrBytes], Any]] = None
+    json_dumps: Optional[Callable[..., str]] = None
 
     @classmethod
     def get_field_schema(cls, name: str) -> Dict[str, str]:
@@ -135,6 +165,504 @@ def set_extra(config: Type[BaseConfig], cls_name: str) -> None:
             raise ValueError(f'"{cls_name}": {config.extra} is not a valid value for "extra"')
 
 
+_missing = object()
+
+
+class LazyValue:
+    """
+    Unvalidated value of a lazy field, see ``Config.lazy_submodels``, it's validated when the field is first accessed.
+    """
+
+    __slots__ = ('raw',)
+
+    def __init__(self, raw: Any) -> None:
+        self.raw = raw
+
+    def __repr__(self) -> str:
+        return f'LazyValue({self.raw!r})'
+
+
+def _is_lazy(field: Field, config: Type[BaseConfig]) -> bool:
+    if field.class_validators or field.validate_always:
+        # validators may depend on other fields so must be run with them
+        return False
+    if field.schema is not None and field.schema.lazy is not None:
+        return field.schema.lazy
+    return config.lazy_submodels and _has_submodel(field)
+
+
+def _lazy_field_names(model: Type['BaseModel']) -> Set[str]:
+    """
+    Names of the fields whose validation is deferred, a field isn't lazy if the validator of a field after it uses
+    "values" since it would get the LazyValue rather than the validated value.
+    """
+    names = set()
+    later_uses_values = False
+    for name, field in reversed(list(model.__fields__.items())):
+        if not later_uses_values and _is_lazy(field, model.__config__):
+            names.add(name)
+        later_uses_values = later_uses_values or any(
+            validator_uses_values(v.func) for v in (field.class_validators or {}).values()
+        )
+    return names
+
+
+def _has_submodel(field: Field) -> bool:
+    # checking the metaclass is much quicker than issubclass(field.type_, BaseModel)
+    return isinstance(field.type_, MetaModel) or any(_has_submodel(f) for f in field.sub_fields or ())
+
+
+def _construct_value(field: Field, value: Any) -> Any:
+    """
+    Create sub-models in trusted data for a field without validation, see BaseModel.from_trusted().
+    """
+    if value is None or not _has_submodel(field):
+        return value
+    shape = field.shape
+    if shape is Shape.SINGLETON:
+        return _construct_singleton(field, value)
+    elif shape is Shape.MAPPING:
+        return {k: _construct_singleton(field, v) for k, v in value.items()}
+    elif shape is Shape.TUPLE:
+        return tuple(_construct_value(f, v) for f, v in zip(cast(List[Field], field.sub_fields), value))
+
+    items = [_construct_singleton(field, v) for v in value]
+    if shape is Shape.SET:
+        return set(items)
+    elif shape is Shape.TUPLE_ELLIPS or (shape is Shape.SEQUENCE and isinstance(value, tuple)):
+        return tuple(items)
+    return items
+
+
+def _construct_singleton(field: Field, value: Any) -> Any:
+    if field.sub_fields:
+        if field.sub_fields_by_type is None:
+            # a type refined from eg. List[List[Model]]
+            return _construct_value(field.sub_fields[0], value)
+        # a union, use the first member which could match the value
+        members = field.sub_fields_by_type.get(type(value))
+        if members and type(value) is dict:
+            if field.sub_fields_by_tag is not None:
+                members = field._find_tagged(value) or members
+            members = [f for f in members if _dict_matches(f, value)]
+            if not members:
+                # the keys don't tell which member the data came from, validate it to find out
+                validated, errors = field._validate_singleton(value, {}, field.name, None)
+                return value if errors else validated
+        return _construct_value(members[0], value) if members else value
+    elif isinstance(value, dict) and isinstance(field.type_, MetaModel):
+        return field.type_.from_trusted(value)
+    return value
+
+
+def _dict_matches(field: Field, value: Dict[str, Any]) -> bool:
+    """
+    Whether trusted data could have come from a union member: for a model every required field must be present and,
+    unless the model allows extra fields, every key must be a field's name or alias.
+    """
+    model = field.type_
+    if field.shape is not Shape.SINGLETON or not isinstance(model, MetaModel):
+        return True
+    fields = model.__fields__.values()
+    if any(f.required and f.name not in value and f.alias not in value for f in fields):
+        return False
+    if model.__config__.extra is Extra.allow:
+        return True
+    aliases = {f.alias for f in fields}
+    return all(k in model.__fields__ or k in aliases for k in value)
+
+
+def compile_model_validator(model: Type['BaseModel']) -> 'ModelValidator':  # noqa: C901 (ignore complexity)
+    """
+    Build the function used by validate_model() to validate input data against a model.
+
+    Everything which depends only on the model's fields and config (aliases, which fields are required, whether
+    defaults need validating, how extra keys are treated) is resolved here once rather than on every call, this is
+    called when the model is created and again by update_forward_refs().
+
+    The function's ``defer`` argument keeps the input of lazy fields as LazyValues, it's only set when creating a model
+    instance since nothing else validates them later.
+    """
+    config = model.__config__
+    for field in model.__fields__.values():
+        if type(field.type_) == ForwardRef:
+            return partial(_unprepared_validator, model.__name__, field.name)
+
+    check_extra = config.extra is not Extra.ignore
+    allow_extra = config.extra is Extra.allow
+    validate_all = config.validate_all
+    lazy_names = _lazy_field_names(model)
+    # (name, alias, name to fall back to when populating by name, field, required, whether to validate the default,
+    # whether validation is deferred until the field is accessed)
+    field_specs = tuple(
+        (
+            name,
+            field.alias,
+            field.name if config.allow_population_by_alias and field.alt_alias else None,
+            field,
+            field.required,
+            validate_all or field.validate_always,
+            name in lazy_names,
+        )
+        for name, field in model.__fields__.items()
+    )
+
+    def model_validator(
+        input_data: 'DictStrAny', cls: Optional['ModelOrDc'], defer: bool
+    ) -> Tuple['DictStrAny', List[Any]]:
+        values: 'DictStrAny' = {}
+        errors: List[Any] = []
+        names_used = set()
+
+        for name, alias, alt_name, field, required, validate_default, lazy in field_specs:
+            value = input_data.get(alias, _missing)
+            using_name = False
+            if value is _missing and alt_name is not None:
+                value = input_data.get(alt_name, _missing)
+                using_name = True
+
+            if value is _missing:
+                if required:
+                    errors.append(ErrorWrapper(MissingError(), loc=alias, config=config))
+                    if is_fail_fast(config):
+                        return values, errors
+                    continue
+                value = field.get_default()
+                if not validate_default:
+                    values[name] = value
+                    continue
+            else:
+                if check_extra:
+                    names_used.add(alt_name if using_name else alias)
+                if lazy and defer and value is not None:
+                    values[name] = LazyValue(value)
+                    continue
+
+            v_, errors_ = field.validate(value, values, loc=alias, cls=cls)
+            if errors_:
+                if isinstance(errors_, ErrorWrapper):
+                    errors.append(errors_)
+                else:
+                    errors.extend(errors_)
+                if is_fail_fast(config):
+                    return values, errors
+            else:
+                values[name] = v_
+
+        if check_extra:
+            extra = input_data.keys() - names_used
+            if extra:
+                if allow_extra:
+                    for f in extra:
+                        values[f] = input_data[f]
+                elif is_fail_fast(config):
+                    errors.append(ErrorWrapper(ExtraError(), loc=min(extra), config=config))
+                else:
+                    for f in sorted(extra):
+                        errors.append(ErrorWrapper(ExtraError(), loc=f, config=config))
+
+        return values, errors
+
+    return model_validator
+
+
+def compile_model_constructor(model: Type['BaseModel']) -> 'ModelConstructor':
+    """
+    Build the function used by from_trusted() to create values and fields set from trusted data, like
+    compile_model_validator() this is called when the model is created and again by update_forward_refs().
+    """
+    # (name, alias, name to fall back to, field, whether the field may contain sub-models)
+    field_specs = tuple(
+        (name, field.alias, field.name if field.alt_alias else None, field, _has_submodel(field))
+        for name, field in model.__fields__.items()
+    )
+    known_keys = {f.alias for f in model.__fields__.values()} | model.__fields__.keys()
+    allow_extra = model.__config__.extra is Extra.allow
+
+    def model_constructor(obj: Mapping[str, Any]) -> Tuple['DictStrAny', 'SetStr']:
+        values: 'DictStrAny' = {}
+        fields_set: 'SetStr' = set()
+        for name, alias, alt_name, field, has_submodel in field_specs:
+            value = obj.get(alias, _missing)
+            if value is _missing and alt_name is not None:
+                value = obj.get(alt_name, _missing)
+            if value is _missing:
+                values[name] = field.get_default()
+                continue
+            values[name] = _construct_value(field, value) if has_submodel else value
+            fields_set.add(name)
+
+        if allow_extra:
+            for key in obj.keys() - known_keys:
+                values[key] = obj[key]
+                fields_set.add(key)
+        return values, fields_set
+
+    return model_constructor
+
+
+# json_stream() yields what it has encoded after at most this many pieces, see _json_pieces()
+JSON_BATCH_SIZE = 200
+# types whose values dict() copies straight into its output, see _is_scalar()
+SCALAR_TYPES = (str, bytes, int, float, Decimal, date, time, timedelta, UUID, Enum)
+
+
+def _is_scalar(field: Field, config: Type[BaseConfig]) -> bool:
+    """
+    Whether values of a field are always scalars which dict() can use as is rather than checking for models and
+    containers to convert, validators are assumed to return the field's type but other validators might not.
+    """
+    return (
+        field.shape is Shape.SINGLETON
+        and not field.sub_fields
+        and not field.class_validators
+        and not _is_lazy(field, config)
+        and lenient_issubclass(field.type_, SCALAR_TYPES)
+    )
+
+
+def compile_model_serializer(model: Type['BaseModel']) -> 'ModelSerializer':
+    """
+    Build the function used by dict() to convert a model's values, like compile_model_validator() this is called
+    when the model is created and again by update_forward_refs().
+
+    Which fields hold scalars that can be copied straight through and the map of field names to aliases are worked
+    out here, other values are converted by _serialize_value().
+    """
+    config = model.__config__
+    aliases = {name: field.alias for name, field in model.__fields__.items()}
+    scalars = {name for name, field in model.__fields__.items() if _is_scalar(field, config)}
+
+    def model_serializer(
+        m: 'BaseModel',
+        keys: Optional['SetStr'],
+        by_alias: bool,
+        skip_defaults: bool,
+        include: Optional[ItemsSpec],
+        exclude: Optional[ItemsSpec],
+    ) -> 'DictStrAny':
+        result = {}
+        for k, v in m.__values__.items():
+            if keys is not None and k not in keys:
+                continue
+            if k not in scalars:
+                if type(v) is LazyValue:
+                    v = m._validate_lazy(k, v)
+                sub_include = include and include.get(k)
+                sub_exclude = exclude and exclude.get(k)
+                if sub_include or sub_exclude:
+                    v = _serialize_items(v, by_alias, skip_defaults, _sub_spec(sub_include), sub_exclude)
+                else:
+                    v = _serialize_value(v, by_alias, skip_defaults)
+            if by_alias:
+                result[aliases.get(k, k)] = v
+            else:
+                result[k] = v
+        return result
+
+    return model_serializer
+
+
+def _serialize_value(v: Any, by_alias: bool, skip_defaults: bool) -> Any:
+    """
+    Convert models found in a value to dicts, copying containers.
+    """
+    if isinstance(type(v), MetaModel):
+        # checking the metaclass is much quicker than isinstance(v, BaseModel)
+        return v.dict(by_alias=by_alias, skip_defaults=skip_defaults)
+    elif isinstance(v, list):
+        return [_serialize_value(v_, by_alias, skip_defaults) for v_ in v]
+    elif isinstance(v, dict):
+        return {k_: _serialize_value(v_, by_alias, skip_defaults) for k_, v_ in v.items()}
+    elif isinstance(v, set):
+        return {_serialize_value(v_, by_alias, skip_defaults) for v_ in v}
+    elif isinstance(v, tuple):
+        return tuple(_serialize_value(v_, by_alias, skip_defaults) for v_ in v)
+    else:
+        return v
+
+
+def _sub_spec(spec: Any) -> Optional[ItemsSpec]:
+    # an include of ... means the whole value, as does an empty one like an empty include at the top level
+    return None if spec is ... or not spec else spec
+
+
+def _select_items(
+    items: Iterable[Tuple[Any, Any]], include: Optional[ItemsSpec], exclude: Optional[ItemsSpec]
+) -> 'Generator[Tuple[Any, Any, Optional[ItemsSpec], Optional[ItemsSpec]], None, None]':
+    """
+    Apply include and exclude to the keys and values of a list, tuple or dict, yield the items chosen with the
+    include and exclude to apply to each, '__all__' applies to items without their own entry.
+    """
+    all_include = include and include.get('__all__')
+    all_exclude = exclude and exclude.get('__all__')
+    for k, v in items:
+        sub_include = None
+        if include is not None:
+            sub_include = include.get(k, all_include)
+            if sub_include is None:
+                continue
+            sub_include = _sub_spec(sub_include)
+        sub_exclude = None
+        if exclude is not None:
+            sub_exclude = exclude.get(k, all_exclude)
+            if sub_exclude is ...:
+                continue
+        yield k, v, sub_include, sub_exclude
+
+
+def _serialize_items(
+    v: Any, by_alias: bool, skip_defaults: bool, include: Optional[ItemsSpec], exclude: Optional[ItemsSpec]
+) -> Any:
+    """
+    Like _serialize_value() but applying nested include and exclude, excluded values are never visited.
+    """
+    if isinstance(type(v), MetaModel):
+        return v.dict(by_alias=by_alias, skip_defaults=skip_defaults, include=include, exclude=exclude)
+    elif isinstance(v, dict):
+        return {
+            k_: _serialize_items(v_, by_alias, skip_defaults, i, e)
+            for k_, v_, i, e in _select_items(v.items(), include, exclude)
+        }
+    elif isinstance(v, (list, tuple)):
+        items = [
+            _serialize_items(v_, by_alias, skip_defaults, i, e)
+            for _, v_, i, e in _select_items(enumerate(v), include, exclude)
+        ]
+        return items if isinstance(v, list) else tuple(items)
+    return _serialize_value(v, by_alias, skip_defaults)
+
+
+def _copy_items(v: Any, include: Optional[ItemsSpec], exclude: Optional[ItemsSpec]) -> Any:
+    """
+    Apply nested include and exclude to a value for copy().
+    """
+    if isinstance(type(v), MetaModel):
+        return v.copy(include=include, exclude=exclude)
+    elif isinstance(v, dict):
+        return {k_: _copy_items(v_, i, e) for k_, v_, i, e in _select_items(v.items(), include, exclude)}
+    elif isinstance(v, (list, tuple)):
+        items = [_copy_items(v_, i, e) for _, v_, i, e in _select_items(enumerate(v), include, exclude)]
+        return items if isinstance(v, list) else tuple(items)
+    return v
+
+
+def _json_pieces(
+    v: Any,
+    by_alias: bool,
+    skip_defaults: bool,
+    include: Optional[ItemsSpec],
+    exclude: Optional[ItemsSpec],
+    encode: Callable[[Any], str],
+    separators: Tuple[str, str],
+) -> Iterator[str]:
+    """
+    Generate the JSON of a model, list, tuple or dict in pieces for json_stream(). Values without sub-models or
+    containers are encoded whole by _json_leaf(), pieces are joined and yielded before descending into other values
+    and after every JSON_BATCH_SIZE pieces so memory use stays bounded however large the value is.
+    """
+    item_separator, key_separator = separators
+    items: Iterable[Tuple[Optional[str], Any, Optional[ItemsSpec], Optional[ItemsSpec]]]
+    if isinstance(type(v), MetaModel) and not v._writes_json():
+        v = v.dict(include=include, exclude=exclude, by_alias=by_alias, skip_defaults=skip_defaults)
+        include = exclude = None
+    if isinstance(type(v), MetaModel):
+        start, end = '{', '}'
+        items = (
+            (encode(key), v_, _sub_spec(include.get(k)) if include else None, exclude.get(k) if exclude else None)
+            for k, key, v_ in _model_items(v, by_alias, skip_defaults, include, exclude)
+        )
+    elif isinstance(v, dict):
+        start, end = '{', '}'
+        items = (
+            (_json_key(k, encode, key_separator), v_, i, e)
+            for k, v_, i, e in _select_items(v.items(), include, exclude)
+        )
+    else:
+        start, end = '[', ']'
+        items = ((None, v_, i, e) for _, v_, i, e in _select_items(enumerate(v), include, exclude))
+
+    pieces = [start]
+    for i, (key, v_, sub_include, sub_exclude) in enumerate(items):
+        if i:
+            pieces.append(item_separator)
+        if key is not None:
+            pieces += (key, key_separator)
+        leaf = _json_leaf(v_, by_alias, skip_defaults, sub_include, sub_exclude, encode)
+        if leaf is None:
+            yield ''.join(pieces)
+            pieces = []
+            yield from _json_pieces(v_, by_alias, skip_defaults, sub_include, sub_exclude, encode, separators)
+        else:
+            pieces.append(leaf)
+            if len(pieces) > JSON_BATCH_SIZE:
+                yield ''.join(pieces)
+                pieces = []
+    pieces.append(end)
+    yield ''.join(pieces)
+
+
+def _json_leaf(
+    v: Any,
+    by_alias: bool,
+    skip_defaults: bool,
+    include: Optional[ItemsSpec],
+    exclude: Optional[ItemsSpec],
+    encode: Callable[[Any], str],
+) -> Optional[str]:
+    """
+    Encode a value for json_stream() in one go if it isn't a list, tuple or dict and it's not a model containing one
+    of those or another model, otherwise None.
+    """
+    if isinstance(type(v), MetaModel):
+        if v._writes_json():
+            keys = v._calculate_keys(include=include, exclude=exclude, skip_defaults=skip_defaults)
+            d = v.__serialize_values__(v, keys, by_alias, skip_defaults, include, exclude)
+        else:
+            d = v.dict(include=include, exclude=exclude, by_alias=by_alias, skip_defaults=skip_defaults)
+        for v_ in d.values():
+            # sub-models are dicts by now
+            if isinstance(v_, (dict, list, tuple)):
+                return None
+        return encode(d)
+    elif isinstance(v, (dict, list, tuple)):
+        return None
+    return encode(v)
+
+
+def _model_items(
+    m: 'BaseModel', by_alias: bool, skip_defaults: bool, include: Optional[ItemsSpec], exclude: Optional[ItemsSpec]
+) -> List[Tuple[str, str, Any]]:
+    """
+    The name, key in the output and value of each field of a model to include in json_stream() output.
+    """
+    keys = m._calculate_keys(include=include, exclude=exclude, skip_defaults=skip_defaults)
+    fields = m.__fields__
+    items = []
+    for k, v in m.__values__.items():
+        if keys is not None and k not in keys:
+            continue
+        if type(v) is LazyValue:
+            v = m._validate_lazy(k, v)
+        items.append((k, fields[k].alias if by_alias and k in fields else k, v))
+    return items
+
+
+def _json_key(k: Any, encode: Callable[[Any], str], key_separator: str) -> str:
+    if isinstance(k, str):
+        return encode(k)
+    # other keys json allows (numbers, bools and None) are converted to strings in its own way
+    end = -len(key_separator) - len('null}')
+    return encode({k: None})[1:end]
+
+
+def _unprepared_validator(model_name: str, field_name: str, input_data: 'DictStrAny', cls: Any, defer: bool) -> Any:
+    raise ConfigError(
+        f'field "{field_name}" not yet prepared so type is still a ForwardRef, '
+        f'you might need to call {model_name}.update_forward_refs().'
+    )
+
+
 TYPE_BLACKLIST = FunctionType, property, type, classmethod, staticmethod
 
 
@@ -159,8 +687,8 @@ class MetaModel(ABCMeta):
             extra_validators = vg.get_validators(f.name)
             if extra_validators:
                 f.class_validators.update(extra_validators)
-                # re-run prepare to add extra validators
-                f.prepare()
+            # re-run prepare to add extra validators and since validators are chosen based on config
+            f.prepare()
 
         set_extra(config, name)
         annotations = namespace.get('__annotations__', {})
@@ -198,22 +726,22 @@ class MetaModel(ABCMeta):
                 )
 
         vg.check_for_unused()
-        if config.json_encoders:
-            json_encoder = partial(custom_pydantic_encoder, config.json_encoders)
-        else:
-            json_encoder = pydantic_encoder
+        json_encoder = make_encoder(config.json_encoders) if config.json_encoders else pydantic_encoder
         new_namespace = {
             '__config__': config,
             '__fields__': fields,
             '__validators__': vg.validators,
             '_schema_cache': {},
             '_json_encoder': staticmethod(json_encoder),
+            '_json_writers': {},
             **{n: v for n, v in namespace.items() if n not in fields},
         }
-        return super().__new__(mcs, name, bases, new_namespace)
-
-
-_missing = object()
+        cls = super().__new__(mcs, name, bases, new_namespace)
+        cls.__validate_values__ = staticmethod(compile_model_validator(cls))
+        cls.__construct_values__ = staticmethod(compile_model_constructor(cls))
+        cls.__serialize_values__ = staticmethod(compile_model_serializer(cls))
+        cls.__json_keys__ = json_keys(cls)
+        return cls
 
 
 class BaseModel(metaclass=MetaModel):
@@ -222,7 +750,12 @@ class BaseModel(metaclass=MetaModel):
         __fields__: Dict[str, Field] = {}
         __validators__: Dict[str, AnyCallable] = {}
         __config__: Type[BaseConfig] = BaseConfig
+        __validate_values__: 'ModelValidator'
+        __construct_values__: 'ModelConstructor'
+        __serialize_values__: 'ModelSerializer'
+        __json_keys__: 'JSONKeys'
         _json_encoder: Callable[[Any], Any] = lambda x: x
+        _json_writers: Dict[Tuple[bool, bool], JSONWriter] = {}
         _schema_cache: 'DictAny' = {}
 
     Config = BaseConfig
@@ -232,19 +765,33 @@ class BaseModel(metaclass=MetaModel):
         if TYPE_CHECKING:  # pragma: no cover
             self.__values__: Dict[str, Any] = {}
             self.__fields_set__: 'SetStr' = set()
-        object.__setattr__(self, '__values__', self._process_values(data))
+        self._init_values(self._process_values(data), data)
+
+    def _init_values(self, values: 'DictStrAny', data: 'DictStrAny') -> None:
+        object.__setattr__(self, '__values__', values)
         if self.__config__.extra is Extra.allow:
             fields_set = set(data.keys())
         else:
-            fields_set = data.keys() & self.__values__.keys()  # type: ignore
+            fields_set = data.keys() & values.keys()
         object.__setattr__(self, '__fields_set__', fields_set)
 
     @no_type_check
     def __getattr__(self, name):
         try:
-            return self.__values__[name]
+            value = self.__values__[name]
         except KeyError:
             raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+        if type(value) is LazyValue:
+            return self._validate_lazy(name, value)
+        return value
+
+    def _validate_lazy(self, name: str, value: LazyValue) -> Any:
+        field = self.__fields__[name]
+        value_, error_ = field.validate(value.raw, {}, loc=field.alias, cls=self.__class__)
+        if error_:
+            raise ValidationError([error_])
+        self.__values__[name] = value_
+        return value_
 
     @no_type_check
     def __setattr__(self, name, value):
@@ -271,33 +818,23 @@ class BaseModel(metaclass=MetaModel):
         object.__setattr__(self, '__fields_set__', state['__fields_set__'])
 
     def dict(
-        self, *, include: 'SetStr' = None, exclude: 'SetStr' = None, by_alias: bool = False, skip_defaults: bool = False
+        self, *, include: 'IncEx' = None, exclude: 'IncEx' = None, by_alias: bool = False, skip_defaults: bool = False
     ) -> 'DictStrAny':
         """
         Generate a dictionary representation of the model, optionally specifying which fields to include or exclude.
-        """
-        get_key = self._get_key_factory(by_alias)
-        get_key = partial(get_key, self.fields)
 
-        return_keys = self._calculate_keys(include=include, exclude=exclude, skip_defaults=skip_defaults)
-        if return_keys is None:
-            return {get_key(k): v for k, v in self._iter(by_alias=by_alias, skip_defaults=skip_defaults)}
-        else:
-            return {
-                get_key(k): v for k, v in self._iter(by_alias=by_alias, skip_defaults=skip_defaults) if k in return_keys
-            }
-
-    def _get_key_factory(self, by_alias: bool) -> Callable[..., str]:
-        if by_alias:
-            return lambda fields, key: fields[key].alias if key in fields else key
-
-        return lambda _, key: key
+        ``include`` and ``exclude`` may be sets of field names or dicts which also choose the fields of sub-models
+        and items of lists, tuples and dicts, see normalize_items().
+        """
+        include_, exclude_ = normalize_items(include), normalize_items(exclude)
+        keys = self._calculate_keys(include=include_, exclude=exclude_, skip_defaults=skip_defaults)
+        return self.__serialize_values__(self, keys, by_alias, skip_defaults, include_, exclude_)
 
     def json(
         self,
         *,
-        include: 'SetStr' = None,
-        exclude: 'SetStr' = None,
+        include: 'IncEx' = None,
+        exclude: 'IncEx' = None,
         by_alias: bool = False,
         skip_defaults: bool = False,
         encoder: Optional[Callable[[Any], Any]] = None,
@@ -308,22 +845,216 @@ class BaseModel(metaclass=MetaModel):
 
         `encoder` is an optional function to supply as `default` to json.dumps(), other arguments as per `json.dumps()`.
         """
-        encoder = cast(Callable[[Any], Any], encoder or self._json_encoder)
-        return json.dumps(
+        dumps = self.__config__.json_dumps or self._json_backend(encoder).dumps
+        if dumps is json.dumps and include is None and exclude is None and not dumps_kwargs and self._writes_json():
+            return self._json_writer(by_alias, skip_defaults, encoder).dumps(self)
+        return dumps(
             self.dict(include=include, exclude=exclude, by_alias=by_alias, skip_defaults=skip_defaults),
-            default=encoder,
+            default=encoder or self._json_encoder,
             **dumps_kwargs,
         )
 
+    def json_bytes(
+        self,
+        *,
+        include: 'IncEx' = None,
+        exclude: 'IncEx' = None,
+        by_alias: bool = False,
+        skip_defaults: bool = False,
+        encoder: Optional[Callable[[Any], Any]] = None,
+        **dumps_kwargs: Any,
+    ) -> bytes:
+        """
+        As ``json()`` but returning UTF-8 ``bytes``, backends which produce bytes (eg. orjson) are used without
+        decoding and encoding again.
+        """
+        if self.__config__.json_dumps:
+            return self.json(
+                include=include,
+                exclude=exclude,
+                by_alias=by_alias,
+                skip_defaults=skip_defaults,
+                encoder=encoder,
+                **dumps_kwargs,
+            ).encode()
+        backend = self._json_backend(encoder)
+        if (
+            backend.dumps is json.dumps
+            and include is None
+            and exclude is None
+            and not dumps_kwargs
+            and self._writes_json()
+        ):
+            # output is ASCII
+            return self._json_writer(by_alias, skip_defaults, encoder).dumps(self).encode()
+        d = self.dict(include=include, exclude=exclude, by_alias=by_alias, skip_defaults=skip_defaults)
+        return backend.dumps_bytes(d, default=encoder or self._json_encoder, **dumps_kwargs)
+
+    @classmethod
+    def _json_backend(cls, encoder: Optional[Callable[[Any], Any]]) -> JSONBackend:
+        return get_dumps_backend(cls.__config__.json_encoders, custom_encoder=encoder is not None)
+
+    @classmethod
+    def _writes_json(cls) -> bool:
+        # json() and json_stream() serialise a model which overrides dict() from its output
+        return cls.dict is BaseModel.dict
+
     @classmethod
-    def parse_obj(cls: Type['Model'], obj: Mapping[Any, Any]) -> 'Model':
+    def _json_writer(cls, by_alias: bool, skip_defaults: bool, encoder: Optional[Callable[[Any], Any]]) -> JSONWriter:
+        """
+        JSONWriter for json() and json_bytes() with the standard library, writers (and the functions they find for
+        each type) are kept for the model's own encoder.
+        """
+        if encoder is not None:
+            return JSONWriter(encoder, by_alias=by_alias, skip_defaults=skip_defaults)
+        try:
+            return cls._json_writers[(by_alias, skip_defaults)]
+        except KeyError:
+            writer = JSONWriter(cls._json_encoder, by_alias=by_alias, skip_defaults=skip_defaults)
+            return cls._json_writers.setdefault((by_alias, skip_defaults), writer)
+
+    def json_stream(
+        self,
+        fp: Optional[IO[str]] = None,
+        *,
+        include: 'IncEx' = None,
+        exclude: 'IncEx' = None,
+        by_alias: bool = False,
+        skip_defaults: bool = False,
+        encoder: Optional[Callable[[Any], Any]] = None,
+        chunk_size: int = 65536,
+    ) -> Optional[Iterator[str]]:
+        """
+        Generate the same JSON as ``json()`` with no ``dumps_kwargs``, in chunks of at least ``chunk_size``
+        characters (except the last), without building a dict of the whole model first (though models which override
+        ``dict()`` are serialised from its output).
+
+        If ``fp`` is given chunks are written to it, otherwise an iterator of chunks is returned.
+        """
+        chunks = self._json_chunks(include, exclude, by_alias, skip_defaults, encoder, chunk_size)
+        if fp is None:
+            return chunks
+        for chunk in chunks:
+            fp.write(chunk)
+        return None
+
+    def _json_chunks(
+        self,
+        include: Optional['IncEx'],
+        exclude: Optional['IncEx'],
+        by_alias: bool,
+        skip_defaults: bool,
+        encoder: Optional[Callable[[Any], Any]],
+        chunk_size: int,
+    ) -> Iterator[str]:
+        dumps = self.__config__.json_dumps or self._json_backend(encoder).dumps
+        encode = make_encode(dumps, encoder or self._json_encoder)
+        pieces = _json_pieces(
+            self,
+            by_alias,
+            skip_defaults,
+            normalize_items(include),
+            normalize_items(exclude),
+            encode,
+            dumps_separators(dumps),
+        )
+        buffer: List[str] = []
+        size = 0
+        for piece in pieces:
+            buffer.append(piece)
+            size += len(piece)
+            if size >= chunk_size:
+                yield ''.join(buffer)
+                buffer, size = [], 0
+        if buffer:
+            yield ''.join(buffer)
+
+    @classmethod
+    def parse_obj(cls: Type['Model'], obj: Mapping[Any, Any], *, fail_fast: Optional[bool] = None) -> 'Model':
+        """
+        Create a new model from a dict or dict-like object.
+
+        :param fail_fast: override ``Config.fail_fast`` for this model and all sub-models while validating ``obj``
+        """
         if not isinstance(obj, dict):
             try:
                 obj = dict(obj)
             except (TypeError, ValueError) as e:
                 exc = TypeError(f'{cls.__name__} expected dict not {type(obj).__name__}')
                 raise ValidationError([ErrorWrapper(exc, loc='__obj__')]) from e
-        return cls(**obj)
+        if fail_fast is None:
+            return cls(**obj)
+        with override_fail_fast(fail_fast):
+            return cls(**obj)
+
+    @classmethod
+    def parse_many(
+        cls: Type['Model'], data: Iterable[Any], *, raise_on_error: bool = False
+    ) -> Tuple[List['Model'], List[Tuple[int, ValidationError]]]:
+        """
+        Validate many dicts (or dict-like objects) against this model, setup is done once for the whole batch and
+        ``data`` is consumed lazily so it may be a generator.
+
+        :param data: iterable of objects to validate
+        :param raise_on_error: raise a ValidationError for the first invalid object rather than collecting errors
+        :return: tuple of models created from valid objects and a list of ``(index, ValidationError)`` for invalid ones
+        """
+        models: List['Model'] = []
+        errors: List[Tuple[int, ValidationError]] = []
+        for index, result in enumerate(cls._validate_many(data)):
+            if isinstance(result, ValidationError):
+                if raise_on_error:
+                    raise ValidationError([ErrorWrapper(result, loc=(index,))])  # type: ignore
+                errors.append((index, result))
+            else:
+                models.append(result)
+        return models, errors
+
+    @classmethod
+    def validate_columns(
+        cls, columns: Mapping[str, Sequence[Any]]
+    ) -> Tuple['DictStrAny', Any, List[Tuple[int, ValidationError]]]:
+        """
+        Validate data held as columns rather than rows, eg. numpy arrays keyed by field alias, see
+        ``pydantic.columns.validate_columns``.
+
+        :return: tuple of validated columns, a per-row error mask and a list of ``(index, ValidationError)``
+        """
+        from .columns import validate_columns
+
+        return validate_columns(cls, columns)
+
+    @classmethod
+    def _validate_many(
+        cls: Type['Model'], data: Iterable[Any]
+    ) -> Generator[Union['Model', ValidationError], None, None]:
+        if cls.__init__ is not BaseModel.__init__:
+            # custom __init__ methods (eg. on BaseSettings) need to be called for each model
+            for obj in data:
+                try:
+                    yield cls.parse_obj(obj)
+                except ValidationError as e:
+                    yield e
+            return
+
+        new_model = cls.__new__
+        for obj in data:
+            if not isinstance(obj, dict):
+                try:
+                    obj = dict(obj)
+                except (TypeError, ValueError):
+                    exc = TypeError(f'{cls.__name__} expected dict not {type(obj).__name__}')
+                    yield ValidationError([ErrorWrapper(exc, loc='__obj__')])
+                    continue
+
+            m = new_model(cls)
+            try:
+                values = m._process_values(obj)
+            except ValidationError as e:
+                yield e
+                continue
+            m._init_values(values, obj)
+            yield m
 
     @classmethod
     def parse_raw(
@@ -334,14 +1065,20 @@ class BaseModel(metaclass=MetaModel):
         encoding: str = 'utf8',
         proto: Protocol = None,
         allow_pickle: bool = False,
+        fail_fast: Optional[bool] = None,
     ) -> 'Model':
         try:
             obj = load_str_bytes(
-                b, proto=proto, content_type=content_type, encoding=encoding, allow_pickle=allow_pickle
+                b,
+                proto=proto,
+                content_type=content_type,
+                encoding=encoding,
+                allow_pickle=allow_pickle,
+                json_loads=cls.__config__.json_loads or json_loads,
             )
         except (ValueError, TypeError, UnicodeDecodeError) as e:
             raise ValidationError([ErrorWrapper(e, loc='__obj__')])
-        return cls.parse_obj(obj)
+        return cls.parse_obj(obj, fail_fast=fail_fast)
 
     @classmethod
     def parse_file(
@@ -352,9 +1089,17 @@ class BaseModel(metaclass=MetaModel):
         encoding: str = 'utf8',
         proto: Protocol = None,
         allow_pickle: bool = False,
+        fail_fast: Optional[bool] = None,
     ) -> 'Model':
-        obj = load_file(path, proto=proto, content_type=content_type, encoding=encoding, allow_pickle=allow_pickle)
-        return cls.parse_obj(obj)
+        obj = load_file(
+            path,
+            proto=proto,
+            content_type=content_type,
+            encoding=encoding,
+            allow_pickle=allow_pickle,
+            json_loads=cls.__config__.json_loads or json_loads,
+        )
+        return cls.parse_obj(obj, fail_fast=fail_fast)
 
     @classmethod
     def construct(cls: Type['Model'], values: 'DictAny', fields_set: 'SetStr') -> 'Model':
@@ -367,18 +1112,27 @@ class BaseModel(metaclass=MetaModel):
         object.__setattr__(m, '__fields_set__', fields_set)
         return m
 
+    @classmethod
+    def from_trusted(cls: Type['Model'], obj: Mapping[str, Any]) -> 'Model':
+        """
+        Create a new model from trusted data (eg. the output of ``dict()``) without any validation. Unlike
+        ``construct`` sub-models, including those in lists, dicts and unions, are created from dicts, fields missing
+        from ``obj`` are set to their defaults and ``__fields_set__`` is set to the fields present in ``obj``.
+        """
+        return cls.construct(*cls.__construct_values__(obj))
+
     def copy(
         self: 'Model',
         *,
-        include: 'SetStr' = None,
-        exclude: 'SetStr' = None,
+        include: 'IncEx' = None,
+        exclude: 'IncEx' = None,
         update: 'DictStrAny' = None,
         deep: bool = False,
     ) -> 'Model':
         """
         Duplicate a model, optionally choose which fields to include, exclude and change.
 
-        :param include: fields to include in new model
+        :param include: fields to include in new model, as with dict() this may choose fields of sub-models too
         :param exclude: fields to exclude from new model, as with values this takes precedence over include
         :param update: values to change/add in the new model. Note: the data is not validated before creating
             the new model: you should trust this data
@@ -389,11 +1143,18 @@ class BaseModel(metaclass=MetaModel):
             # skip constructing values if no arguments are passed
             v = self.__values__
         else:
-            return_keys = self._calculate_keys(include=include, exclude=exclude, skip_defaults=False)
+            include_, exclude_ = normalize_items(include), normalize_items(exclude)
+            return_keys = self._calculate_keys(include=include_, exclude=exclude_, skip_defaults=False)
             if return_keys:
-                v = {**{k: v for k, v in self.__values__.items() if k in return_keys}, **(update or {})}
+                v = {k: v for k, v in self.__values__.items() if k in return_keys}
             else:
-                v = {**self.__values__, **(update or {})}
+                v = dict(self.__values__)
+            for k, v_ in v.items():
+                sub_include = include_ and include_.get(k)
+                sub_exclude = exclude_ and exclude_.get(k)
+                if (sub_include and sub_include is not ...) or sub_exclude:
+                    v[k] = _copy_items(v_, _sub_spec(sub_include), sub_exclude)
+            v.update(update or {})
 
         if deep:
             v = deepcopy(v)
@@ -417,7 +1178,8 @@ class BaseModel(metaclass=MetaModel):
     def schema_json(cls, *, by_alias: bool = True, **dumps_kwargs: Any) -> str:
         from .json import pydantic_encoder
 
-        return json.dumps(cls.schema(by_alias=by_alias), default=pydantic_encoder, **dumps_kwargs)
+        dumps = cls.__config__.json_dumps or get_dumps_backend().dumps
+        return dumps(cls.schema(by_alias=by_alias), default=pydantic_encoder, **dumps_kwargs)
 
     @classmethod
     def __get_validators__(cls) -> 'CallableGenerator':
@@ -434,23 +1196,12 @@ class BaseModel(metaclass=MetaModel):
                 return cls(**dict(value))  # type: ignore
 
     def _process_values(self, input_data: Any) -> 'DictStrAny':
-        # (casting here is slow so use ignore)
-        return validate_model(self, input_data)  # type: ignore
-
-    @classmethod
-    def _get_value(cls, v: Any, by_alias: bool, skip_defaults: bool) -> Any:
-        if isinstance(v, BaseModel):
-            return v.dict(by_alias=by_alias, skip_defaults=skip_defaults)
-        elif isinstance(v, list):
-            return [cls._get_value(v_, by_alias=by_alias, skip_defaults=skip_defaults) for v_ in v]
-        elif isinstance(v, dict):
-            return {k_: cls._get_value(v_, by_alias=by_alias, skip_defaults=skip_defaults) for k_, v_ in v.items()}
-        elif isinstance(v, set):
-            return {cls._get_value(v_, by_alias=by_alias, skip_defaults=skip_defaults) for v_ in v}
-        elif isinstance(v, tuple):
-            return tuple(cls._get_value(v_, by_alias=by_alias, skip_defaults=skip_defaults) for v_ in v)
-        else:
-            return v
+        # lazy fields are only deferred here since only model instances validate LazyValues when they're accessed,
+        # validate_model() and dataclasses validate every field
+        values, errors = self.__validate_values__(input_data, self.__class__, True)
+        if errors:
+            raise ValidationError(errors)
+        return values
 
     @classmethod
     def update_forward_refs(cls, **localns: Any) -> None:
@@ -461,6 +1212,9 @@ class BaseModel(metaclass=MetaModel):
         globalns.setdefault(cls.__name__, cls)
         for f in cls.__fields__.values():
             update_field_forward_refs(f, globalns=globalns, localns=localns)
+        cls.__validate_values__ = staticmethod(compile_model_validator(cls))
+        cls.__construct_values__ = staticmethod(compile_model_constructor(cls))
+        cls.__serialize_values__ = staticmethod(compile_model_serializer(cls))
 
     def __iter__(self) -> 'AnyGenerator':
         """
@@ -470,10 +1224,12 @@ class BaseModel(metaclass=MetaModel):
 
     def _iter(self, by_alias: bool = False, skip_defaults: bool = False) -> 'TupleGenerator':
         for k, v in self.__values__.items():
-            yield k, self._get_value(v, by_alias=by_alias, skip_defaults=skip_defaults)
+            if type(v) is LazyValue:
+                v = self._validate_lazy(k, v)
+            yield k, _serialize_value(v, by_alias, skip_defaults)
 
     def _calculate_keys(
-        self, include: 'SetStr' = None, exclude: Optional['SetStr'] = None, skip_defaults: bool = False
+        self, include: Optional['IncEx'] = None, exclude: Optional['IncEx'] = None, skip_defaults: bool = False
     ) -> Optional['SetStr']:
 
         if include is None and exclude is None and skip_defaults is False:
@@ -485,10 +1241,11 @@ class BaseModel(metaclass=MetaModel):
             keys = set(self.__values__.keys())
 
         if include:
-            keys &= include
+            keys &= set(include)
 
         if exclude:
-            keys -= exclude
+            # for dicts, keys with nested excludes are kept
+            keys -= {k for k, v in exclude.items() if v is ...} if isinstance(exclude, dict) else set(exclude)
 
         return keys
 
@@ -574,59 +1331,15 @@ def create_model(  # noqa: C901 (ignore complexity)
     return type(model_name, (__base__,), namespace)  # type: ignore
 
 
-def validate_model(  # noqa: C901 (ignore complexity)
+def validate_model(
     model: Union[BaseModel, Type[BaseModel]], input_data: 'DictStrAny', raise_exc: bool = True, cls: 'ModelOrDc' = None
 ) -> Union['DictStrAny', Tuple['DictStrAny', Optional[ValidationError]]]:
     """
     validate data against a model.
     """
-    values = {}
-    errors = []
-    names_used = set()
-    config = model.__config__
-    check_extra = config.extra is not Extra.ignore
-
-    for name, field in model.__fields__.items():
-        if type(field.type_) == ForwardRef:
-            raise ConfigError(
-                f'field "{field.name}" not yet prepared so type is still a ForwardRef, '
-                f'you might need to call {model.__class__.__name__}.update_forward_refs().'
-            )
-
-        value = input_data.get(field.alias, _missing)
-        using_name = False
-        if value is _missing and config.allow_population_by_alias and field.alt_alias:
-            value = input_data.get(field.name, _missing)
-            using_name = True
-
-        if value is _missing:
-            if field.required:
-                errors.append(ErrorWrapper(MissingError(), loc=field.alias, config=model.__config__))
-                continue
-            value = deepcopy(field.default)
-            if not model.__config__.validate_all and not field.validate_always:
-                values[name] = value
-                continue
-        elif check_extra:
-            names_used.add(field.name if using_name else field.alias)
-
-        v_, errors_ = field.validate(value, values, loc=field.alias, cls=cls or model.__class__)  # type: ignore
-        if isinstance(errors_, ErrorWrapper):
-            errors.append(errors_)
-        elif isinstance(errors_, list):
-            errors.extend(errors_)
-        else:
-            values[name] = v_
-
-    if check_extra:
-        extra = input_data.keys() - names_used
-        if extra:
-            if config.extra is Extra.allow:
-                for f in extra:
-                    values[f] = input_data[f]
-            else:
-                for f in sorted(extra):
-                    errors.append(ErrorWrapper(ExtraError(), loc=f, config=config))
+    if cls is None:
+        cls = model if isinstance(model, type) else model.__class__
+    values, errors = model.__validate_values__(input_data, cls, False)
 
     if not raise_exc:
         return values, ValidationError(errors) if errors else None
@@ -70,6 +70,8 @@ class Schema:
 
     :param default: since the Schema is replacing the field’s default, its first argument is used
       to set the default, use ellipsis (``...``) to indicate the field is required
+    :param default_factory: a function called with no arguments to create the default value each time it's needed,
+      eg. ``list``, can't be used with ``default``
     :param alias: the public name of the field
     :param title: can be any string, used in the schema
     :param description: can be any string, used in the schema
@@ -90,11 +92,16 @@ class Schema:
       schema will have a ``maxLength`` validation keyword
     :param regex: only applies to strings, requires the field match agains a regular expression
       pattern string. The schema will have a ``pattern`` validation keyword
+    :param lazy: whether to validate this field when it's first accessed rather than when the model is created,
+      overrides ``Config.lazy_submodels``
+    :param validator_cache_size: maximum number of validation results to cache for this field, overrides
+      ``Config.validator_cache_size``
     :param **extra: any additional keyword arguments will be added as is to the schema
     """
 
     __slots__ = (
         'default',
+        'default_factory',
         'alias',
         'title',
         'description',
@@ -107,13 +114,16 @@ class Schema:
         'min_length',
         'max_length',
         'regex',
+        'lazy',
+        'validator_cache_size',
         'extra',
     )
 
     def __init__(
         self,
-        default: Any,
+        default: Any = None,
         *,
+        default_factory: Callable[[], Any] = None,
         alias: str = None,
         title: str = None,
         description: str = None,
@@ -126,9 +136,14 @@ class Schema:
         min_length: int = None,
         max_length: int = None,
         regex: str = None,
+        lazy: bool = None,
+        validator_cache_size: int = None,
         **extra: Any,
     ) -> None:
+        if default_factory is not None and default is not None:
+            raise ValueError('cannot specify both default and default_factory')
         self.default = default
+        self.default_factory = default_factory
         self.alias = alias
         self.title = title
         self.description = description
@@ -142,6 +157,8 @@ class Schema:
         self.min_length = min_length
         self.max_length = max_length
         self.regex = regex
+        self.lazy = lazy
+        self.validator_cache_size = validator_cache_size
 
     def __repr__(self) -> str:
         attrs = ((s, getattr(self, s)) for s in self.__slots__)
@@ -658,13 +675,23 @@ def field_singleton_schema(  # noqa: C901 (ignore complexity)
     ref_prefix = ref_prefix or default_prefix
     definitions: Dict[str, Any] = {}
     if field.sub_fields:
-        return field_singleton_sub_fields_schema(
+        sub_schema, definitions = field_singleton_sub_fields_schema(
             field.sub_fields,
             by_alias=by_alias,
             model_name_map=model_name_map,
             schema_overrides=schema_overrides,
             ref_prefix=ref_prefix,
         )
+        if field.discriminator:
+            mapping = {
+                str(tag.value if isinstance(tag, Enum) else tag): f'{ref_prefix}{model_name_map[members[0].type_]}'
+                for tag, members in cast(Dict[Any, List[Field]], field.sub_fields_by_tag).items()
+            }
+            sub_schema = {
+                'oneOf': sub_schema['anyOf'],
+                'discriminator': {'propertyName': field.discriminator, 'mapping': mapping},
+            }
+        return sub_schema, definitions
     if field.type_ is Any:
         return {}, definitions  # no restrictions
     if is_callable_type(field.type_):
@@ -1,4 +1,3 @@
-import json
 import re
 from decimal import Decimal
 from ipaddress import (
@@ -16,19 +15,20 @@ from typing import TYPE_CHECKING, Any, Callable, Dict, Generator, Optional, Patt
 from uuid import UUID
 
 from . import errors
-from .utils import AnyType, change_exception, import_string, make_dsn, url_regex_generator, validate_email
+from .json_backend import json_loads
+from .utils import AnyType, import_string, make_dsn, url_regex_generator, validate_email
 from .validators import (
-    anystr_length_validator,
-    anystr_strip_whitespace,
     bytes_validator,
     decimal_validator,
     float_validator,
     int_validator,
+    make_anystr_validator,
+    make_decimal_validator,
+    make_number_validator,
     not_none_validator,
-    number_multiple_validator,
-    number_size_validator,
     path_exists_validator,
     path_validator,
+    str_intern_validator,
     str_validator,
 )
 
@@ -90,12 +90,41 @@ NetworkType = Union[str, bytes, int, Tuple[Union[str, bytes, int], Union[str, in
 
 if TYPE_CHECKING:  # pragma: no cover
     from .dataclasses import DataclassType  # noqa: F401
-    from .main import BaseModel  # noqa: F401
+    from .main import BaseConfig, BaseModel  # noqa: F401
     from .utils import AnyCallable
 
     CallableGenerator = Generator[AnyCallable, None, None]
     ModelOrDc = Type[Union['BaseModel', 'DataclassType']]
 
+# classes created by the constrained type functions below (constr, conint etc.), keyed by base and arguments
+_constrained_types: Dict[Tuple[Any, ...], type] = {}
+
+
+def _constrained_type(name: str, base: type, namespace: Dict[str, Any]) -> Any:
+    """
+    Create a subclass of base with namespace as class attributes, identical arguments give the same class so
+    constraints declared in many places don't each create (and prepare validators for) a new class.
+    """
+    # types are part of the key since eg. 1, 1.0 and True are equal, decimals are compared as strings so eg.
+    # Decimal('1.0') isn't reported in schemas and errors as Decimal('1')
+    key: Optional[Tuple[Any, ...]] = (
+        base,
+        *((k, type(v), str(v) if isinstance(v, Decimal) else v) for k, v in namespace.items()),
+    )
+    try:
+        return _constrained_types[key]  # type: ignore
+    except KeyError:
+        pass
+    except TypeError:
+        # an unhashable argument, the class can't be cached
+        key = None
+
+    if namespace.get('regex'):
+        # compiled here so it's done once for each class
+        namespace['regex'] = re.compile(namespace['regex'])
+    type_ = type(name, (base,), namespace)
+    return type_ if key is None else _constrained_types.setdefault(key, type_)
+
 
 class StrictStr(str):
     @classmethod
@@ -118,14 +147,15 @@ class ConstrainedBytes(bytes):
     def __get_validators__(cls) -> 'CallableGenerator':
         yield not_none_validator
         yield bytes_validator
-        yield anystr_strip_whitespace
-        yield anystr_length_validator
+        validator = make_anystr_validator(cls)
+        if validator:
+            yield validator
 
 
 def conbytes(*, strip_whitespace: bool = False, min_length: int = None, max_length: int = None) -> Type[bytes]:
     # use kwargs then define conf in a dict to aid with IDE type hinting
     namespace = dict(strip_whitespace=strip_whitespace, min_length=min_length, max_length=max_length)
-    return type('ConstrainedBytesValue', (ConstrainedBytes,), namespace)
+    return _constrained_type('ConstrainedBytesValue', ConstrainedBytes, namespace)
 
 
 class ConstrainedStr(str):
@@ -134,25 +164,28 @@ class ConstrainedStr(str):
     max_length: OptionalInt = None
     curtail_length: OptionalInt = None
     regex: Optional[Pattern[str]] = None
+    intern: Optional[bool] = None
 
     @classmethod
     def __get_validators__(cls) -> 'CallableGenerator':
         yield not_none_validator
         yield str_validator
-        yield anystr_strip_whitespace
-        yield anystr_length_validator
-        yield cls.validate
+        if cls.validate.__func__ is not ConstrainedStr.validate.__func__:  # type: ignore
+            # validate() is overridden, it can call super().validate() to apply the constraints
+            yield cls.validate
+        else:
+            validator = make_anystr_validator(cls)
+            if validator:
+                yield validator
+        yield str_intern_validator
 
     @classmethod
     def validate(cls, value: str) -> str:
-        if cls.curtail_length and len(value) > cls.curtail_length:
-            value = value[: cls.curtail_length]
-
-        if cls.regex:
-            if not cls.regex.match(value):
-                raise errors.StrRegexError(pattern=cls.regex.pattern)
-
-        return value
+        """
+        Apply the constraints to a ``str`` with the validator used by fields, built on each call.
+        """
+        validator = make_anystr_validator(cls)
+        return cast(str, validator(value)) if validator else value
 
 
 def constr(
@@ -162,6 +195,7 @@ def constr(
     max_length: int = None,
     curtail_length: int = None,
     regex: str = None,
+    intern: bool = None,
 ) -> Type[str]:
     # use kwargs then define conf in a dict to aid with IDE type hinting
     namespace = dict(
@@ -169,9 +203,10 @@ def constr(
         min_length=min_length,
         max_length=max_length,
         curtail_length=curtail_length,
-        regex=regex and re.compile(regex),
+        regex=regex,
+        intern=intern,
     )
-    return type('ConstrainedStrValue', (ConstrainedStr,), namespace)
+    return _constrained_type('ConstrainedStrValue', ConstrainedStr, namespace)
 
 
 class EmailStr(str):
@@ -201,8 +236,9 @@ class UrlStr(str):
     def __get_validators__(cls) -> 'CallableGenerator':
         yield not_none_validator
         yield str_validator
-        yield anystr_strip_whitespace
-        yield anystr_length_validator
+        validator = make_anystr_validator(cls)
+        if validator:
+            yield validator
         yield cls.validate
 
     @classmethod
@@ -237,9 +273,9 @@ def urlstr(
         max_length=max_length,
         relative=relative,
         require_tld=require_tld,
-        schemes=schemes,
+        schemes=schemes and frozenset(schemes),
     )
-    return type('UrlStrValue', (UrlStr,), namespace)
+    return _constrained_type('UrlStrValue', UrlStr, namespace)
 
 
 class NameEmail:
@@ -336,14 +372,15 @@ class ConstrainedInt(int, metaclass=ConstrainedNumberMeta):
     @classmethod
     def __get_validators__(cls) -> 'CallableGenerator':
         yield int_validator
-        yield number_size_validator
-        yield number_multiple_validator
+        validator = make_number_validator(cls)
+        if validator:
+            yield validator
 
 
 def conint(*, gt: int = None, ge: int = None, lt: int = None, le: int = None, multiple_of: int = None) -> Type[int]:
     # use kwargs then define conf in a dict to aid with IDE type hinting
     namespace = dict(gt=gt, ge=ge, lt=lt, le=le, multiple_of=multiple_of)
-    return type('ConstrainedIntValue', (ConstrainedInt,), namespace)
+    return _constrained_type('ConstrainedIntValue', ConstrainedInt, namespace)
 
 
 class PositiveInt(ConstrainedInt):
@@ -364,8 +401,9 @@ class ConstrainedFloat(float, metaclass=ConstrainedNumberMeta):
     @classmethod
     def __get_validators__(cls) -> 'CallableGenerator':
         yield float_validator
-        yield number_size_validator
-        yield number_multiple_validator
+        validator = make_number_validator(cls)
+        if validator:
+            yield validator
 
 
 def confloat(
@@ -373,7 +411,7 @@ def confloat(
 ) -> Type[float]:
     # use kwargs then define conf in a dict to aid with IDE type hinting
     namespace = dict(gt=gt, ge=ge, lt=lt, le=le, multiple_of=multiple_of)
-    return type('ConstrainedFloatValue', (ConstrainedFloat,), namespace)
+    return _constrained_type('ConstrainedFloatValue', ConstrainedFloat, namespace)
 
 
 class PositiveFloat(ConstrainedFloat):
@@ -397,45 +435,21 @@ class ConstrainedDecimal(Decimal, metaclass=ConstrainedNumberMeta):
     def __get_validators__(cls) -> 'CallableGenerator':
         yield not_none_validator
         yield decimal_validator
-        yield number_size_validator
-        yield number_multiple_validator
-        yield cls.validate
+        validator = make_number_validator(cls)
+        if validator:
+            yield validator
+        if cls.validate.__func__ is not ConstrainedDecimal.validate.__func__:  # type: ignore
+            # validate() is overridden, it can call super().validate() to check the digits
+            yield cls.validate
+        else:
+            yield make_decimal_validator(cls)
 
     @classmethod
     def validate(cls, value: Decimal) -> Decimal:
-        digit_tuple, exponent = value.as_tuple()[1:]
-        if exponent in {'F', 'n', 'N'}:
-            raise errors.DecimalIsNotFiniteError()
-
-        if exponent >= 0:
-            # A positive exponent adds that many trailing zeros.
-            digits = len(digit_tuple) + exponent
-            decimals = 0
-        else:
-            # If the absolute value of the negative exponent is larger than the
-            # number of digits, then it's the same as the number of digits,
-            # because it'll consume all of the digits in digit_tuple and then
-            # add abs(exponent) - len(digit_tuple) leading zeros after the
-            # decimal point.
-            if abs(exponent) > len(digit_tuple):
-                digits = decimals = abs(exponent)
-            else:
-                digits = len(digit_tuple)
-                decimals = abs(exponent)
-        whole_digits = digits - decimals
-
-        if cls.max_digits is not None and digits > cls.max_digits:
-            raise errors.DecimalMaxDigitsError(max_digits=cls.max_digits)
-
-        if cls.decimal_places is not None and decimals > cls.decimal_places:
-            raise errors.DecimalMaxPlacesError(decimal_places=cls.decimal_places)
-
-        if cls.max_digits is not None and cls.decimal_places is not None:
-            expected = cls.max_digits - cls.decimal_places
-            if whole_digits > expected:
-                raise errors.DecimalWholeDigitsError(whole_digits=expected)
-
-        return value
+        """
+        Check a ``Decimal`` is finite and its digits with the validator used by fields, built on each call.
+        """
+        return make_decimal_validator(cls)(value)
 
 
 def condecimal(
@@ -452,7 +466,7 @@ def condecimal(
     namespace = dict(
         gt=gt, ge=ge, lt=lt, le=le, max_digits=max_digits, decimal_places=decimal_places, multiple_of=multiple_of
     )
-    return type('ConstrainedDecimalValue', (ConstrainedDecimal,), namespace)
+    return _constrained_type('ConstrainedDecimalValue', ConstrainedDecimal, namespace)
 
 
 class UUID1(UUID):
@@ -513,13 +527,26 @@ class JsonMeta(type):
 class Json(metaclass=JsonMeta):
     @classmethod
     def __get_validators__(cls) -> 'CallableGenerator':
-        yield str_validator
+        yield cls.str_bytes_validator
         yield cls.validate
 
+    @staticmethod
+    def str_bytes_validator(v: Any) -> StrBytes:
+        """
+        Like str_validator but bytes are left for the JSON backend to parse without decoding them first.
+        """
+        return v if isinstance(v, (str, bytes)) else str_validator(v)
+
     @classmethod
-    def validate(cls, v: str) -> Any:
+    def validate(cls, v: StrBytes, config: Optional[Type['BaseConfig']] = None) -> Any:
+        """
+        Parse JSON with ``Config.json_loads`` if set, otherwise the current JSON backend.
+        """
+        if not isinstance(v, (str, bytes, bytearray)):
+            # some JSON libraries raise a ValueError for other types
+            raise errors.JsonTypeError()
         try:
-            return json.loads(v)
+            return (config and config.json_loads or json_loads)(v)
         except ValueError:
             raise errors.JsonError()
         except TypeError:
@@ -538,8 +565,10 @@ class IPvAnyAddress(_BaseAddress):
         except ValueError:
             pass
 
-        with change_exception(errors.IPvAnyAddressError, ValueError):
+        try:
             return IPv6Address(value)
+        except ValueError as e:
+            raise errors.IPvAnyAddressError() from e
 
 
 class IPvAnyInterface(_BaseAddress):
@@ -554,8 +583,10 @@ class IPvAnyInterface(_BaseAddress):
         except ValueError:
             pass
 
-        with change_exception(errors.IPvAnyInterfaceError, ValueError):
+        try:
             return IPv6Interface(value)
+        except ValueError as e:
+            raise errors.IPvAnyInterfaceError() from e
 
 
 class IPvAnyNetwork(_BaseNetwork):  # type: ignore
@@ -572,8 +603,10 @@ class IPvAnyNetwork(_BaseNetwork):  # type: ignore
         except ValueError:
             pass
 
-        with change_exception(errors.IPvAnyNetworkError, ValueError):
+        try:
             return IPv6Network(value)
+        except ValueError as e:
+            raise errors.IPvAnyNetworkError() from e
 
 
 class SecretStr:
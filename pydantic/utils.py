@@ -1,13 +1,29 @@
 import inspect
 import re
 import sys
+import threading
 from contextlib import contextmanager
 from enum import Enum
 from functools import lru_cache
 from importlib import import_module
 from textwrap import dedent
 from typing import _eval_type  # type: ignore
-from typing import TYPE_CHECKING, Any, ClassVar, Dict, Generator, List, Optional, Pattern, Tuple, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    ClassVar,
+    Dict,
+    Generator,
+    List,
+    Mapping,
+    Optional,
+    Pattern,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from . import errors
 
@@ -28,7 +44,7 @@ except ImportError:
     ForwardRef = None
 
 if TYPE_CHECKING:  # pragma: no cover
-    from .main import BaseModel  # noqa: F401
+    from .main import BaseConfig, BaseModel  # noqa: F401
     from .main import Field  # noqa: F401
 
 if sys.version_info < (3, 7):
@@ -177,6 +193,32 @@ def change_exception(raise_exc: ExcType, *except_types: ExcType) -> Generator[No
         raise raise_exc from e
 
 
+# validation never yields to other tasks so state local to the thread is local to the validation taking place
+_fail_fast_override = threading.local()
+
+
+@contextmanager
+def override_fail_fast(fail_fast: Optional[bool]) -> Generator[None, None, None]:
+    """
+    Override Config.fail_fast for all models (including sub-models and dataclasses) validated within the context,
+    None leaves each model's config in charge.
+    """
+    previous = getattr(_fail_fast_override, 'value', None)
+    _fail_fast_override.value = fail_fast
+    try:
+        yield
+    finally:
+        _fail_fast_override.value = previous
+
+
+def is_fail_fast(config: Type['BaseConfig']) -> bool:
+    """
+    Whether validation should stop at the first error, only called once an error has occurred.
+    """
+    fail_fast = getattr(_fail_fast_override, 'value', None)
+    return config.fail_fast if fail_fast is None else fail_fast
+
+
 def clean_docstring(d: str) -> str:
     return dedent(d).strip(' \r\n\t')
 
@@ -284,8 +326,81 @@ def update_field_forward_refs(field: 'Field', globalns: Any, localns: Any) -> No
     Try to update ForwardRefs on fields based on this Field, globalns and localns.
     """
     if type(field.type_) == ForwardRef:
-        field.type_ = field.type_._evaluate(globalns, localns or None)  # type: ignore
+        # evaluate the declared type, eg. List['Model'], since prepare() starts from it
+        field.outer_type_ = _eval_type(field.outer_type_, globalns, localns or None)
         field.prepare()
     if field.sub_fields:
         for sub_f in field.sub_fields:
             update_field_forward_refs(sub_f, globalns=globalns, localns=localns)
+        if field.sub_fields_by_type is not None:
+            # members may now be known to reject some types
+            field._index_sub_fields()
+
+
+class ItemsSpec(Dict[Any, Any]):
+    """
+    A normalised include or exclude argument to dict(), json() or copy(), see normalize_items().
+    """
+
+    __slots__ = ()
+
+
+# normalize_items() results by id of the argument: (argument, snapshot of the argument, result)
+_items_specs: Dict[int, Tuple[Any, Any, Optional[ItemsSpec]]] = {}
+ITEMS_SPECS_CACHE_SIZE = 256
+
+
+def normalize_items(items: Any) -> Optional[ItemsSpec]:
+    """
+    Normalise an include or exclude argument to a dict of keys (field names, dict keys, list indexes or ``'__all__'``
+    for every item of a list, tuple or dict) to either ``...`` for the whole value or the ItemsSpec to apply to the
+    value. ``items`` may be a set of keys or a dict of keys to ``...``, ``True``, a set or a dict.
+
+    Empty arguments are treated like None, as they are by ``_calculate_keys()``.
+
+    Results for dicts are cached so passing the same dict again costs just a comparison with a snapshot of it made
+    when it was first normalised, which catches it being changed.
+    """
+    if items is None or type(items) is ItemsSpec:
+        return items or None
+    elif type(items) in (set, frozenset) or isinstance(items, AbstractSet):
+        # quick enough not to need caching
+        return cast(ItemsSpec, ItemsSpec.fromkeys(items, ...)) if items else None
+
+    cached = _items_specs.get(id(items))
+    if cached is not None and cached[0] is items and cached[1] == items:
+        return cached[2]
+
+    spec = _normalize_items(items) or None
+    if len(_items_specs) >= ITEMS_SPECS_CACHE_SIZE:
+        _items_specs.clear()
+    _items_specs[id(items)] = items, _snapshot(items), spec
+    return spec
+
+
+def _snapshot(items: Any) -> Any:
+    # like deepcopy but much quicker for the types allowed in include and exclude
+    if isinstance(items, Mapping):
+        return {k: _snapshot(v) for k, v in items.items()}
+    elif isinstance(items, AbstractSet):
+        return set(items)
+    return items
+
+
+def _normalize_items(items: Any) -> ItemsSpec:
+    if isinstance(items, AbstractSet):
+        return ItemsSpec((k, ...) for k in items)
+    elif not isinstance(items, Mapping):
+        raise TypeError(f'include and exclude should be sets or dicts, not {display_as_type(type(items))}')
+
+    spec = ItemsSpec()
+    for k, v in items.items():
+        if v is ... or v is True:
+            spec[k] = ...
+        elif isinstance(v, (AbstractSet, Mapping)):
+            spec[k] = _normalize_items(v)
+        else:
+            raise TypeError(
+                f'unexpected value {v!r} for {k!r} in include or exclude, should be ..., True, a set or a dict'
+            )
+    return spec
@@ -1,26 +1,54 @@
+import operator
 import re
+import sys
 from collections import OrderedDict
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal, DecimalException
 from enum import Enum, IntEnum
+from functools import partial
 from ipaddress import IPv4Address, IPv4Interface, IPv4Network, IPv6Address, IPv6Interface, IPv6Network
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Pattern, Set, Tuple, Type, TypeVar, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Pattern,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 from uuid import UUID
 
 from . import errors
 from .datetime_parse import parse_date, parse_datetime, parse_duration, parse_time
-from .utils import AnyCallable, AnyType, ForwardRef, change_exception, display_as_type, is_callable_type, sequence_like
+from .utils import (
+    AnyCallable,
+    AnyType,
+    ForwardRef,
+    display_as_type,
+    is_callable_type,
+    lenient_issubclass,
+    sequence_like,
+)
 
 if TYPE_CHECKING:  # pragma: no cover
     from .fields import Field
     from .main import BaseConfig
-    from .types import ConstrainedDecimal, ConstrainedFloat, ConstrainedInt
+    from .types import ConstrainedBytes, ConstrainedDecimal, ConstrainedFloat, ConstrainedInt, ConstrainedStr, UrlStr
 
     ConstrainedNumber = Union[ConstrainedDecimal, ConstrainedFloat, ConstrainedInt]
     AnyOrderedDict = OrderedDict[Any, Any]
     Number = Union[int, float, Decimal]
     StrBytes = Union[str, bytes]
+    # (check, limit, error) where check(v, limit) is False if v is invalid
+    Checks = List[Tuple[Callable[[Any, Any], bool], Any, Callable[[], Exception]]]
 
 NoneType = type(None)
 
@@ -78,39 +106,138 @@ def int_validator(v: Any) -> int:
     if not isinstance(v, bool) and isinstance(v, int):
         return v
 
-    with change_exception(errors.IntegerError, TypeError, ValueError):
+    try:
         return int(v)
+    except (TypeError, ValueError) as e:
+        raise errors.IntegerError() from e
 
 
 def float_validator(v: Any) -> float:
     if isinstance(v, float):
         return v
 
-    with change_exception(errors.FloatError, TypeError, ValueError):
+    try:
         return float(v)
+    except (TypeError, ValueError) as e:
+        raise errors.FloatError() from e
 
 
-def number_multiple_validator(v: 'Number', field: 'Field') -> 'Number':
-    field_type = cast('ConstrainedNumber', field.type_)
-    if field_type.multiple_of is not None and v % field_type.multiple_of != 0:  # type: ignore
-        raise errors.NumberNotMultipleError(multiple_of=field_type.multiple_of)
+def _is_multiple(v: 'Number', multiple_of: 'Number') -> bool:
+    return v % multiple_of == 0  # type: ignore
 
-    return v
 
+def _make_constraint_validator(checks: 'Checks') -> Optional[AnyCallable]:
+    """
+    Build a function which raises the error of the first check, ``check(v, limit)``, to fail, with the common cases of
+    one or two checks unrolled.
+    """
+    if not checks:
+        return None
+    elif len(checks) == 1:
+        ((check, limit, error),) = checks
 
-def number_size_validator(v: 'Number', field: 'Field') -> 'Number':
-    field_type = cast('ConstrainedNumber', field.type_)
-    if field_type.gt is not None and not v > field_type.gt:
-        raise errors.NumberNotGtError(limit_value=field_type.gt)
-    elif field_type.ge is not None and not v >= field_type.ge:
-        raise errors.NumberNotGeError(limit_value=field_type.ge)
+        def constraint_validator(v: Any) -> Any:
+            if not check(v, limit):
+                raise error()
+            return v
 
-    if field_type.lt is not None and not v < field_type.lt:
-        raise errors.NumberNotLtError(limit_value=field_type.lt)
-    if field_type.le is not None and not v <= field_type.le:
-        raise errors.NumberNotLeError(limit_value=field_type.le)
+    elif len(checks) == 2:
+        (check_a, limit_a, error_a), (check_b, limit_b, error_b) = checks
 
-    return v
+        def constraint_validator(v: Any) -> Any:
+            if not check_a(v, limit_a):
+                raise error_a()
+            if not check_b(v, limit_b):
+                raise error_b()
+            return v
+
+    else:
+
+        def constraint_validator(v: Any) -> Any:
+            for check, limit, error in checks:
+                if not check(v, limit):
+                    raise error()
+            return v
+
+    return constraint_validator
+
+
+def make_number_validator(type_: Type['ConstrainedNumber']) -> Optional[Callable[['Number'], 'Number']]:
+    """
+    Build a validator for the bounds and ``multiple_of`` of a constrained number type which checks only the
+    constraints which are set, eg. just ``v > 0`` for ``PositiveInt``, None if there are none.
+    """
+    checks: 'Checks' = []
+    if type_.gt is not None:
+        checks.append((operator.gt, type_.gt, partial(errors.NumberNotGtError, limit_value=type_.gt)))
+    elif type_.ge is not None:
+        checks.append((operator.ge, type_.ge, partial(errors.NumberNotGeError, limit_value=type_.ge)))
+    if type_.lt is not None:
+        checks.append((operator.lt, type_.lt, partial(errors.NumberNotLtError, limit_value=type_.lt)))
+    elif type_.le is not None:
+        checks.append((operator.le, type_.le, partial(errors.NumberNotLeError, limit_value=type_.le)))
+    if type_.multiple_of is not None:
+        checks.append(
+            (_is_multiple, type_.multiple_of, partial(errors.NumberNotMultipleError, multiple_of=type_.multiple_of))
+        )
+
+    validator = _make_constraint_validator(checks)
+    if validator:
+        # the checks are all on the value so can be done on numpy arrays by validate_columns
+        validator.vectorisable = True  # type: ignore
+    return validator
+
+
+def make_decimal_validator(type_: Type['ConstrainedDecimal']) -> Callable[[Decimal], Decimal]:
+    """
+    Build a validator checking a decimal is finite and, only if the type limits them, its number of digits.
+    """
+    max_digits, decimal_places = type_.max_digits, type_.decimal_places
+    if max_digits is None and decimal_places is None:
+
+        def decimal_finite_validator(v: Decimal) -> Decimal:
+            if not v.is_finite():
+                raise errors.DecimalIsNotFiniteError()
+            return v
+
+        return decimal_finite_validator
+
+    whole_digits_limit = None if max_digits is None or decimal_places is None else max_digits - decimal_places
+
+    def decimal_digits_validator(v: Decimal) -> Decimal:
+        if not v.is_finite():
+            raise errors.DecimalIsNotFiniteError()
+        _, digit_tuple, exponent = v.as_tuple()
+        exponent = cast(int, exponent)
+
+        if exponent >= 0:
+            # A positive exponent adds that many trailing zeros.
+            digits = len(digit_tuple) + exponent
+            decimals = 0
+        else:
+            # If the absolute value of the negative exponent is larger than the
+            # number of digits, then it's the same as the number of digits,
+            # because it'll consume all of the digits in digit_tuple and then
+            # add abs(exponent) - len(digit_tuple) leading zeros after the
+            # decimal point.
+            if abs(exponent) > len(digit_tuple):
+                digits = decimals = abs(exponent)
+            else:
+                digits = len(digit_tuple)
+                decimals = abs(exponent)
+
+        if max_digits is not None and digits > max_digits:
+            raise errors.DecimalMaxDigitsError(max_digits=max_digits)
+
+        if decimal_places is not None and decimals > decimal_places:
+            raise errors.DecimalMaxPlacesError(decimal_places=decimal_places)
+
+        if whole_digits_limit is not None and digits - decimals > whole_digits_limit:
+            raise errors.DecimalWholeDigitsError(whole_digits=whole_digits_limit)
+
+        return v
+
+    return decimal_digits_validator
 
 
 def constant_validator(v: 'Any', field: 'Field') -> 'Any':
@@ -148,20 +275,117 @@ def anystr_strip_whitespace(v: 'StrBytes', field: 'Field', config: 'BaseConfig')
     return v
 
 
+def make_anystr_validator(
+    type_: Union[Type['ConstrainedBytes'], Type['ConstrainedStr'], Type['UrlStr']]
+) -> Optional[Callable[['StrBytes'], 'StrBytes']]:
+    """
+    Build a validator for a constrained string or bytes type which strips whitespace, checks length and, for
+    ``ConstrainedStr``, curtails and matches the regex, doing only what the type asks for, None if it asks for nothing.
+
+    Config defaults like ``min_anystr_length`` don't apply since these types always define the attributes.
+    """
+    strip_whitespace, min_length, max_length = type_.strip_whitespace, type_.min_length, type_.max_length
+    curtail_length: Optional[int] = getattr(type_, 'curtail_length', None)
+    regex: Optional[Pattern[str]] = getattr(type_, 'regex', None)
+
+    if not strip_whitespace and not curtail_length and not regex:
+        if min_length is None and max_length is None:
+            return None
+        # missing limits are replaced with ones which always pass to leave a single range check
+        min_length_, max_length_ = min_length or 0, sys.maxsize if max_length is None else max_length
+
+        def length_validator(v: 'StrBytes') -> 'StrBytes':
+            if not min_length_ <= len(v) <= max_length_:
+                if len(v) < min_length_:
+                    raise errors.AnyStrMinLengthError(limit_value=min_length_)
+                raise errors.AnyStrMaxLengthError(limit_value=max_length_)
+            return v
+
+        # the checks are on length alone so can be done on numpy arrays by validate_columns
+        length_validator.vectorisable = True  # type: ignore
+        return length_validator
+
+    def anystr_validator(v: 'StrBytes') -> 'StrBytes':
+        if strip_whitespace:
+            v = v.strip()
+
+        v_len = len(v)
+        if min_length is not None and v_len < min_length:
+            raise errors.AnyStrMinLengthError(limit_value=min_length)
+        if max_length is not None and v_len > max_length:
+            raise errors.AnyStrMaxLengthError(limit_value=max_length)
+
+        if curtail_length and v_len > curtail_length:
+            v = v[:curtail_length]
+
+        if regex and not regex.match(v):  # type: ignore
+            raise errors.StrRegexError(pattern=regex.pattern)
+
+        return v
+
+    return anystr_validator
+
+
+# strings interned by str_intern_validator, a dict rather than sys.intern so it can be bounded (interned strings are
+# never freed on newer pythons), when full it's emptied rather than tracking use to keep lookups cheap
+INTERN_TABLE_SIZE = 100_000
+_intern_table: Dict[str, str] = {}
+
+
+def _intern_strings(field: 'Field', config: Type['BaseConfig']) -> bool:
+    intern = getattr(field.type_, 'intern', None)
+    return config.intern_strings if intern is None else intern
+
+
+def str_intern_validator(v: str, field: 'Field', config: Type['BaseConfig']) -> str:
+    if type(v) is not str or not _intern_strings(field, config):
+        # an equal value of another type mustn't replace a str subclass or the other way around
+        return v
+
+    try:
+        return _intern_table[v]
+    except KeyError:
+        if len(_intern_table) >= INTERN_TABLE_SIZE:
+            _intern_table.clear()
+        _intern_table[v] = v
+        return v
+
+
+def is_noop_validator(validator: AnyCallable, field: 'Field', config: Type['BaseConfig']) -> bool:
+    """
+    Whether a validator would never change or reject a value for this field given its type and config, eg. stripping
+    whitespace when it's disabled or checking length with no limits, such validators can be omitted from the field.
+    """
+    if validator is anystr_strip_whitespace:
+        return not getattr(field.type_, 'strip_whitespace', config.anystr_strip_whitespace)
+    elif validator is str_intern_validator:
+        return not _intern_strings(field, config)
+    elif validator is anystr_length_validator:
+        return (
+            getattr(field.type_, 'min_length', config.min_anystr_length) is None
+            and getattr(field.type_, 'max_length', config.max_anystr_length) is None
+        )
+    return False
+
+
 def ordered_dict_validator(v: Any) -> 'AnyOrderedDict':
     if isinstance(v, OrderedDict):
         return v
 
-    with change_exception(errors.DictError, TypeError, ValueError):
+    try:
         return OrderedDict(v)
+    except (TypeError, ValueError) as e:
+        raise errors.DictError() from e
 
 
 def dict_validator(v: Any) -> Dict[Any, Any]:
     if isinstance(v, dict):
         return v
 
-    with change_exception(errors.DictError, TypeError, ValueError):
+    try:
         return dict(v)
+    except (TypeError, ValueError) as e:
+        raise errors.DictError() from e
 
 
 def list_validator(v: Any) -> List[Any]:
@@ -192,18 +416,44 @@ def set_validator(v: Any) -> Set[Any]:
 
 
 def enum_validator(v: Any, field: 'Field', config: 'BaseConfig') -> Enum:
-    with change_exception(errors.EnumError, ValueError):
+    if field.enum_lookup is not None:
+        try:
+            return field.enum_lookup[v]
+        except (KeyError, TypeError):
+            # not a member's value (or unhashable), the enum may still accept it via _missing_
+            pass
+
+    try:
         enum_v = field.type_(v)
+    except ValueError as e:
+        raise errors.EnumError() from e
 
     return enum_v.value if config.use_enum_values else enum_v
 
 
+def make_enum_lookup(enum_type: Type[Enum], config: Type['BaseConfig']) -> Dict[Any, Any]:
+    """
+    Map the value of each member of an enum to what enum_validator returns for it, so validating a value is a
+    single dict lookup rather than a call to the enum.
+    """
+    lookup: Dict[Any, Any] = {}
+    for member in enum_type.__members__.values():
+        try:
+            lookup.setdefault(member.value, member.value if config.use_enum_values else member)
+        except TypeError:
+            # unhashable values are left to the enum
+            pass
+    return lookup
+
+
 def uuid_validator(v: Any, field: 'Field') -> UUID:
-    with change_exception(errors.UUIDError, ValueError):
+    try:
         if isinstance(v, str):
             v = UUID(v)
         elif isinstance(v, (bytes, bytearray)):
             v = UUID(v.decode())
+    except ValueError as e:
+        raise errors.UUIDError() from e
 
     if not isinstance(v, UUID):
         raise errors.UUIDError()
@@ -223,8 +473,10 @@ def decimal_validator(v: Any) -> Decimal:
 
     v = str(v).strip()
 
-    with change_exception(errors.DecimalError, DecimalException):
+    try:
         v = Decimal(v)
+    except DecimalException as e:
+        raise errors.DecimalError() from e
 
     if not v.is_finite():
         raise errors.DecimalIsNotFiniteError()
@@ -236,16 +488,20 @@ def ip_v4_address_validator(v: Any) -> IPv4Address:
     if isinstance(v, IPv4Address):
         return v
 
-    with change_exception(errors.IPv4AddressError, ValueError):
+    try:
         return IPv4Address(v)
+    except ValueError as e:
+        raise errors.IPv4AddressError() from e
 
 
 def ip_v6_address_validator(v: Any) -> IPv6Address:
     if isinstance(v, IPv6Address):
         return v
 
-    with change_exception(errors.IPv6AddressError, ValueError):
+    try:
         return IPv6Address(v)
+    except ValueError as e:
+        raise errors.IPv6AddressError() from e
 
 
 def ip_v4_network_validator(v: Any) -> IPv4Network:
@@ -258,8 +514,10 @@ def ip_v4_network_validator(v: Any) -> IPv4Network:
     if isinstance(v, IPv4Network):
         return v
 
-    with change_exception(errors.IPv4NetworkError, ValueError):
+    try:
         return IPv4Network(v)
+    except ValueError as e:
+        raise errors.IPv4NetworkError() from e
 
 
 def ip_v6_network_validator(v: Any) -> IPv6Network:
@@ -272,32 +530,40 @@ def ip_v6_network_validator(v: Any) -> IPv6Network:
     if isinstance(v, IPv6Network):
         return v
 
-    with change_exception(errors.IPv6NetworkError, ValueError):
+    try:
         return IPv6Network(v)
+    except ValueError as e:
+        raise errors.IPv6NetworkError() from e
 
 
 def ip_v4_interface_validator(v: Any) -> IPv4Interface:
     if isinstance(v, IPv4Interface):
         return v
 
-    with change_exception(errors.IPv4InterfaceError, ValueError):
+    try:
         return IPv4Interface(v)
+    except ValueError as e:
+        raise errors.IPv4InterfaceError() from e
 
 
 def ip_v6_interface_validator(v: Any) -> IPv6Interface:
     if isinstance(v, IPv6Interface):
         return v
 
-    with change_exception(errors.IPv6InterfaceError, ValueError):
+    try:
         return IPv6Interface(v)
+    except ValueError as e:
+        raise errors.IPv6InterfaceError() from e
 
 
 def path_validator(v: Any) -> Path:
     if isinstance(v, Path):
         return v
 
-    with change_exception(errors.PathError, TypeError):
+    try:
         return Path(v)
+    except TypeError as e:
+        raise errors.PathError() from e
 
 
 def path_exists_validator(v: Any) -> Path:
@@ -332,8 +598,10 @@ def make_arbitrary_type_validator(type_: Type[T]) -> Callable[[T], T]:
 
 
 def pattern_validator(v: Any) -> Pattern[str]:
-    with change_exception(errors.PatternError, re.error):
+    try:
         return re.compile(v)
+    except re.error as e:
+        raise errors.PatternError() from e
 
 
 pattern_validators = [not_none_validator, str_validator, pattern_validator]
@@ -342,7 +610,7 @@ pattern_validators = [not_none_validator, str_validator, pattern_validator]
 _VALIDATORS: List[Tuple[AnyType, List[AnyCallable]]] = [
     (IntEnum, [int_validator, enum_validator]),
     (Enum, [enum_validator]),
-    (str, [not_none_validator, str_validator, anystr_strip_whitespace, anystr_length_validator]),
+    (str, [not_none_validator, str_validator, anystr_strip_whitespace, anystr_length_validator, str_intern_validator]),
     (bytes, [not_none_validator, bytes_validator, anystr_strip_whitespace, anystr_length_validator]),
     (bool, [bool_validator]),
     (int, [int_validator]),
@@ -369,6 +637,91 @@ _VALIDATORS: List[Tuple[AnyType, List[AnyCallable]]] = [
 ]
 
 
+# types for which values of exactly that type are returned unchanged by the validators below
+_EXACT_TYPES = {
+    str,
+    bytes,
+    bool,
+    int,
+    float,
+    Decimal,
+    datetime,
+    date,
+    time,
+    timedelta,
+    OrderedDict,
+    dict,
+    list,
+    tuple,
+    set,
+    UUID,
+}
+_EXACT_TYPE_VALIDATORS = {
+    not_none_validator,
+    str_validator,
+    bytes_validator,
+    bool_validator,
+    int_validator,
+    float_validator,
+    decimal_validator,
+    parse_datetime,
+    parse_date,
+    parse_time,
+    parse_duration,
+    ordered_dict_validator,
+    dict_validator,
+    list_validator,
+    tuple_validator,
+    set_validator,
+    uuid_validator,
+}
+
+
+def find_exact_type(type_: AnyType, validators: Sequence[AnyCallable], config: Type['BaseConfig']) -> Optional[AnyType]:
+    """
+    Return ``type_`` if values of exactly that type would be returned unchanged by ``validators``, so validation
+    of such values can be skipped, otherwise None.
+    """
+    if lenient_issubclass(type_, Enum):
+        if config.use_enum_values:
+            return None
+        exact_validators = {int_validator, enum_validator}
+    elif type_ in _EXACT_TYPES:
+        exact_validators = _EXACT_TYPE_VALIDATORS
+    else:
+        return None
+
+    if all(v in exact_validators for v in validators):
+        return type_
+    return None
+
+
+# types of values which are always rejected when passed to a validator, see find_rejected_types
+_CONTAINER_TYPES: Set[AnyType] = {dict, list, tuple, set}
+_REJECTED_TYPES: Dict[AnyCallable, Set[AnyType]] = {
+    not_none_validator: {NoneType},
+    is_none_validator: {*_CONTAINER_TYPES, str, bytes, int, float, bool},
+    str_validator: _CONTAINER_TYPES,
+    bytes_validator: {*_CONTAINER_TYPES, NoneType},
+    int_validator: {*_CONTAINER_TYPES, NoneType},
+    float_validator: {*_CONTAINER_TYPES, NoneType},
+}
+
+
+def find_rejected_types(validators: Sequence[AnyCallable]) -> Set[AnyType]:
+    """
+    Return the types for which values of exactly that type would certainly fail ``validators``, this is used to
+    skip members of a union which can't match a value.
+    """
+    rejected: Set[AnyType] = set()
+    for validator in validators:
+        rejected |= _REJECTED_TYPES.get(validator, set())
+        if validator is not not_none_validator:
+            # later validators only see values returned by the first validator
+            break
+    return rejected
+
+
 def find_validators(type_: AnyType, arbitrary_types_allowed: bool = False) -> List[AnyCallable]:
     if type_ is Any or type(type_) == ForwardRef:
         return []
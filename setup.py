@@ -77,6 +77,9 @@ setup(
     ],
     extras_require={
         'ujson': ['ujson>=1.35'],
+        'orjson': ['orjson>=3.4'],
+        'rapidjson': ['python-rapidjson>=0.9'],
         'email': ['email-validator>=1.0.3'],
+        'numpy': ['numpy>=1.15'],
     }
 )
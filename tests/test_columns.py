@@ -0,0 +1,141 @@
+from datetime import datetime, timezone
+from typing import List
+
+import pytest
+
+from pydantic import BaseModel, Extra, conint, constr, validator
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class Model(BaseModel):
+    a: conint(gt=0, multiple_of=2)
+    b: float
+    c: constr(max_length=3)
+    d: str = 'x'
+
+
+def test_lists():
+    values, error_mask, errors = Model.validate_columns({'a': [2, 3, '4'], 'b': [1, 2.5, 'x'], 'c': ['ab', 'c', 'd']})
+    assert values == {'a': [2, 3, 4], 'b': [1.0, 2.5, 'x'], 'c': ['ab', 'c', 'd'], 'd': ['x', 'x', 'x']}
+    assert list(error_mask) == [False, True, True]
+    assert [(i, e.errors()) for i, e in errors] == [
+        (
+            1,
+            [
+                {
+                    'loc': ('a',),
+                    'msg': 'ensure this value is a multiple of 2',
+                    'type': 'value_error.number.not_multiple',
+                    'ctx': {'multiple_of': 2},
+                }
+            ],
+        ),
+        (2, [{'loc': ('b',), 'msg': 'value is not a valid float', 'type': 'type_error.float'}]),
+    ]
+
+
+def test_missing_and_extra():
+    class ExtraModel(BaseModel):
+        a: int
+        b: int = 1
+
+        class Config:
+            extra = Extra.forbid
+
+    values, error_mask, errors = ExtraModel.validate_columns({'c': [1, 2]})
+    assert values == {'b': [1, 1]}
+    assert list(error_mask) == [True, True]
+    assert errors[1][1].errors() == [
+        {'loc': ('a',), 'msg': 'field required', 'type': 'value_error.missing'},
+        {'loc': ('c',), 'msg': 'extra fields not permitted', 'type': 'value_error.extra'},
+    ]
+
+
+def test_different_lengths():
+    with pytest.raises(ValueError, match=r'columns must all have the same length, got lengths \[1, 2\]'):
+        Model.validate_columns({'a': [2], 'b': [1, 2], 'c': ['x']})
+
+
+def test_validators_by_row():
+    class ValidatorModel(BaseModel):
+        a: int
+        b: List[int]
+
+        @validator('b', whole=True)
+        def check_b(cls, v, values):
+            if len(v) != values['a']:
+                raise ValueError('wrong length')
+            return v
+
+    values, error_mask, errors = ValidatorModel.validate_columns({'a': [1, 2], 'b': [['1'], [2]]})
+    assert values == {'a': [1, 2], 'b': [[1], [2]]}
+    assert list(error_mask) == [False, True]
+    assert errors[0][1].errors() == [{'loc': ('b',), 'msg': 'wrong length', 'type': 'value_error'}]
+
+
+def test_mask_without_numpy(monkeypatch):
+    monkeypatch.setattr('pydantic.columns.numpy', None)
+    _, error_mask, _ = Model.validate_columns({'a': [2, 3], 'b': [1, 2], 'c': ['a', 'b']})
+    assert error_mask == [False, True]
+
+
+def test_datetimes():
+    class DatetimeModel(BaseModel):
+        a: datetime
+        b: datetime = None
+
+    values, error_mask, errors = DatetimeModel.validate_columns(
+        {'a': ['2032-04-23T10:20:30Z', '2032-04-31T10:20:30Z'], 'b': [None, 'x']}
+    )
+    assert values == {
+        'a': [datetime(2032, 4, 23, 10, 20, 30, tzinfo=timezone.utc), '2032-04-31T10:20:30Z'],
+        'b': [None, 'x'],
+    }
+    assert list(error_mask) == [False, True]
+    assert errors[0][1].errors() == [
+        {'loc': ('a',), 'msg': 'invalid datetime format', 'type': 'type_error.datetime'},
+        {'loc': ('b',), 'msg': 'invalid datetime format', 'type': 'type_error.datetime'},
+    ]
+
+
+@pytest.mark.skipif(not numpy, reason='numpy not installed')
+def test_numpy_arrays():
+    columns = {
+        'a': numpy.array([2, 3, 4, -2]),
+        'b': numpy.array([1, 2, 3, 4]),
+        'c': numpy.array(['ab', 'abcd', '', 'x']),
+        'd': numpy.array([1, 2, 3, 4], dtype=object),
+    }
+    values, error_mask, errors = Model.validate_columns(columns)
+    assert values['a'] is columns['a']
+    assert values['b'].dtype == float
+    assert values['c'] is columns['c']
+    assert values['d'] == ['1', '2', '3', '4']
+    assert error_mask.tolist() == [False, True, False, True]
+    assert [(i, [e['loc'] for e in e.errors()]) for i, e in errors] == [(1, [('a',), ('c',)]), (3, [('a',)])]
+    assert errors[1][1].errors() == [
+        {
+            'loc': ('a',),
+            'msg': 'ensure this value is greater than 0',
+            'type': 'value_error.number.not_gt',
+            'ctx': {'limit_value': 0},
+        }
+    ]
+
+
+@pytest.mark.skipif(not numpy, reason='numpy not installed')
+def test_numpy_fallback():
+    class FallbackModel(BaseModel):
+        a: int
+        b: constr(regex=r'^\d+$')
+
+    values, error_mask, errors = FallbackModel.validate_columns(
+        {'a': numpy.array([1.0, 2.5]), 'b': numpy.array(['123', 'x'])}
+    )
+    assert values == {'a': [1, 2], 'b': ['123', 'x']}
+    assert error_mask.tolist() == [False, True]
+    assert errors[0][1].errors()[0]['type'] == 'value_error.str.regex'
@@ -1,5 +1,6 @@
 import dataclasses
 from datetime import datetime
+from typing import List
 
 import pytest
 
@@ -326,3 +327,19 @@ def test_nested_schema():
             }
         },
     }
+
+
+def test_lazy_submodels_validated():
+    class SubModel(BaseModel):
+        a: int
+
+    class Config:
+        lazy_submodels = True
+
+    @pydantic.dataclasses.dataclass(config=Config)
+    class MyDataclass:
+        s: List[SubModel]
+
+    assert MyDataclass(s=[{'a': '1'}]).s == [SubModel(a=1)]
+    with pytest.raises(ValidationError):
+        MyDataclass(s=[{'a': 'x'}])
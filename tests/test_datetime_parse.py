@@ -11,7 +11,15 @@ from datetime import date, datetime, time, timedelta, timezone
 import pytest
 
 from pydantic import errors
-from pydantic.datetime_parse import parse_date, parse_datetime, parse_duration, parse_time
+from pydantic.datetime_parse import (
+    parse_date,
+    parse_dates,
+    parse_datetime,
+    parse_datetimes,
+    parse_duration,
+    parse_durations,
+    parse_time,
+)
 
 
 def create_tz(minutes):
@@ -91,11 +99,19 @@ def test_time_parsing(value, result):
         ('2012-04-23T10:20:30.400+02:30', datetime(2012, 4, 23, 10, 20, 30, 400_000, create_tz(150))),
         ('2012-04-23T10:20:30.400+02', datetime(2012, 4, 23, 10, 20, 30, 400_000, create_tz(120))),
         ('2012-04-23T10:20:30.400-02', datetime(2012, 4, 23, 10, 20, 30, 400_000, create_tz(-120))),
+        ('2012-04-23 10:20:30.123456-05:30', datetime(2012, 4, 23, 10, 20, 30, 123_456, create_tz(-330))),
+        ('2012-04-23T10:20:30.1234+00:00', datetime(2012, 4, 23, 10, 20, 30, 123_400, timezone.utc)),
+        ('2012-04-23T10:20:30.1234567', datetime(2012, 4, 23, 10, 20, 30, 123_456)),
+        ('2012-04-23T0\u0669:15:00', datetime(2012, 4, 23, 9, 15)),
         (datetime(2017, 5, 5), datetime(2017, 5, 5)),
         (0, datetime(1970, 1, 1, 0, 0, 0, tzinfo=timezone.utc)),
         # Invalid inputs
         ('x20120423091500', errors.DateTimeError),
         ('2012-04-56T09:15:90', errors.DateTimeError),
+        ('2019-02-29T09:15:00', errors.DateTimeError),
+        ('2012-04-23T24:00:00', errors.DateTimeError),
+        ('2012-04-23T09:15:00.1234+05:30x', errors.DateTimeError),
+        ('2012-04-23T09:15:00.+05', errors.DateTimeError),
         (19_999_999_999, datetime(2603, 10, 11, 11, 33, 19, tzinfo=timezone.utc)),  # just before watershed
         (20_000_000_001, datetime(1970, 8, 20, 11, 33, 20, 1000, tzinfo=timezone.utc)),  # just after watershed
         (1_549_316_052, datetime(2019, 2, 4, 21, 34, 12, 0, tzinfo=timezone.utc)),  # nowish in s
@@ -112,6 +128,12 @@ def test_datetime_parsing(value, result):
         assert parse_datetime(value) == result
 
 
+def test_datetime_parsing_shares_timezones():
+    assert parse_datetime('2012-4-23 9:15+05:30').tzinfo is parse_datetime('2012-4-24 10:15+05:30').tzinfo
+    assert parse_datetime('2012-4-23 9:15-0530').tzinfo is parse_datetime('2012-4-24 10:15-0530').tzinfo
+    assert parse_datetime('2012-4-23 9:15Z').tzinfo is timezone.utc
+
+
 @pytest.mark.parametrize(
     'delta',
     [
@@ -178,3 +200,48 @@ def test_parse_durations(value, result):
             parse_duration(value)
     else:
         assert parse_duration(value) == result
+
+
+@pytest.mark.parametrize('chunk_size', [1000, 2])
+def test_bulk_parse_datetimes(monkeypatch, chunk_size):
+    monkeypatch.setattr('pydantic.datetime_parse.BULK_CHUNK_SIZE', chunk_size)
+    values = [
+        '2012-04-23T09:15:00',
+        '2012-04-23 09:15:00.123Z',
+        '2012-04-23T09:15:00.123456+05:30',
+        '2012-04-23T09:15:00\n2012-04-23T09:15:00',
+        '2012-02-30T09:15:00',
+        '2012-4-9 4:8:16',
+        1_494_012_444,
+        None,
+    ]
+    parsed, errors_ = parse_datetimes(values)
+    assert parsed == [
+        datetime(2012, 4, 23, 9, 15),
+        datetime(2012, 4, 23, 9, 15, 0, 123_000, timezone.utc),
+        datetime(2012, 4, 23, 9, 15, 0, 123_456, create_tz(330)),
+        '2012-04-23T09:15:00\n2012-04-23T09:15:00',
+        '2012-02-30T09:15:00',
+        datetime(2012, 4, 9, 4, 8, 16),
+        datetime(2017, 5, 5, 19, 27, 24, tzinfo=timezone.utc),
+        None,
+    ]
+    assert [(i, type(e)) for i, e in errors_] == [(3, errors.DateTimeError), (4, errors.DateTimeError), (7, TypeError)]
+
+
+def test_bulk_parse_dates():
+    parsed, errors_ = parse_dates(iter(['2012-04-23', '2012-04-56', '2012-4-9', date(2012, 1, 1)]))
+    assert parsed == [date(2012, 4, 23), '2012-04-56', date(2012, 4, 9), date(2012, 1, 1)]
+    assert [(i, type(e)) for i, e in errors_] == [(1, errors.DateError)]
+
+
+def test_bulk_parse_durations():
+    parsed, errors_ = parse_durations(['10:15:30', '01:02:03.000004', '99:99:99', 'x', 30])
+    assert parsed == [
+        timedelta(hours=10, minutes=15, seconds=30),
+        timedelta(hours=1, minutes=2, seconds=3, microseconds=4),
+        timedelta(hours=99, minutes=99, seconds=99),
+        'x',
+        timedelta(seconds=30),
+    ]
+    assert [(i, type(e)) for i, e in errors_] == [(3, errors.DurationError)]
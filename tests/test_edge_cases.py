@@ -10,11 +10,13 @@ from pydantic import (
     BaseModel,
     Extra,
     NoneStrBytes,
+    Schema,
     StrBytes,
     ValidationError,
     constr,
     errors,
     validate_model,
+    validator,
 )
 
 
@@ -88,6 +90,202 @@ def test_union_priority():
     assert ModelTwo(v='123').v == '123'
 
 
+def test_union_index():
+    class SubModel(BaseModel):
+        a: int
+
+    class Model(BaseModel):
+        v: Union[SubModel, List[int], int, str]
+
+    field = Model.__fields__['v']
+    assert [f.type_ for f in field.sub_fields_by_type[int]] == [int]
+    assert [f.type_ for f in field.sub_fields_by_type[str]] == [int, str]
+    assert [f.type_ for f in field.sub_fields_by_type[dict]] == [SubModel]
+    assert [f.type_ for f in field.sub_fields_by_type[SubModel]] == [SubModel]
+    assert field.sub_fields_by_tag is None
+
+    assert Model(v=1).v == 1
+    assert Model(v='1').v == 1
+    assert Model(v='x').v == 'x'
+    assert Model(v=[1, '2']).v == [1, 2]
+    assert Model(v={'a': '1'}).v == SubModel(a=1)
+
+    with pytest.raises(ValidationError) as exc_info:
+        Model(v={'b': 1})
+    # all members are tried to report every error
+    assert exc_info.value.errors() == [
+        {'loc': ('v', 'a'), 'msg': 'field required', 'type': 'value_error.missing'},
+        {'loc': ('v',), 'msg': 'value is not a valid list', 'type': 'type_error.list'},
+        {'loc': ('v',), 'msg': 'value is not a valid integer', 'type': 'type_error.integer'},
+        {'loc': ('v',), 'msg': 'str type expected', 'type': 'type_error.str'},
+    ]
+
+
+def test_union_index_validators_called_once():
+    calls = []
+
+    class SubModel(BaseModel):
+        a: int
+
+        @validator('a', pre=True)
+        def check_a(cls, v):
+            calls.append('SubModel')
+            return v
+
+    class Model(BaseModel):
+        v: Union[SubModel, List[int], int]
+
+        @validator('v', pre=True, whole=True)
+        def check_v(cls, v):
+            calls.append('Model')
+            return v
+
+    with pytest.raises(ValidationError) as exc_info:
+        Model(v={'a': 'x'})
+    # the skipped members are only tried after the indexed one fails, errors are in declaration order
+    assert calls == ['Model', 'SubModel']
+    assert [e['type'] for e in exc_info.value.errors()] == [
+        'type_error.integer',
+        'type_error.list',
+        'type_error.integer',
+    ]
+
+
+def test_union_discriminator():
+    class Cat(BaseModel):
+        pet_type: str = Schema('cat', const=True)
+        name: str
+
+    class Dog(BaseModel):
+        pet_type: str = Schema('dog', const=True)
+        name: str
+
+    class Other(BaseModel):
+        pet_type: str
+        name: str
+
+    class Model(BaseModel):
+        pet: Union[Cat, Dog, Other]
+
+        class Config:
+            union_discriminator = 'pet_type'
+
+    field = Model.__fields__['pet']
+    assert {k: [f.type_ for f in v] for k, v in field.sub_fields_by_tag.items()} == {
+        'cat': [Cat, Other],
+        'dog': [Dog, Other],
+    }
+
+    assert isinstance(Model(pet={'pet_type': 'dog', 'name': 'x'}).pet, Dog)
+    assert isinstance(Model(pet={'pet_type': 'fish', 'name': 'x'}).pet, Other)
+    # the first member still wins when the tag is missing
+    assert isinstance(Model(pet={'name': 'x'}).pet, Cat)
+
+    with pytest.raises(ValidationError) as exc_info:
+        Model(pet={'pet_type': 'dog'})
+    assert [e['type'] for e in exc_info.value.errors()] == [
+        'value_error.missing',
+        'value_error.const',
+        'value_error.missing',
+        'value_error.missing',
+    ]
+
+
+def test_discriminated_union():
+    class Cat(BaseModel):
+        pet_type: str = Schema('cat', const=True)
+        name: str
+
+    class Dog(BaseModel):
+        pet_type: str = Schema('dog', const=True)
+        barks: float
+
+    class Model(BaseModel):
+        pet: Optional[Union[Cat, Dog]]
+
+        class Config:
+            union_discriminator = 'pet_type'
+
+    field = Model.__fields__['pet']
+    assert field.discriminator == 'pet_type'
+    assert isinstance(Model(pet={'pet_type': 'dog', 'barks': 1}).pet, Dog)
+    assert isinstance(Model(pet=Cat(name='x')).pet, Cat)
+    assert Model(pet=None).pet is None
+
+    with pytest.raises(ValidationError) as exc_info:
+        Model(pet={'pet_type': 'dog', 'name': 'x'})
+    assert exc_info.value.errors() == [
+        {'loc': ('pet', 'barks'), 'msg': 'field required', 'type': 'value_error.missing'}
+    ]
+
+    # a missing tag or one matching no member falls back to trying every member in order
+    assert isinstance(Model(pet={'name': 'x'}).pet, Cat)
+    with pytest.raises(ValidationError) as exc_info:
+        Model(pet={'pet_type': 'fish'})
+    assert [(e['loc'], e['type']) for e in exc_info.value.errors()] == [
+        (('pet', 'name'), 'value_error.missing'),
+        (('pet', 'pet_type'), 'value_error.const'),
+        (('pet', 'barks'), 'value_error.missing'),
+        (('pet', 'pet_type'), 'value_error.const'),
+        (('pet',), 'type_error.none.allowed'),
+    ]
+
+
+def test_discriminated_union_enum_tag():
+    class Kind(Enum):
+        a = 1
+        b = 2
+
+    class A(BaseModel):
+        kind: Kind = Schema(Kind.a, const=True)
+        x: int
+
+    class B(BaseModel):
+        kind: Kind = Schema(Kind.b, const=True)
+        y: int
+
+    class Model(BaseModel):
+        v: Union[A, B]
+
+        class Config:
+            union_discriminator = 'kind'
+
+    assert Model.__fields__['v'].discriminator == 'kind'
+    m = Model(v={'kind': 2, 'y': 1})
+    assert isinstance(m.v, B)
+    assert m.v.kind is Kind.b
+    assert isinstance(Model(v={'kind': Kind.a, 'x': 1}).v, A)
+    assert isinstance(Model.from_trusted({'v': {'kind': 2, 'y': 1}}).v, B)
+
+    with pytest.raises(ValidationError) as exc_info:
+        Model(v={'kind': 2, 'x': 1})
+    assert exc_info.value.errors() == [{'loc': ('v', 'y'), 'msg': 'field required', 'type': 'value_error.missing'}]
+
+
+def test_discriminated_union_int_tag():
+    class A(BaseModel):
+        kind: int = Schema(1, const=True)
+        x: int
+
+    class B(BaseModel):
+        kind: int = Schema(2, const=True)
+        y: int
+
+    class Model(BaseModel):
+        v: Union[A, B]
+
+        class Config:
+            union_discriminator = 'kind'
+
+    m = Model(v={'kind': '2', 'y': 1})
+    assert isinstance(m.v, B)
+    assert m.v.kind == 2
+
+    with pytest.raises(ValidationError) as exc_info:
+        Model(v={'kind': '2', 'x': 1})
+    assert exc_info.value.errors() == [{'loc': ('v', 'y'), 'msg': 'field required', 'type': 'value_error.missing'}]
+
+
 def test_typed_list():
     class Model(BaseModel):
         v: List[int] = ...
@@ -621,6 +819,22 @@ def test_return_errors_error():
     assert e.errors() == [{'loc': ('foo',), 'msg': 'field required', 'type': 'value_error.missing'}]
 
 
+def test_validate_model_cls():
+    calls = []
+
+    class Model(BaseModel):
+        foo: int
+
+        @validator('foo')
+        def check_foo(cls, v):
+            calls.append(cls)
+            return v
+
+    validate_model(Model, {'foo': 1})
+    validate_model(Model(foo=1), {'foo': 1})
+    assert calls == [Model, Model, Model]
+
+
 def test_optional_required():
     class Model(BaseModel):
         bar: Optional[int]
@@ -867,3 +1081,36 @@ def test_submodel_different_type():
     assert Spam(c=Foo(a='123')).dict() == {'c': {'a': 123}}
     with pytest.raises(ValidationError):
         Spam(c=Bar(b='123'))
+
+
+def test_exact_type():
+    class Colour(Enum):
+        red = 'red'
+
+    class Sub(BaseModel):
+        a: int
+
+    class Model(BaseModel):
+        a: str
+        b: List[int]
+        c: constr(max_length=5)
+        d: Colour
+        e: Sub
+        f: float
+
+        @validator('f')
+        def check_f(cls, v):
+            return v * 2
+
+    assert [Model.__fields__[n].exact_type for n in 'abcdef'] == [str, int, None, Colour, Sub, None]
+
+    class EnumValuesModel(Model):
+        class Config:
+            use_enum_values = True
+
+    assert EnumValuesModel.__fields__['d'].exact_type is None
+
+    sub = Sub(a=1)
+    m = Model(a='x', b=[1, 2], c='y', d=Colour.red, e=sub, f=1.5)
+    assert m.dict() == {'a': 'x', 'b': [1, 2], 'c': 'y', 'd': Colour.red, 'e': {'a': 1}, 'f': 3.0}
+    assert m.e is sub
@@ -1,17 +1,26 @@
 import datetime
+import io
 import json
+import math
 from decimal import Decimal
 from enum import Enum
 from ipaddress import IPv4Address, IPv4Interface, IPv4Network, IPv6Address, IPv6Interface, IPv6Network
-from pathlib import Path
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, List, Set, Tuple
 from uuid import UUID
 
 import pytest
 
-from pydantic import BaseModel, create_model
-from pydantic.json import pydantic_encoder, timedelta_isoformat
+from pydantic import BaseModel, BaseSettings, Extra, Json, ValidationError, condecimal, create_model, json_backend
+from pydantic.json import ENCODERS_BY_TYPE, custom_pydantic_encoder, make_encoder, pydantic_encoder, timedelta_isoformat
+from pydantic.json_backend import JSONBackend, get_json_backend, register_json_backend, set_json_backend
 from pydantic.types import DirectoryPath, FilePath, SecretBytes, SecretStr
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class MyEnum(Enum):
     foo = 'bar'
@@ -132,3 +141,336 @@ def test_custom_encoder_arg():
     m = Model(x=123)
     assert m.json() == '{"x": 123.0}'
     assert m.json(encoder=lambda v: '__default__') == '{"x": "__default__"}'
+
+
+class MyDatetime(datetime.datetime):
+    pass
+
+
+class MyDecimal(Decimal):
+    pass
+
+
+@pytest.mark.parametrize(
+    'input,output',
+    [
+        (MyDatetime(2032, 1, 1, 1, 1), '"2032-01-01T01:01:00"'),
+        (MyDecimal('1.5'), '1.5'),
+        (condecimal(gt=0)('1.5'), '1.5'),
+        (PurePosixPath('/a/b'), '"/a/b"'),
+    ],
+)
+def test_encoding_subclasses(input, output):
+    assert json.dumps(input, default=pydantic_encoder) == output
+
+
+def test_custom_encoder_subclasses():
+    class Model(BaseModel):
+        when: datetime.datetime
+        day: datetime.date
+        price: Decimal
+
+        class Config:
+            json_encoders = {datetime.date: lambda v: 'a date', Decimal: str}
+
+    m = Model(when=MyDatetime(2032, 1, 1), day='2032-01-01', price=MyDecimal('1.5'))
+    # json_encoders are checked for every class in the MRO before pydantic's encoders
+    assert m.json() == '{"when": "a date", "day": "a date", "price": "1.5"}'
+    assert custom_pydantic_encoder({datetime.date: lambda v: 'a date'}, MyDatetime(2032, 1, 1)) == 'a date'
+    assert custom_pydantic_encoder({}, MyDatetime(2032, 1, 1)) == '2032-01-01T00:00:00'
+
+
+def test_make_encoder_cached(monkeypatch):
+    class Foo:
+        pass
+
+    class Bar(Foo):
+        pass
+
+    encoder = make_encoder()
+    with pytest.raises(TypeError, match="Object of type 'Foo' is not JSON serializable"):
+        encoder(Foo())
+    monkeypatch.setitem(ENCODERS_BY_TYPE, Foo, lambda v: 'foo')
+    # the encoder for each type is only looked up once
+    with pytest.raises(TypeError):
+        encoder(Foo())
+    assert encoder(Bar()) == 'foo'
+    assert json.dumps([Foo(), Bar()], default=make_encoder()) == '["foo", "foo"]'
+
+
+def test_json_stream():
+    class Item(BaseModel):
+        name: str
+        price: Decimal = Decimal('1.5')
+        when: datetime.date = None
+
+        class Config:
+            fields = {'name': 'Name'}
+            json_encoders = {Decimal: str}
+
+    class Basket(BaseModel):
+        id: int
+        items: List[Item] = []
+        by_code: Dict[int, Item] = {}
+        pair: Tuple[Item, int] = None
+        note: str = None
+
+    items = [{'Name': f'item {i}', 'when': '2032-06-01'} for i in range(50)]
+    m = Basket(id=1, items=items, by_code={1: items[0], 2: {'Name': 'b', 'price': 3}}, pair=(items[1], 2))
+
+    for kwargs in (
+        {},
+        {'by_alias': True},
+        {'skip_defaults': True},
+        {'exclude': {'items': {'__all__': {'price'}, 3: ...}, 'by_code': {1}}},
+        {'include': {'id': ..., 'pair': {0: {'name'}}}},
+        {'encoder': lambda v: 'x'},
+    ):
+        assert ''.join(m.json_stream(chunk_size=1, **kwargs)) == m.json(**kwargs)
+        assert ''.join(m.json_stream(**kwargs)) == m.json(**kwargs)
+
+    chunks = list(m.json_stream(chunk_size=100))
+    assert len(chunks) > 1
+    assert all(len(c) >= 100 for c in chunks[:-1])
+    assert len(list(m.json_stream())) == 1
+
+    f = io.StringIO()
+    assert m.json_stream(f) is None
+    assert json.loads(f.getvalue()) == json.loads(m.json())
+
+
+def test_json_writer():
+    class Colour(str, Enum):
+        red = 'red'
+
+    class Item(BaseModel):
+        name: str
+        price: Decimal = Decimal('1.5')
+        when: datetime.datetime = None
+
+        class Config:
+            fields = {'name': 'Name'}
+            extra = Extra.allow
+
+    class Order(BaseModel):
+        id: UUID
+        weight: float = float('nan')
+        paid: bool = False
+        colour: Colour = Colour.red
+        items: List[Item] = []
+        by_code: Dict[int, Item] = {}
+        pair: Tuple[Item, int] = None
+        tags: Set[str] = set()
+        other: Any = None
+
+        class Config:
+            json_encoders = {datetime.datetime: lambda v: v.timestamp()}
+
+    m = Order(
+        id=UUID(int=1),
+        items=[{'Name': 'café "a"', 'when': datetime.datetime(2032, 6, 1)}, {'Name': 'b', 'note': {1.5: [None]}}],
+        by_code={1: {'Name': 'c', 'price': 2}},
+        pair=({'Name': 'd'}, 2),
+        tags={'x'},
+        other=[Item(Name='e'), frozenset({1}), {True: datetime.date(2032, 1, 1)}],
+    )
+    for kwargs in ({}, {'by_alias': True}, {'skip_defaults': True}, {'encoder': repr}):
+        dict_kwargs = {k: v for k, v in kwargs.items() if k != 'encoder'}
+        expected = json.dumps(m.dict(**dict_kwargs), default=kwargs.get('encoder', m._json_encoder))
+        assert m.json(**kwargs) == expected
+        assert m.json_bytes(**kwargs) == expected.encode()
+
+    m.other = {(1, 2): 3}
+    with pytest.raises(TypeError, match='keys must be str, int, float, bool or None, not tuple'):
+        m.json()
+
+
+def test_json_dict_overridden():
+    class Sub(BaseModel):
+        a: int
+
+        def dict(self, **kwargs):
+            return {**super().dict(**kwargs), 'computed': self.a * 2}
+
+    class Model(BaseModel):
+        x: int
+        sub: Sub
+        subs: List[Sub] = []
+
+        def dict(self, **kwargs):
+            return {**super().dict(**kwargs), 'extra': 'e'}
+
+    class Plain(BaseModel):
+        sub: Sub
+
+    m = Model(x=1, sub={'a': 2})
+    assert m.json() == '{"x": 1, "sub": {"a": 2, "computed": 4}, "subs": [], "extra": "e"}'
+    assert m.json_bytes() == m.json().encode()
+    p = Plain(sub={'a': 2})
+    assert p.json() == '{"sub": {"a": 2, "computed": 4}}'
+    assert p.json(skip_defaults=True) == json.dumps(p.dict(skip_defaults=True))
+
+    m.subs = [Sub(a=3)]
+    for v in (m, p):
+        for kwargs in ({}, {'exclude': {'x'}}, {'skip_defaults': True}):
+            assert ''.join(v.json_stream(chunk_size=1, **kwargs)) == v.json(**kwargs)
+            assert ''.join(v.json_stream(**kwargs)) == v.json(**kwargs)
+
+
+@pytest.fixture
+def reset_json_backend():
+    yield
+    set_json_backend(None)
+
+
+class BackendModel(BaseModel):
+    id: int
+    when: datetime.datetime
+    uid: UUID
+    price: Decimal
+    tags: Dict[int, List[str]] = {}
+
+
+backend_data = dict(id=1, when='2032-06-01T12:13:14', uid=UUID(int=5), price='1.5', tags={1: ['a/b']})
+
+
+def test_default_backend(reset_json_backend):
+    fastest = 'json'
+    for name in ('orjson', 'rapidjson', 'ujson'):
+        try:
+            get_json_backend(name)
+        except ImportError:
+            continue
+        fastest = name
+        break
+
+    set_json_backend('json')
+    set_json_backend(None)
+    # parsing uses the fastest library installed, serialising the standard library
+    assert json_backend._parser.name == fastest
+    assert json_backend._serialiser.name == 'json'
+    m = BackendModel(**backend_data)
+    assert m.json().startswith('{"id": 1, "when": "2032-06-01T12:13:14", ')
+    assert BackendModel.parse_raw(m.json()) == m
+
+
+@pytest.mark.skipif(not orjson, reason='orjson not installed')
+def test_orjson_backend(reset_json_backend):
+    m = BackendModel(**backend_data)
+    assert m.json() == (
+        '{"id": 1, "when": "2032-06-01T12:13:14", "uid": "00000000-0000-0000-0000-000000000005", '
+        '"price": 1.5, "tags": {"1": ["a/b"]}}'
+    )
+    set_json_backend('orjson')
+    compact = (
+        '{"id":1,"when":"2032-06-01T12:13:14","uid":"00000000-0000-0000-0000-000000000005",'
+        '"price":1.5,"tags":{"1":["a/b"]}}'
+    )
+    assert m.json() == compact
+    assert m.json_bytes() == compact.encode()
+    assert ''.join(m.json_stream(chunk_size=1)) == compact
+    assert m.json(indent=2, sort_keys=True).startswith('{\n  "id": 1,\n  "price": 1.5,')
+    with pytest.raises(ValueError, match='orjson only supports indent=2'):
+        m.json(indent=4)
+    assert BackendModel.parse_raw(compact.encode()) == m
+    assert BackendModel.schema_json().startswith('{"title":"BackendModel",')
+
+    class CustomModel(BackendModel):
+        class Config:
+            json_encoders = {datetime.datetime: lambda v: 'dt'}
+
+    # orjson serialises datetimes itself so the standard library is used to honour json_encoders
+    assert CustomModel(**backend_data).json().startswith('{"id": 1, "when": "dt", ')
+    assert m.json(encoder=lambda v: 'x') == '{"id": 1, "when": "x", "uid": "x", "price": "x", "tags": {"1": ["a/b"]}}'
+
+
+@pytest.mark.parametrize('backend', [None, 'json', 'orjson', 'rapidjson', 'ujson'])
+def test_backend_parses_like_stdlib(backend, reset_json_backend):
+    try:
+        set_json_backend(backend)
+    except ImportError:
+        pytest.skip(f'{backend} not installed')
+
+    class Model(BaseModel):
+        x: float = None
+        y: int = None
+        z: List[int] = []
+
+    big = 123456789012345678901234567890
+    for raw in (f'{{"y": {big}}}', f'{{"y": -{big}}}', f'{{"z": [18446744073709551616, {big}]}}'):
+        for data in (raw, raw.encode()):
+            assert Model.parse_raw(data).dict(skip_defaults=True) == json.loads(raw)
+    assert Model.parse_raw('{"y": 18446744073709551615}').y == 18446744073709551615
+    assert math.isnan(Model.parse_raw('{"x": NaN}').x)
+    assert Model.parse_raw(b'{"x": Infinity}').x == float('inf')
+    assert Model.parse_raw('{"x": -Infinity}').x == float('-inf')
+    assert Model.parse_raw('{"x": 1e400}').x == float('inf')
+    with pytest.raises(ValidationError):
+        Model.parse_raw('{"x": ')
+
+
+def test_custom_backend(reset_json_backend):
+    calls = []
+
+    def loads(s):
+        calls.append(s)
+        return json.loads(s)
+
+    backend = JSONBackend(
+        'custom', loads=loads, dumps=lambda obj, **kwargs: json.dumps(obj, separators=(',', ':'), **kwargs)
+    )
+    register_json_backend(backend)
+    assert get_json_backend('custom') is backend
+    set_json_backend('custom')
+
+    class Model(BaseModel):
+        a: Dict[int, List[Decimal]]
+        b: Json = None
+
+    m = Model.parse_raw(b'{"a": {"1": [1.5]}, "b": "[2]"}')
+    assert calls == [b'{"a": {"1": [1.5]}, "b": "[2]"}', '[2]']
+    assert m.json() == '{"a":{"1":[1.5]},"b":[2]}'
+    assert m.json_bytes() == b'{"a":{"1":[1.5]},"b":[2]}'
+    assert ''.join(m.json_stream(chunk_size=1)) == m.json()
+
+    Model.parse_raw('{"a": {}}'.encode('utf-16'), encoding='utf-16')
+    assert calls[-1] == '{"a": {}}'
+
+    with pytest.raises(ValueError, match="unknown JSON backend 'missing'"):
+        set_json_backend('missing')
+
+
+def test_config_json_hooks(env):
+    def loads(s):
+        return {'a': [9]} if s == 'magic' else json.loads(s)
+
+    def dumps(obj, **kwargs):
+        return json.dumps(obj, separators=(',', '='), **kwargs)
+
+    class Model(BaseModel):
+        a: List[int]
+        b: Json = None
+
+        class Config:
+            json_loads = loads
+            json_dumps = dumps
+
+    m = Model.parse_raw('magic')
+    assert m.a == [9]
+    assert Model(a=[], b='magic').b == {'a': [9]}
+    assert m.json() == '{"a"=[9],"b"=null}'
+    assert m.json_bytes() == b'{"a"=[9],"b"=null}'
+    assert ''.join(m.json_stream(chunk_size=1)) == m.json()
+    assert Model.schema_json(sort_keys=True).startswith('{"properties"={')
+
+    def env_loads(s):
+        return [int(c) for c in s.split(',')]
+
+    class Settings(BaseSettings):
+        a: List[int]
+
+        class Config:
+            json_loads = env_loads
+
+    env.set('APP_A', '1,2')
+    assert Settings().a == [1, 2]
@@ -1,9 +1,12 @@
+from copy import copy, deepcopy
 from enum import Enum
-from typing import Any, ClassVar, List
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
 
 import pytest
 
-from pydantic import BaseModel, Extra, NoneBytes, NoneStr, Required, Schema, ValidationError, constr
+from pydantic import BaseModel, Extra, Json, NoneBytes, NoneStr, Required, Schema, ValidationError, constr, validator
+from pydantic.main import LazyValue, validate_model
+from pydantic.utils import normalize_items
 
 
 def test_success():
@@ -484,6 +487,51 @@ def test_default_copy():
     assert u1.friends is not u2.friends
 
 
+def test_default_copy_only_when_mutable():
+    tag = ('a', 'b')
+
+    class Model(BaseModel):
+        a: str = 'foo'
+        b: tuple = tag
+        c: List[int] = [1, 2]
+        d: List[List[int]] = [[1]]
+        e: Dict[str, List[int]] = {'x': [1]}
+
+    m1, m2 = Model(), Model()
+    assert m1.a is m2.a
+    assert m1.b is tag
+    assert m1.c == m2.c == [1, 2] and m1.c is not m2.c
+    assert m1.d[0] is not m2.d[0]
+    assert m1.e['x'] is not m2.e['x']
+    assert Model.__fields__['a'].default_copier is None
+    assert Model.__fields__['c'].default_copier is copy
+    assert Model.__fields__['d'].default_copier is deepcopy
+
+
+def test_default_factory():
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return [len(calls)]
+
+    class Model(BaseModel):
+        a: List[int] = Schema(default_factory=factory)
+        b: Dict[str, int] = Schema(default_factory=dict)
+
+    assert Model().dict() == {'a': [1], 'b': {}}
+    assert Model(a=[5]).a == [5]
+    assert Model().a == [2]
+    assert Model.from_trusted({}).a == [3]
+    assert Model().b is not Model().b
+    with pytest.raises(ValidationError) as exc_info:
+        Model(a=None)
+    assert exc_info.value.errors() == [{'loc': ('a',), 'msg': 'value is not a valid list', 'type': 'type_error.list'}]
+
+    with pytest.raises(ValueError, match='cannot specify both default and default_factory'):
+        Schema([], default_factory=list)
+
+
 class ArbitraryType:
     pass
 
@@ -621,3 +669,313 @@ def test_dict_with_extra_keys():
     m = MyModel(extra_key='extra')
     assert m.dict() == {'a': None, 'extra_key': 'extra'}
     assert m.dict(by_alias=True) == {'alias_a': None, 'extra_key': 'extra'}
+
+
+def test_dict_compiled_serializer():
+    class Sub(BaseModel):
+        x: int
+
+    class Model(BaseModel):
+        a: int
+        b: str = Schema('x', alias='B')
+        c: List[Sub] = []
+        d: Any = None
+        e: int = 0
+
+        @validator('e')
+        def wrap_e(cls, v):
+            return [Sub(x=v)]
+
+    m = Model(a=1, c=[{'x': 2}], d={'s': Sub(x=3)}, e=4)
+    d = m.dict()
+    assert d == {'a': 1, 'b': 'x', 'c': [{'x': 2}], 'd': {'s': {'x': 3}}, 'e': [{'x': 4}]}
+    assert d['c'] is not m.c
+    assert m.dict(by_alias=True, include={'a', 'b'}) == {'a': 1, 'B': 'x'}
+    assert m.dict(exclude={'c', 'd', 'e'}, by_alias=True) == {'a': 1, 'B': 'x'}
+    assert m.dict(skip_defaults=True, exclude={'e'}) == {'a': 1, 'c': [{'x': 2}], 'd': {'s': {'x': 3}}}
+    assert dict(m)['c'] == [{'x': 2}]
+
+
+def test_nested_include_exclude():
+    class Skill(BaseModel):
+        name: str
+        description: str = ''
+
+    class User(BaseModel):
+        id: int
+        skills: List[Skill] = []
+        by_name: Dict[str, Skill] = {}
+        best: Skill = None
+
+    skills = [{'name': 'a', 'description': 'x'}, {'name': 'b', 'description': 'y'}]
+    m = User(id=1, skills=skills, by_name={'a': skills[0]}, best=skills[1])
+
+    assert m.dict(exclude={'skills': {'__all__': {'description'}}, 'by_name': ..., 'best': {'name'}}) == {
+        'id': 1,
+        'skills': [{'name': 'a'}, {'name': 'b'}],
+        'best': {'description': 'y'},
+    }
+    assert m.dict(include={'id': True, 'skills': {1: ...}, 'by_name': {'a': {'name'}}}) == {
+        'id': 1,
+        'skills': [{'name': 'b', 'description': 'y'}],
+        'by_name': {'a': {'name': 'a'}},
+    }
+    assert m.dict(include={'skills': {'__all__': {'name'}, 0: ...}}) == {
+        'skills': [{'name': 'a', 'description': 'x'}, {'name': 'b'}]
+    }
+    assert m.json(exclude={'skills': {0}, 'by_name': ..., 'best': ...}) == (
+        '{"id": 1, "skills": [{"name": "b", "description": "y"}]}'
+    )
+
+    m2 = m.copy(exclude={'skills': {'__all__': {'description'}}})
+    assert m2.skills[0].dict() == {'name': 'a'}
+    assert m2.by_name['a'] is m.by_name['a']
+    assert m.skills[0].description == 'x'
+
+    with pytest.raises(TypeError, match="unexpected value 1 for 'skills' in include or exclude"):
+        m.dict(include={'skills': 1})
+
+
+def test_empty_include():
+    class Model(BaseModel):
+        a: int
+        skills: List[int]
+        by_name: Dict[str, int] = {}
+
+    m = Model(a=1, skills=[1, 2, 3], by_name={'x': 1, 'y': 2})
+    # an empty include chooses everything, as if it wasn't given
+    for include in (set(), {}, {'skills': set(), 'by_name': {}, 'a': ...}):
+        kwargs = dict(include=include, exclude={'skills': {0}, 'by_name': {'x'}})
+        assert m.dict(**kwargs) == {'a': 1, 'skills': [2, 3], 'by_name': {'y': 2}}
+        assert m.json(**kwargs) == '{"a": 1, "skills": [2, 3], "by_name": {"y": 2}}'
+        assert ''.join(m.json_stream(chunk_size=1, **kwargs)) == m.json(**kwargs)
+        m2 = m.copy(**kwargs)
+        assert m2.skills == [2, 3]
+        assert m2.by_name == {'y': 2}
+
+
+def test_normalize_items_cached():
+    spec = {'a': {'__all__': {'b'}}}
+    normalized = normalize_items(spec)
+    assert normalized == {'a': {'__all__': {'b': ...}}}
+    assert normalize_items(spec) is normalized
+    assert normalize_items(normalized) is normalized
+
+    spec['a']['__all__'].add('c')
+    assert normalize_items(spec) == {'a': {'__all__': {'b': ..., 'c': ...}}}
+
+
+def test_validator_per_model():
+    class Parent(BaseModel):
+        a: int
+        b: str = Schema('x', alias='B')
+
+    class Child(Parent):
+        class Config:
+            extra = Extra.forbid
+            allow_population_by_alias = True
+
+    assert Parent(a='1', b='y', c=3).dict() == {'a': 1, 'b': 'x'}
+    assert Child(a='1', b='y').dict() == {'a': 1, 'b': 'y'}
+    with pytest.raises(ValidationError) as exc_info:
+        Child(a='1', c=3)
+    assert exc_info.value.errors() == [
+        {'loc': ('c',), 'msg': 'extra fields not permitted', 'type': 'value_error.extra'}
+    ]
+    assert Parent.__validate_values__ is not Child.__validate_values__
+
+
+def test_inherited_fields_prepared_again():
+    class Parent(BaseModel):
+        a: Dict[int, List[int]] = {}
+        b: Json[List[int]] = None
+        c: Optional[Tuple[int, ...]] = None
+
+    class Child(Parent):
+        class Config:
+            anystr_strip_whitespace = True
+
+    data = {'a': {'1': ['2']}, 'b': '[3]', 'c': ['4']}
+    assert Child(**data).dict() == Parent(**data).dict() == {'a': {1: [2]}, 'b': [3], 'c': (4,)}
+    assert Child.__fields__['a'].outer_type_ == Dict[int, List[int]]
+
+
+def test_fail_fast():
+    class Model(BaseModel):
+        a: int
+        b: List[int]
+        c: Dict[str, int]
+
+        class Config:
+            fail_fast = True
+
+    with pytest.raises(ValidationError) as exc_info:
+        Model(a='x', b=['y', 'z'])
+    assert exc_info.value.errors() == [
+        {'loc': ('a',), 'msg': 'value is not a valid integer', 'type': 'type_error.integer'}
+    ]
+
+    with pytest.raises(ValidationError) as exc_info:
+        Model(a=1, b=[1, 'y', 'z'], c={'x': 'y'})
+    assert [e['loc'] for e in exc_info.value.errors()] == [('b', 1)]
+
+    with pytest.raises(ValidationError) as exc_info:
+        Model(a=1, b=[1], c={'x': 'y', 'z': 'z'})
+    assert [e['loc'] for e in exc_info.value.errors()] == [('c', 'x')]
+
+    with pytest.raises(ValidationError) as exc_info:
+        Model(a=1, b=[1])
+    assert [e['loc'] for e in exc_info.value.errors()] == [('c',)]
+
+
+def test_lazy_submodels():
+    class SubModel(BaseModel):
+        x: int
+        y: int = 1
+
+    class Model(BaseModel):
+        a: int
+        b: List[SubModel] = []
+        c: SubModel = Schema(None, lazy=False)
+        d: Dict[str, int] = Schema({}, lazy=True)
+
+        class Config:
+            lazy_submodels = True
+
+    m = Model(a='1', b=[{'x': '1'}, {'x': 'x'}], c={'x': 2}, d={'z': 'z'})
+    assert m.__values__['a'] == 1
+    assert m.__values__['b'].raw == [{'x': '1'}, {'x': 'x'}]
+    assert m.__values__['c'] == SubModel(x=2)
+    assert str(m) == "Model a=1 b=LazyValue([{'x': '1'}, {'x': 'x'}]) c=<SubModel x=2 y=1> d=LazyValue({'z': 'z'})"
+
+    with pytest.raises(ValidationError) as exc_info:
+        m.b
+    assert exc_info.value.errors() == [
+        {'loc': ('b', 1, 'x'), 'msg': 'value is not a valid integer', 'type': 'type_error.integer'}
+    ]
+    with pytest.raises(ValidationError):
+        m.dict()
+
+    m = Model(a=1, b=[{'x': '1'}])
+    m2 = m.copy(deep=True)
+    assert m.b == [SubModel(x=1, y=1)]
+    assert m.__values__['b'] == [SubModel(x=1, y=1)]
+    assert m2.__values__['b'].raw == [{'x': '1'}]
+    assert m2.dict() == {'a': 1, 'b': [{'x': 1, 'y': 1}], 'c': None, 'd': {}}
+    assert m2.json() == '{"a": 1, "b": [{"x": 1, "y": 1}], "c": null, "d": {}}'
+
+
+def test_lazy_submodels_values_used_by_validator():
+    class SubModel(BaseModel):
+        x: int
+
+    class Model(BaseModel):
+        a: SubModel
+        b: int
+        c: SubModel = None
+
+        @validator('b')
+        def check_b(cls, v, values):
+            assert isinstance(values['a'], SubModel)
+            return v + values['a'].x
+
+        class Config:
+            lazy_submodels = True
+
+    m = Model(a={'x': 1}, b=2, c={'x': 3})
+    assert m.b == 3
+    assert m.__values__['a'] == SubModel(x=1)
+    # no validator after c uses values
+    assert m.__values__['c'].raw == {'x': 3}
+
+
+def test_lazy_submodels_validated_eagerly():
+    class SubModel(BaseModel):
+        a: int
+
+    class LazyConfig:
+        lazy_submodels = True
+
+    class Model(BaseModel):
+        s: List[SubModel]
+
+        Config = LazyConfig
+
+    assert validate_model(Model, {'s': [{'a': '1'}]}) == {'s': [SubModel(a=1)]}
+    with pytest.raises(ValidationError) as exc_info:
+        validate_model(Model, {'s': [{'a': 'x'}]})
+    assert exc_info.value.errors()[0]['loc'] == ('s', 0, 'a')
+
+    # model instances still defer
+    assert isinstance(Model(s=[{'a': 'x'}]).__values__['s'], LazyValue)
+
+
+def test_from_trusted():
+    class SubModel(BaseModel):
+        x: int
+        y: int = 1
+
+    class Model(BaseModel):
+        a: int
+        b: List[SubModel] = []
+        c: Dict[str, SubModel] = {}
+        d: Optional[SubModel] = None
+        e: Union[int, SubModel] = 0
+        f: List[List[SubModel]] = []
+        g: str = Schema('g', alias='G')
+
+    m = Model.from_trusted(
+        {'a': 'not validated', 'b': [{'x': 1}], 'c': {'k': {'x': 2, 'y': 3}}, 'e': {'x': 4}, 'f': [[{'x': 5}]]}
+    )
+    assert m.a == 'not validated'
+    assert m.b == [SubModel(x=1)]
+    assert isinstance(m.b[0], SubModel)
+    assert m.b[0].__fields_set__ == {'x'}
+    assert isinstance(m.c['k'], SubModel) and m.c['k'].y == 3
+    assert m.d is None
+    assert isinstance(m.e, SubModel) and m.e.x == 4
+    assert isinstance(m.f[0][0], SubModel)
+    assert m.g == 'g'
+    assert m.__fields_set__ == {'a', 'b', 'c', 'e', 'f'}
+
+    m = Model(a=1, b=[{'x': 1}], G='h')
+    assert Model.from_trusted(m.dict()) == m
+    assert Model.from_trusted(m.dict(by_alias=True)) == m
+    assert Model.from_trusted(m.dict(skip_defaults=True)).__fields_set__ == m.__fields_set__
+
+
+def test_from_trusted_union_of_models():
+    class ModelA(BaseModel):
+        a: int
+
+    class ModelB(BaseModel):
+        b: int
+        c: str = 'c'
+
+    class Model(BaseModel):
+        x: List[Union[ModelA, ModelB]]
+        y: Union[ModelA, ModelB] = None
+
+    m = Model(x=[ModelA(a=1), ModelB(b=2)], y={'b': 3})
+    m2 = Model.from_trusted(m.dict())
+    assert m2 == m
+    assert [type(v) for v in m2.x] == [ModelA, ModelB]
+    assert type(m2.y) is ModelB
+    assert type(Model.from_trusted({'x': [{'b': 2, 'c': 'd'}]}).x[0]) is ModelB
+
+    # no member matches the keys, the value is validated
+    m3 = Model.from_trusted({'x': [{'a': '1', 'extra': 2}]})
+    assert type(m3.x[0]) is ModelA
+    assert m3.x[0].a == 1
+
+
+def test_from_trusted_extra():
+    class Model(BaseModel):
+        a: int
+
+        class Config:
+            extra = Extra.allow
+
+    m = Model.from_trusted({'a': 1, 'b': 2})
+    assert m.dict() == {'a': 1, 'b': 2}
+    assert m.__fields_set__ == {'a', 'b'}
@@ -1,5 +1,5 @@
 import pickle
-from typing import Union
+from typing import List, Union
 
 import pytest
 
@@ -114,3 +114,97 @@ def test_const_differentiates_union():
 
     m = Model.parse_obj({'a': {'key': 'B', 'foo': 3}})
     assert isinstance(m.a, SubModelB)
+
+
+def test_parse_fail_fast():
+    class SubModel(BaseModel):
+        x: int
+        y: int
+
+    class FailFastModel(BaseModel):
+        a: int
+        b: List[SubModel]
+
+    data = {'a': 'x', 'b': [{'x': 'x', 'y': 'y'}, {'x': 'x'}]}
+    with pytest.raises(ValidationError) as exc_info:
+        FailFastModel.parse_obj(data)
+    assert len(exc_info.value.errors()) == 5
+
+    with pytest.raises(ValidationError) as exc_info:
+        FailFastModel.parse_obj(data, fail_fast=True)
+    assert [e['loc'] for e in exc_info.value.errors()] == [('a',)]
+
+    with pytest.raises(ValidationError) as exc_info:
+        FailFastModel.parse_raw('{"a": 1, "b": [{"x": "x", "y": "y"}, {"x": "x"}]}', fail_fast=True)
+    assert [e['loc'] for e in exc_info.value.errors()] == [('b', 0, 'x')]
+
+    # the override only applies during the call
+    with pytest.raises(ValidationError) as exc_info:
+        FailFastModel(**data)
+    assert len(exc_info.value.errors()) == 5
+
+
+def test_parse_fail_fast_disabled():
+    class FailFastModel(BaseModel):
+        a: int
+        b: int
+
+        class Config:
+            fail_fast = True
+
+    with pytest.raises(ValidationError) as exc_info:
+        FailFastModel.parse_obj({'a': 'x', 'b': 'y'}, fail_fast=False)
+    assert [e['loc'] for e in exc_info.value.errors()] == [('a',), ('b',)]
+
+
+def test_parse_many():
+    rows = ({'a': i, 'b': 'x' if i % 3 == 0 else i} for i in range(6))
+    models, errors = Model.parse_many(rows)
+    assert [m.dict() for m in models] == [{'a': 1, 'b': 1}, {'a': 2, 'b': 2}, {'a': 4, 'b': 4}, {'a': 5, 'b': 5}]
+    assert [m.__fields_set__ for m in models] == [{'a', 'b'}] * 4
+    assert [(i, e.errors()[0]['loc']) for i, e in errors] == [(0, ('b',)), (3, ('b',))]
+
+
+def test_parse_many_not_dict():
+    models, errors = Model.parse_many([[('a', 1)], 123])
+    assert [m.dict() for m in models] == [{'a': 1, 'b': 10}]
+    assert [(i, e.errors()) for i, e in errors] == [
+        (1, [{'loc': ('__obj__',), 'msg': 'Model expected dict not int', 'type': 'type_error'}])
+    ]
+
+
+def test_parse_many_raise():
+    with pytest.raises(ValidationError) as exc_info:
+        Model.parse_many([{'a': 1}, {'a': 'x'}, {}], raise_on_error=True)
+    assert exc_info.value.errors() == [
+        {'loc': (1, 'a'), 'msg': 'value is not a valid float', 'type': 'type_error.float'}
+    ]
+
+
+def test_parse_many_custom_init():
+    class CustomInitModel(BaseModel):
+        a: int
+
+        def __init__(self, **data):
+            super().__init__(a=data['a'] * 2)
+
+    models, errors = CustomInitModel.parse_many([{'a': 1}, {'a': 'x'}])
+    assert [m.a for m in models] == [2]
+    assert [i for i, e in errors] == [1]
+
+
+def test_parse_many_custom_process_values():
+    class CustomModel(BaseModel):
+        a: int
+        b: int = 0
+
+        def _process_values(self, input_data):
+            values = super()._process_values(input_data)
+            values['b'] = values['a'] + 1
+            return values
+
+    models, errors = CustomModel.parse_many([{'a': 1}, {'a': 'x'}])
+    assert models == [CustomModel(a=1)]
+    assert models[0].b == 2
+    assert models[0].__fields_set__ == {'a'}
+    assert [i for i, e in errors] == [1]
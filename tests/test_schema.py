@@ -299,6 +299,33 @@ def test_const_false():
     }
 
 
+def test_discriminated_union():
+    class Cat(BaseModel):
+        pet_type: str = Schema('cat', const=True)
+
+    class Dog(BaseModel):
+        pet_type: str = Schema('dog', const=True)
+
+    class Model(BaseModel):
+        pet: Union[Cat, Dog]
+
+        class Config:
+            union_discriminator = 'pet_type'
+
+    s = Model.schema()
+    assert s['properties'] == {
+        'pet': {
+            'title': 'Pet',
+            'oneOf': [{'$ref': '#/definitions/Cat'}, {'$ref': '#/definitions/Dog'}],
+            'discriminator': {
+                'propertyName': 'pet_type',
+                'mapping': {'cat': '#/definitions/Cat', 'dog': '#/definitions/Dog'},
+            },
+        }
+    }
+    assert s['definitions'].keys() == {'Cat', 'Dog'}
+
+
 @pytest.mark.parametrize(
     'field_type,expected_schema',
     [
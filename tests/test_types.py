@@ -18,6 +18,8 @@ from pydantic import (
     UUID5,
     BaseModel,
     ConfigError,
+    ConstrainedDecimal,
+    ConstrainedStr,
     DirectoryPath,
     EmailStr,
     FilePath,
@@ -38,6 +40,8 @@ from pydantic import (
     conint,
     constr,
     create_model,
+    errors,
+    urlstr,
 )
 
 try:
@@ -381,6 +385,43 @@ def test_int_enum_successful_for_str_int():
     assert repr(m.tool) == '<ToolEnum.wrench: 2>'
 
 
+def test_enum_lookup():
+    class Shape(Enum):
+        square = (1, 2)
+        circle = [1]
+        triangle = 3
+        triangle_alias = 3
+
+        @classmethod
+        def _missing_(cls, value):
+            if value == 'round':
+                return cls.circle
+            return super()._missing_(value)
+
+    class Model(BaseModel):
+        shape: Shape
+        tool: ToolEnum = None
+
+    assert Model.__fields__['shape'].enum_lookup == {(1, 2): Shape.square, 3: Shape.triangle}
+    assert Model(shape=(1, 2)).shape is Shape.square
+    assert Model(shape=3.0).shape is Shape.triangle
+    assert Model(shape=[1]).shape is Shape.circle
+    assert Model(shape='round').shape is Shape.circle
+    assert Model(shape=3, tool=True).tool is ToolEnum.spanner
+    with pytest.raises(ValidationError) as exc_info:
+        Model(shape={})
+    assert exc_info.value.errors() == [
+        {'loc': ('shape',), 'msg': 'value is not a valid enumeration member', 'type': 'type_error.enum'}
+    ]
+
+    class ValuesModel(Model):
+        class Config:
+            use_enum_values = True
+
+    assert ValuesModel.__fields__['shape'].enum_lookup == {(1, 2): (1, 2), 3: 3}
+    assert ValuesModel(shape=3.0, tool='2').dict() == {'shape': 3, 'tool': 2}
+
+
 @pytest.mark.skipif(not email_validator, reason='email_validator not installed')
 def test_string_success():
     class MoreStringsModel(BaseModel):
@@ -913,6 +954,165 @@ def test_anystr_strip_whitespace_disabled():
     assert m.bytes_check == b'  456  '
 
 
+def test_intern_strings(monkeypatch):
+    class Model(BaseModel):
+        a: str
+        b: constr(intern=False)
+        c: List[constr(max_length=10)] = []
+        d: str = None
+
+        class Config:
+            intern_strings = True
+
+    # build strings at runtime so they're not already the same object
+    value = ''.join(['ab', 'c'])
+    m1, m2 = Model(a=value, b=value, c=[b'abc']), Model(a='abc', b='abc', c=['ab' + value[2:]])
+    assert m1.a == 'abc'
+    assert m1.a is m2.a
+    assert m1.b is not m2.b
+    assert m1.c[0] is m2.c[0] is m1.a
+    assert Model(a=value, b=value).d is None
+
+    # only exact str values are interned so a str subclass and an equal str never replace each other
+    class MyStr(str):
+        pass
+
+    value = ''.join(['de', 'f'])
+    assert type(Model(a=MyStr(value), b='').a) is MyStr
+    assert type(Model(a=value, b='').a) is str
+    assert type(Model(a=MyStr(value), b='').a) is MyStr
+
+    # when the table is full it's emptied
+    monkeypatch.setattr('pydantic.validators.INTERN_TABLE_SIZE', 1)
+    a1 = Model(a=''.join(['x', 'y']), b='').a
+    assert Model(a=''.join(['x', 'y']), b='').a is a1
+    Model(a='z', b='')
+    assert Model(a=''.join(['x', 'y']), b='').a is not a1
+
+
+def test_intern_strings_constr():
+    class Model(BaseModel):
+        a: constr(intern=True, curtail_length=2)
+        b: str
+
+    m1, m2 = Model(a=''.join(['ab', 'c']), b=''.join(['ab', 'c'])), Model(a='ab', b='abc')
+    assert m1.a is m2.a
+    assert m1.b is not m2.b
+    assert [v.__name__ for v in Model.__fields__['b'].validators] == ['not_none_validator', 'str_validator']
+
+
+def test_constrained_types_cached():
+    assert constr(max_length=5) is constr(max_length=5)
+    assert constr(regex='^a+$') is constr(regex='^a+$')
+    assert conint(gt=0, lt=10) is conint(gt=0, lt=10)
+    assert urlstr(schemes={'http', 'https'}) is urlstr(schemes={'https', 'http'})
+    assert constr(max_length=5) is not constr(max_length=6)
+    assert confloat(gt=1) is not confloat(gt=1.0)
+    assert condecimal(gt=Decimal('1')) is not condecimal(gt=Decimal('1.0'))
+    assert constr(regex='^a+$').regex.pattern == '^a+$'
+
+    class Model(BaseModel):
+        a: constr(max_length=2)
+        b: constr(max_length=2)
+
+    assert Model(a='ab', b='cd').dict() == {'a': 'ab', 'b': 'cd'}
+
+    class Sub(constr(max_length=5)):
+        min_length = 2
+
+    assert constr(max_length=5).min_length is None
+
+
+def test_constrained_types_unhashable():
+    class Unhashable(int):
+        __hash__ = None
+
+    type_ = conint(gt=Unhashable(1))
+    assert type_ is not conint(gt=Unhashable(1))
+
+    class Model(BaseModel):
+        v: type_
+
+    assert Model(v=2).v == 2
+    with pytest.raises(ValidationError):
+        Model(v=1)
+
+
+def test_constrained_validators_compiled():
+    class Model(BaseModel):
+        a: PositiveInt
+        b: conint(gt=0, lt=10, multiple_of=2)
+        c: confloat()
+        d: condecimal()
+        e: constr(strip_whitespace=True, max_length=3)
+        f: conbytes()
+
+    fields = Model.__fields__
+    assert [v.__name__ for v in fields['a'].validators] == ['int_validator', 'constraint_validator']
+    assert [v.__name__ for v in fields['c'].validators] == ['float_validator']
+    assert [v.__name__ for v in fields['d'].validators] == [
+        'not_none_validator',
+        'decimal_validator',
+        'decimal_finite_validator',
+    ]
+    assert [v.__name__ for v in fields['f'].validators] == ['not_none_validator', 'bytes_validator']
+
+    m = Model(a=1, b=4, c=-1, d='1.5', e=' abc ', f=b' x')
+    assert m.dict() == {'a': 1, 'b': 4, 'c': -1, 'd': Decimal('1.5'), 'e': 'abc', 'f': b' x'}
+
+    with pytest.raises(ValidationError) as exc_info:
+        Model(a=0, b=5, c=1, d='NaN', e='abcd', f=b'')
+    assert [(e['loc'], e['type']) for e in exc_info.value.errors()] == [
+        (('a',), 'value_error.number.not_gt'),
+        (('b',), 'value_error.number.not_multiple'),
+        (('d',), 'value_error.decimal.not_finite'),
+        (('e',), 'value_error.any_str.max_length'),
+    ]
+
+
+def test_constrained_validate():
+    assert constr(strip_whitespace=True, curtail_length=2).validate(' abc ') == 'ab'
+    assert constr().validate('abc') == 'abc'
+    with pytest.raises(errors.StrRegexError):
+        constr(regex='^a').validate('b')
+    assert condecimal(max_digits=3).validate(Decimal('1.5')) == Decimal('1.5')
+    with pytest.raises(errors.DecimalMaxDigitsError):
+        condecimal(max_digits=3).validate(Decimal('1.234'))
+    with pytest.raises(errors.DecimalIsNotFiniteError):
+        condecimal().validate(Decimal('NaN'))
+
+
+def test_constrained_validate_overridden():
+    class UpperStr(ConstrainedStr):
+        max_length = 3
+
+        @classmethod
+        def validate(cls, value):
+            return super().validate(value).upper()
+
+    class RoundedDecimal(ConstrainedDecimal):
+        max_digits = 2
+
+        @classmethod
+        def validate(cls, value):
+            return super().validate(round(value, 1))
+
+    class Model(BaseModel):
+        s: UpperStr
+        d: RoundedDecimal
+
+    m = Model(s='abc', d='1.23')
+    assert m.s == 'ABC'
+    assert m.d == Decimal('1.2')
+
+    with pytest.raises(ValidationError) as exc_info:
+        Model(s='abcd', d='12.3')
+    assert [(e['loc'], e['type']) for e in exc_info.value.errors()] == [
+        (('s',), 'value_error.any_str.max_length'),
+        (('d',), 'value_error.decimal.max_digits'),
+    ]
+
+
 @pytest.mark.parametrize(
     'type_,value,result',
     [
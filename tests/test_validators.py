@@ -1,10 +1,11 @@
 from datetime import datetime
+from pathlib import PurePosixPath
 from typing import Dict, List, Optional, Tuple
 
 import pytest
 
-from pydantic import BaseModel, ConfigError, ValidationError, errors, validator
-from pydantic.class_validators import make_generic_validator
+from pydantic import BaseModel, ConfigError, Schema, ValidationError, constr, errors, validator
+from pydantic.class_validators import make_generic_validator, make_validator_chain
 
 
 def test_simple():
@@ -637,3 +638,151 @@ def test_make_generic_validator_self():
     with pytest.raises(ConfigError) as exc_info:
         make_generic_validator(test_validator)
     assert ': (self, v), "self" not permitted as first argument, should be: (cls, value' in str(exc_info.value)
+
+
+def test_make_validator_chain():
+    calls = []
+
+    def first(v):
+        calls.append(('first', v))
+        return v + 1
+
+    def second(cls, v, values, config):
+        calls.append(('second', cls, v, values, config))
+        return v * 2
+
+    def third(v, **kwargs):
+        calls.append(('third', v, kwargs))
+        return v
+
+    chain = make_validator_chain([first, second, third])
+    assert chain('_cls_', 1, '_vs_', '_f_', '_c_') == 4
+    assert calls == [
+        ('first', 1),
+        ('second', '_cls_', 2, '_vs_', '_c_'),
+        ('third', 4, {'config': '_c_', 'field': '_f_', 'values': '_vs_'}),
+    ]
+    assert make_validator_chain([]) is None
+
+
+def test_noop_validators_omitted():
+    class Model(BaseModel):
+        a: str
+        b: constr(max_length=5)
+
+    assert [v.__name__ for v in Model.__fields__['a'].validators] == ['not_none_validator', 'str_validator']
+    assert [v.__name__ for v in Model.__fields__['b'].validators] == [
+        'not_none_validator',
+        'str_validator',
+        'length_validator',
+    ]
+
+    class ChildModel(Model):
+        class Config:
+            anystr_strip_whitespace = True
+            max_anystr_length = 3
+
+    assert ChildModel(a=' x ', b=' y ').dict() == {'a': 'x', 'b': ' y '}
+    with pytest.raises(ValidationError):
+        ChildModel(a='abcd', b='y')
+    assert Model(a=' x ', b=' y ').dict() == {'a': ' x ', 'b': ' y '}
+
+
+def test_validator_cache():
+    calls = []
+
+    class Model(BaseModel):
+        a: int
+        b: List[constr(max_length=3)] = []
+        c: str = Schema('', validator_cache_size=0)
+        d: int = 0
+
+        @validator('a')
+        def check_a(cls, v):
+            calls.append(v)
+            return v
+
+        @validator('d')
+        def check_d(cls, v, values):
+            return v + values.get('a', 0)
+
+        class Config:
+            validator_cache_size = 2
+
+    assert Model(a='1', b=['x', 'x'], d=1).dict() == {'a': 1, 'b': ['x', 'x'], 'c': '', 'd': 2}
+    assert Model(a='1', d=2).dict() == {'a': 1, 'b': [], 'c': '', 'd': 3}
+    assert calls == [1]
+    fields = Model.__fields__
+    assert fields['a'].validator_cache.cache_info() == (1, 1, 2, 1)
+    assert fields['b'].validator_cache.cache_info() == (1, 1, 2, 1)
+    assert fields['c'].validator_cache is None
+    assert fields['d'].validator_cache is None
+
+    # failures are cached, errors get the right location
+    for _ in range(2):
+        with pytest.raises(ValidationError) as exc_info:
+            Model(a=1, b=['abcd', 'x', 'abcd'])
+        assert [e['loc'] for e in exc_info.value.errors()] == [('b', 0), ('b', 2)]
+    assert fields['b'].validator_cache.cache_info() == (6, 2, 2, 2)
+
+    # int, str and bool values are cached separately
+    assert calls == [1, 1]
+    assert Model(a=True).a == 1
+    assert calls == [1, 1, 1]
+
+
+def test_validator_cache_unhashable():
+    class Chars:
+        @classmethod
+        def __get_validators__(cls):
+            yield list
+
+    class Model(BaseModel):
+        a: Chars
+
+        class Config:
+            validator_cache_size = 10
+
+    m1, m2 = Model(a='ab'), Model(a='ab')
+    assert m1.a == ['a', 'b']
+    assert m1.a is not m2.a
+    assert Model.__fields__['a'].validator_cache.cache_info().currsize == 0
+
+
+def test_validator_cache_mutable_hashable():
+    class Counter:
+        def __init__(self, v):
+            self.count = int(v)
+
+        @classmethod
+        def __get_validators__(cls):
+            yield cls
+
+    class Model(BaseModel):
+        a: Counter
+
+        class Config:
+            validator_cache_size = 10
+
+    m1, m2 = Model(a='1'), Model(a='1')
+    m1.a.count += 1
+    assert m2.a.count == 1
+    assert Model.__fields__['a'].validator_cache.cache_info().currsize == 0
+
+
+def test_validator_cache_immutable():
+    class Pair:
+        @classmethod
+        def __get_validators__(cls):
+            yield lambda v: (PurePosixPath(v), v)
+
+    class Model(BaseModel):
+        a: Pair = (PurePosixPath('x'), 'x')
+
+        class Config:
+            validator_cache_size = 10
+
+    # tuples of immutable values are cached, as they're shared as defaults
+    assert Model(a='y').a is Model(a='y').a
+    assert Model.__fields__['a'].validator_cache.cache_info().currsize == 1
+    assert Model.__fields__['a'].default_copier is None